@@ -3,15 +3,57 @@ CrewAI Setup for Lead Sniper AI
 4-Agent Crew: Signal Scout, Researcher, Pitch Architect, Auditor
 """
 
+import asyncio
+import json
 import os
-from typing import List, Dict, Any, Optional
-from crewai import Agent, Task, Crew, Process
+import queue
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from typing import Callable, Iterator, List, Dict, Any, Optional, Union
+from crewai import Agent, Task, Crew, Process, LLM, BaseLLM
+from crewai.tasks.task_output import TaskOutput
 from crewai.tools import BaseTool
-from langchain_openai import ChatOpenAI
 from dotenv import load_dotenv
 
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.lead_scoring import validate_lead
+from tools.lead_model import as_lead
+from agents.result_cache import LeadResultCache
+from agents.rate_limiter import backoff_delay, is_rate_limit_error, rate_limiter, retry_after_seconds
+from agents.result_parser import normalize_result
+from agents.usage_metrics import TaskUsageRecorder, meter_llm, summarize_usage, usage_tracker
+
 load_dotenv()
 
+# Model settings; part of the result cache key
+LLM_MODEL = os.getenv("LLM_MODEL", "gpt-4")
+LLM_TEMPERATURE = 0.7
+
+# Pipeline stages, one agent each, in TASK_NAMES order; each can run on its own model
+AGENT_STAGES = ["scout", "researcher", "pitch", "auditor"]
+
+# Named stage -> model routings (stages left out run on LLM_MODEL)
+ROUTING_PRESETS = {
+    "uniform": {},
+    "tiered": {"scout": "gpt-4o-mini", "researcher": "gpt-4o", "pitch": "gpt-4o", "auditor": "gpt-4o-mini"},
+    "mini": {stage: "gpt-4o-mini" for stage in AGENT_STAGES},
+}
+
+# Bump when agent or task prompts change so cached results are not reused
+PROMPT_VERSION = "1"
+
+# Checkpoint names of the crew's tasks, in execution order
+TASK_NAMES = ["scout_task", "research_task", "pitch_task", "audit_task"]
+
+_FENCED_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+
 
 class LeadValidationTool(BaseTool):
     """Tool for validating lead quality using Rilo/RelationalAI and pycalib"""
@@ -26,66 +68,8 @@ class LeadValidationTool(BaseTool):
             import kalibr
             import pycalib
             
-            # Basic validation logic with scoring
-            validation_score = 0
-            max_score = 0
-            issues = []
-            strengths = []
-            
-            # Check required fields (20 points)
-            max_score += 20
-            required_fields = ["source", "content"]
-            for field in required_fields:
-                if not lead_data.get(field):
-                    issues.append(f"Missing required field: {field}")
-                else:
-                    validation_score += 10
-                    strengths.append(f"Has {field}")
-            
-            # Check content quality - length and substance (30 points)
-            max_score += 30
-            content = lead_data.get("content", "") or lead_data.get("title", "") or lead_data.get("headline", "")
-            if len(content) < 50:
-                issues.append("Content too short (< 50 chars)")
-            elif len(content) < 100:
-                validation_score += 15
-                issues.append("Content could be more detailed")
-            else:
-                validation_score += 30
-                strengths.append("Content has sufficient detail")
-            
-            # Check for buying intent keywords (30 points)
-            max_score += 30
-            intent_keywords = [
-                "hiring", "looking", "need", "seeking", "want", "searching",
-                "looking for", "in search of", "require", "seeking to",
-                "interested in", "considering", "evaluating", "comparing"
-            ]
-            content_lower = content.lower()
-            found_keywords = [kw for kw in intent_keywords if kw in content_lower]
-            if found_keywords:
-                validation_score += 30
-                strengths.append(f"Buying intent detected: {', '.join(found_keywords[:3])}")
-            else:
-                issues.append("No clear buying intent keywords detected")
-            
-            # Check for contact/company information (20 points)
-            max_score += 20
-            has_contact = any([
-                lead_data.get("url"),
-                lead_data.get("email"),
-                lead_data.get("company"),
-                lead_data.get("author"),
-                lead_data.get("name")
-            ])
-            if has_contact:
-                validation_score += 20
-                strengths.append("Has contact/company information")
-            else:
-                issues.append("Missing contact or company information")
-            
-            # Calculate quality score (0-100)
-            quality_score = (validation_score / max_score) * 100 if max_score > 0 else 0
+            report = validate_lead(lead_data)
+            quality_score = report["quality_score"]
             
             # Use pycalib for calibration scoring (if available)
             try:
@@ -94,20 +78,8 @@ class LeadValidationTool(BaseTool):
             except:
                 calibrated_score = quality_score
             
-            return {
-                "quality_score": round(quality_score, 2),
-                "calibrated_score": round(calibrated_score, 2),
-                "is_valid": quality_score >= 60,
-                "issues": issues,
-                "strengths": strengths,
-                "found_keywords": found_keywords,
-                "validation_details": {
-                    "required_fields": validation_score >= 20,
-                    "content_quality": len(content) >= 100,
-                    "buying_intent": len(found_keywords) > 0,
-                    "has_contact": has_contact
-                }
-            }
+            report["calibrated_score"] = round(calibrated_score, 2)
+            return report
         except ImportError:
             # Fallback validation if packages not available
             return {
@@ -120,7 +92,7 @@ class LeadValidationTool(BaseTool):
             }
 
 
-def create_signal_scout_agent(llm: ChatOpenAI) -> Agent:
+def create_signal_scout_agent(llm: BaseLLM) -> Agent:
     """Signal Scout Agent - Intent Data Analyst"""
     return Agent(
         role="Intent Data Analyst",
@@ -141,7 +113,7 @@ def create_signal_scout_agent(llm: ChatOpenAI) -> Agent:
     )
 
 
-def create_researcher_agent(llm: ChatOpenAI) -> Agent:
+def create_researcher_agent(llm: BaseLLM) -> Agent:
     """Deep Researcher Agent - Business Intelligence Analyst"""
     return Agent(
         role="Business Intelligence Analyst",
@@ -163,7 +135,7 @@ def create_researcher_agent(llm: ChatOpenAI) -> Agent:
     )
 
 
-def create_pitch_architect_agent(llm: ChatOpenAI) -> Agent:
+def create_pitch_architect_agent(llm: BaseLLM) -> Agent:
     """Pitch Architect Agent - Strategic Growth Copywriter"""
     return Agent(
         role="Strategic Growth Copywriter",
@@ -187,7 +159,7 @@ def create_pitch_architect_agent(llm: ChatOpenAI) -> Agent:
     )
 
 
-def create_auditor_agent(llm: ChatOpenAI, validation_tool: LeadValidationTool) -> Agent:
+def create_auditor_agent(llm: BaseLLM, validation_tool: LeadValidationTool) -> Agent:
     """Monetization Auditor Agent - Quality Assurance & MCP Bridge"""
     return Agent(
         role="Quality Assurance & MCP Bridge",
@@ -212,22 +184,85 @@ def create_auditor_agent(llm: ChatOpenAI, validation_tool: LeadValidationTool) -
     )
 
 
-def create_lead_processing_crew() -> Crew:
-    """Create the 4-agent Crew for processing leads"""
+@lru_cache(maxsize=None)
+def get_llm(model: str = None) -> BaseLLM:
+    """
+    Shared CrewAI LLM per model, so crews reuse one pool of HTTP connections to OpenAI
     
-    # Initialize LLM
-    llm = ChatOpenAI(
-        model_name="gpt-4",
-        temperature=0.7,
-        openai_api_key=os.getenv("OPENAI_API_KEY")
-    )
+    Agents keep a CrewAI LLM as given (anything else is converted into a new one
+    per agent). It is metered, so per-task usage stays per lead while concurrent
+    crews share it.
+    """
+    return meter_llm(LLM(
+        model=model or LLM_MODEL,
+        temperature=LLM_TEMPERATURE,
+        api_key=os.getenv("OPENAI_API_KEY")
+    ))
+
+
+def get_routing(routing: Union[str, Dict[str, str], None] = None) -> Dict[str, str]:
+    """
+    Resolve a model routing to a model for every pipeline stage
+    
+    Args:
+        routing: Preset name (see ROUTING_PRESETS), partial {stage: model} dict, or
+            None for the configured default: the LLM_ROUTING preset (default "uniform")
+            with per-stage LLM_MODEL_SCOUT / _RESEARCHER / _PITCH / _AUDITOR overrides
+    """
+    if routing is None:
+        preset = os.getenv("LLM_ROUTING", "uniform")
+        if preset not in ROUTING_PRESETS:
+            raise ValueError(f"Unknown LLM_ROUTING preset: {preset} (valid: {', '.join(ROUTING_PRESETS)})")
+        models = dict(ROUTING_PRESETS[preset])
+        for stage in AGENT_STAGES:
+            override = os.getenv(f"LLM_MODEL_{stage.upper()}")
+            if override:
+                models[stage] = override
+    elif isinstance(routing, str):
+        if routing not in ROUTING_PRESETS:
+            raise ValueError(f"Unknown routing preset: {routing} (valid: {', '.join(ROUTING_PRESETS)})")
+        models = ROUTING_PRESETS[routing]
+    else:
+        unknown = set(routing) - set(AGENT_STAGES)
+        if unknown:
+            raise ValueError(f"Unknown pipeline stages in routing: {sorted(unknown)}")
+        models = routing
+    return {stage: models.get(stage) or LLM_MODEL for stage in AGENT_STAGES}
+
+
+def routing_signature(routing: Dict[str, str]) -> str:
+    """Stable name of a resolved routing (the bare model name when all stages share one)"""
+    models = [routing[stage] for stage in AGENT_STAGES]
+    if len(set(models)) == 1:
+        return models[0]
+    return ",".join(f"{stage}={routing[stage]}" for stage in AGENT_STAGES)
+
+
+@lru_cache(maxsize=None)
+def get_validation_tool() -> LeadValidationTool:
+    """Shared validation tool (stateless, safe to reuse across crews)"""
+    return LeadValidationTool()
+
+
+def create_lead_processing_crew(llm: BaseLLM = None, routing: Dict[str, str] = None) -> Crew:
+    """
+    Create the 4-agent Crew for processing leads
+    
+    Args:
+        llm: One LLM for every agent (overrides routing)
+        routing: Model per pipeline stage (defaults to get_routing())
+    """
+    
+    # Reuse the shared LLM clients unless one is given
+    routing = routing or get_routing()
+    llms = {stage: meter_llm(llm) if llm else get_llm(routing[stage]) for stage in AGENT_STAGES}
     
     # Create agents
-    signal_scout = create_signal_scout_agent(llm)
-    researcher = create_researcher_agent(llm)
-    pitch_architect = create_pitch_architect_agent(llm)
-    validation_tool = LeadValidationTool()
-    auditor = create_auditor_agent(llm, validation_tool)
+    signal_scout = create_signal_scout_agent(llms["scout"])
+    researcher = create_researcher_agent(llms["researcher"])
+    pitch_architect = create_pitch_architect_agent(llms["pitch"])
+    validation_tool = get_validation_tool()
+    auditor = create_auditor_agent(llms["auditor"], validation_tool)
     
     # Define tasks
     scout_task = Task(
@@ -347,46 +382,368 @@ def create_lead_processing_crew() -> Crew:
     return crew
 
 
-def process_lead(lead_data: Dict[str, Any]) -> Dict[str, Any]:
+def create_batch_scout_crew(llm: BaseLLM = None) -> Crew:
+    """Create a Signal Scout-only Crew that screens several leads in one call"""
+    signal_scout = create_signal_scout_agent(meter_llm(llm) if llm else get_llm(get_routing()["scout"]))
+    
+    batch_scout_task = Task(
+        description="""Analyze the numbered leads below from the Apify scraper. For EACH lead, decide 
+        whether it shows 'Active Intent'. Active Intent is defined as:
+        1) Expressing frustration with a current tool
+        2) Asking for recommendations for a [Specific Category] solution
+        3) Hiring for roles that indicate a shift in tech stack
+        
+        {leads_data}
+        
+        Output: ONLY a JSON array with one object per lead, in lead order. Each object has:
+        - lead_index: the lead's number as given above
+        - has_active_intent: true or false
+        - user_or_company: User/Company name
+        - trigger_text: the exact phrase/sentence showing intent (empty if none)
+        - confidence_score: 1-10 based on how urgent the need seems (0 if no intent)""",
+        agent=signal_scout,
+        expected_output="JSON array of per-lead verdicts with lead_index, has_active_intent, user_or_company, trigger_text and confidence_score"
+    )
+    
+    return Crew(
+        agents=[signal_scout],
+        tasks=[batch_scout_task],
+        process=Process.sequential,
+        verbose=True
+    )
+
+
+class CrewPool:
+    """
+    Pool of ready-built crews reused across leads
+    
+    Building a crew means building four agents and four tasks, so crews are
+    kept and reused. Each crew runs one lead at a time: a crew is checked out
+    for the whole kickoff and then returned. If more leads run at once than
+    there are idle crews, a new crew is built. At most max_idle crews are kept.
+    """
+    
+    def __init__(self, factory: Callable[[], Crew] = create_lead_processing_crew, max_idle: int = None):
+        """
+        Initialize the pool
+        
+        Args:
+            factory: Callable building a new crew
+            max_idle: Maximum crews kept for reuse (defaults to CREW_POOL_SIZE or 4)
+        """
+        self._factory = factory
+        self._idle: "queue.Queue[Crew]" = queue.Queue(maxsize=max_idle or int(os.getenv("CREW_POOL_SIZE", "4")))
+    
+    @contextmanager
+    def crew(self) -> Iterator[Crew]:
+        """Check out a crew for one lead"""
+        try:
+            crew = self._idle.get_nowait()
+        except queue.Empty:
+            crew = self._factory()
+        
+        try:
+            yield crew
+        except Exception:
+            # A crew that failed mid-run may hold partial task state - don't reuse it
+            raise
+        else:
+            try:
+                self._idle.put_nowait(crew)
+            except queue.Full:
+                pass
+
+
+# Create singleton instances
+crew_pool = CrewPool()
+_routed_crew_pools: Dict[str, CrewPool] = {}
+_routed_crew_pools_lock = threading.Lock()
+scout_crew_pool = CrewPool(factory=create_batch_scout_crew)
+
+# Crew runs in flight across the whole process (API requests and pipeline jobs alike)
+crew_slots = threading.BoundedSemaphore(int(os.getenv("MAX_CONCURRENT_CREWS", "4")))
+
+
+class CrewSlot:
+    """
+    One lead's hold on a crew_slots permit
+    
+    The permit goes back once, on whichever comes first: the lead leaving the
+    slot, or release() from a caller that stopped waiting for it. A thread cannot
+    be killed, so a crew given up on this way finishes in the background without
+    counting against MAX_CONCURRENT_CREWS.
+    """
+    
+    def __init__(self):
+        self._semaphore = crew_slots
+        self._held = False
+        self._lock = threading.Lock()
+    
+    def __enter__(self) -> "CrewSlot":
+        self._semaphore.acquire()
+        self._held = True
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.release()
+    
+    def release(self) -> None:
+        """Return the permit now (later calls do nothing)"""
+        with self._lock:
+            if self._held:
+                self._held = False
+                self._semaphore.release()
+
+
+def _throttle_llm_call(context: Any) -> None:
+    """Before every LLM call the crew makes: wait for rate limiter capacity"""
+    rate_limiter.acquire(rate_limiter.estimate_tokens(getattr(context, "messages", None)))
+    return None
+
+
+def _llm_call_succeeded(context: Any) -> None:
+    rate_limiter.on_success()
+    return None
+
+
+try:
+    from crewai.hooks import register_after_llm_call_hook, register_before_llm_call_hook
+    register_before_llm_call_hook(_throttle_llm_call)
+    register_after_llm_call_hook(_llm_call_succeeded)
+    LLM_CALL_HOOKS = True
+except ImportError:
+    # CrewAI without LLM call hooks: throttle once per task at kickoff instead
+    LLM_CALL_HOOKS = False
+
+
+# Threads that run blocking crews on behalf of async callers; extra calls queue here
+crew_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("CREW_EXECUTOR_WORKERS", "16")),
+    thread_name_prefix="crew"
+)
+result_cache = LeadResultCache()
+step_cache = LeadResultCache(
+    # Next to the result cache; in memory too when that is (so tests and benchmarks write no files)
+    db_path=os.getenv("STEP_CACHE_DB") or (
+        ":memory:" if result_cache.db_path == ":memory:"
+        else os.path.join(os.path.dirname(os.path.abspath(result_cache.db_path)), "step_cache.db")
+    ),
+    ttl_seconds=float(os.getenv("STEP_CACHE_TTL_SECONDS", str(24 * 3600)))
+)
+
+
+def _serialize_result(result: Any) -> Any:
+    """Convert a CrewOutput into plain JSON-compatible data"""
+    if hasattr(result, "model_dump"):
+        return result.model_dump(mode="json")
+    return result
+
+
+def format_lead_input(lead_data: Dict[str, Any]) -> str:
+    """Format raw lead data (a Lead or a plain dict) as the prompt text the agents receive"""
+    lead = as_lead(lead_data)
+    return f"""
+    Lead Data:
+    Source: {lead.source or 'unknown'}
+    Platform: {lead.platform or 'unknown'}
+    Title/Name: {lead.title or 'N/A'}
+    Content: {_or_na(lead.content)}
+    Author: {_or_na(lead.author)}
+    Company: {_or_na(lead.company)}
+    Location: {_or_na(lead.location)}
+    URL: {_or_na(lead.url)}
+    Posted At: {_or_na(lead.posted_at)}
+    Additional Data: {lead.raw_data or {}}
+    """
+
+
+def _or_na(value: Any) -> Any:
+    return "N/A" if value is None else value
+
+
+def lead_cache_key(lead_input: str, routing: Dict[str, str] = None) -> str:
+    """Result cache key of a formatted lead under the given (default: configured) model routing"""
+    return LeadResultCache.make_key(
+        lead_input, routing_signature(routing or get_routing()), LLM_TEMPERATURE, PROMPT_VERSION
+    )
+
+
+def _crew_pool_for(routing: Dict[str, str]) -> CrewPool:
+    """Crew pool of a routing (the shared crew_pool for the configured default)"""
+    signature = routing_signature(routing)
+    if signature == routing_signature(get_routing()):
+        return crew_pool
+    # Leads on a new routing can arrive on several worker threads at once
+    with _routed_crew_pools_lock:
+        if signature not in _routed_crew_pools:
+            _routed_crew_pools[signature] = CrewPool(factory=partial(create_lead_processing_crew, routing=routing))
+        return _routed_crew_pools[signature]
+
+
+def _task_models(routing: Dict[str, str]) -> Dict[str, str]:
+    return {name: routing[stage] for name, stage in zip(TASK_NAMES, AGENT_STAGES)}
+
+
+def _kickoff_with_checkpoints(crew: Crew,
+                              lead_input: str,
+                              cache_key: str,
+                              resume: bool = True,
+                              recorder: Optional[TaskUsageRecorder] = None) -> Dict[str, Any]:
+    """
+    Run the crew, checkpointing each task's output so a retry resumes at the failed task
+    
+    Completed tasks restored from step_cache are not run again. Later tasks still
+    see their output through ``context``. Only the remaining tasks are kicked off.
+    If a recorder is given, each task that runs is timed and metered.
+    
+    Returns:
+        Serialized crew output covering all four tasks
+    """
+    restored = []
+    if resume:
+        for task, name in zip(crew.tasks, TASK_NAMES):
+            saved = step_cache.get(f"{cache_key}:{name}")
+            if saved is None:
+                break
+            task.output = TaskOutput(**saved)
+            restored.append(saved)
+    
+    remaining = crew.tasks[len(restored):]
+    if not remaining:
+        # Every step is checkpointed (the final result was evicted from result_cache)
+        return {"raw": restored[-1].get("raw", ""), "tasks_output": restored, "resumed_from": None}
+    
+    def on_task_done(output: TaskOutput, task: Task, name: str) -> None:
+        if recorder:
+            recorder.finish(task, name)
+        step_cache.set(f"{cache_key}:{name}", _serialize_result(output))
+    
+    for task, name in zip(remaining, TASK_NAMES[len(restored):]):
+        task.callback = partial(on_task_done, task=task, name=name)
+    
+    if restored:
+        print(f"   ↩️  Resuming from {TASK_NAMES[len(restored)]} ({len(restored)} steps restored)")
+        run_crew = Crew(
+            agents=[task.agent for task in remaining],
+            tasks=remaining,
+            process=Process.sequential,
+            verbose=True
+        )
+    else:
+        run_crew = crew
+    
+    if not LLM_CALL_HOOKS:
+        for _ in remaining:
+            rate_limiter.acquire()
+    if recorder:
+        recorder.start(remaining)
+    result = _serialize_result(run_crew.kickoff(inputs={"lead_data": lead_input}))
+    if not LLM_CALL_HOOKS:
+        rate_limiter.on_success()
+    if restored:
+        result["tasks_output"] = restored + list(result.get("tasks_output") or [])
+        result["resumed_from"] = TASK_NAMES[len(restored)]
+    return result
+
+
+def _record_usage(usage: Dict[str, Any], lead: bool = True) -> Dict[str, Any]:
+    """Add a usage record to the process-wide stats and return it"""
+    usage_tracker.record(usage, lead=lead)
+    return usage
+
+
+def process_lead(lead_data: Dict[str, Any],
+                 use_cache: bool = True,
+                 routing: Union[str, Dict[str, str], None] = None,
+                 on_start: Optional[Callable[[CrewSlot], None]] = None) -> Dict[str, Any]:
     """
     Process a single lead through the CrewAI pipeline
     
     Args:
         lead_data: Raw lead data from scraper
+        use_cache: Return a cached result for an identical lead prompt
+            (same models, temperature and prompt version) instead of running the crew,
+            and resume a previously failed run from its last completed task
+        routing: Model per pipeline stage - a ROUTING_PRESETS name or {stage: model}
+            dict (defaults to the configured routing, see get_routing)
+        on_start: Called with the lead's CrewSlot once it holds one, before a crew is
+            checked out (again on each retry); time spent queued for a slot comes
+            before it. An exception raised here fails the lead without running a crew
         
     Returns:
-        Processed lead with enriched data, pitch, and validation
+        Processed lead with enriched data, pitch, and validation; "audit" holds the
+        parsed auditor fields (buyability_score, is_approved, protected_asset, mcp_notification)
+        and "usage" the per-agent latency, tokens and estimated cost of this run
     """
-    crew = create_lead_processing_crew()
     
     # Format lead data for processing
-    lead_input = f"""
-    Lead Data:
-    Source: {lead_data.get('source', 'unknown')}
-    Platform: {lead_data.get('platform', 'unknown')}
-    Title/Name: {lead_data.get('title') or lead_data.get('name', 'N/A')}
-    Content: {lead_data.get('content', lead_data.get('headline', lead_data.get('text', 'N/A')))}
-    Author: {lead_data.get('author', 'N/A')}
-    Company: {lead_data.get('company', 'N/A')}
-    Location: {lead_data.get('location', 'N/A')}
-    URL: {lead_data.get('url', 'N/A')}
-    Posted At: {lead_data.get('posted_at', lead_data.get('createdAt', 'N/A'))}
-    Additional Data: {lead_data.get('raw_data', {})}
-    """
+    lead_input = format_lead_input(lead_data)
+    routing = get_routing(routing)
+    
+    cache_key = lead_cache_key(lead_input, routing)
+    if use_cache:
+        cached = result_cache.get(cache_key)
+        audit = None
+        if cached is not None:
+            try:
+                audit = normalize_result(cached).model_dump()
+            except Exception as e:
+                # An unreadable entry is a miss - run the crew and overwrite it
+                print(f"   ⚠️  Ignoring unreadable cached result: {e}")
+        if audit is not None:
+            return {
+                "original_lead": lead_data,
+                "processed_result": cached,
+                "audit": audit,
+                "usage": _record_usage(summarize_usage({}, 0.0, cached=True)),
+                "status": "processed",
+                "success": True,
+                "cached": True
+            }
     
+    recorder = TaskUsageRecorder(model_for=_task_models(routing))
+    max_retries = int(os.getenv("LLM_MAX_RETRIES", "4"))
+    retries = 0
     try:
-        result = crew.kickoff(inputs={"lead_data": lead_input})
+        while True:
+            try:
+                with CrewSlot() as slot:
+                    if on_start is not None:
+                        on_start(slot)
+                    with _crew_pool_for(routing).crew() as crew:
+                        result = _kickoff_with_checkpoints(
+                            crew, lead_input, cache_key, resume=use_cache, recorder=recorder
+                        )
+                break
+            except Exception as e:
+                if retries >= max_retries or not is_rate_limit_error(e):
+                    raise
+                # Back off without holding a crew slot; checkpoints let the retry resume at the failed task
+                rate_limiter.on_rate_limited(retry_after_seconds(e))
+                delay = backoff_delay(retries)
+                retries += 1
+                print(f"   ⏳ Rate limited, retrying in {delay:.1f}s (retry {retries}/{max_retries})")
+                time.sleep(delay)
         
+        # Parse before caching, so a result the parser rejects is never served from the cache
+        audit = normalize_result(result).model_dump()
+        result_cache.set(cache_key, result)
         return {
             "original_lead": lead_data,
             "processed_result": result,
+            "audit": audit,
+            "usage": _record_usage(recorder.summary()),
             "status": "processed",
-            "success": True
+            "success": True,
+            "cached": False,
+            "retries": retries
         }
     except Exception as e:
         error_msg = str(e)
         # Check for common API errors and provide helpful messages
-        if "429" in error_msg or "quota" in error_msg.lower() or "insufficient_quota" in error_msg.lower():
+        if is_rate_limit_error(e):
+            error_msg = f"OpenAI API rate limit exceeded after {retries} retries. Please wait a moment and try again."
+        elif "429" in error_msg or "quota" in error_msg.lower() or "insufficient_quota" in error_msg.lower():
             error_msg = "OpenAI API quota exceeded. Please check your OpenAI account billing and add credits."
         elif "401" in error_msg or "unauthorized" in error_msg.lower():
             error_msg = "OpenAI API key is invalid or expired. Please check your OPENAI_API_KEY in .env"
@@ -398,10 +755,134 @@ def process_lead(lead_data: Dict[str, Any]) -> Dict[str, Any]:
             "status": "error",
             "success": False,
             "error": error_msg,
-            "error_type": type(e).__name__
+            "error_type": type(e).__name__,
+            "usage": _record_usage(recorder.summary()),
+            "retries": retries
         }
 
 
+async def process_lead_async(lead_data: Dict[str, Any],
+                             use_cache: bool = True,
+                             routing: Union[str, Dict[str, str], None] = None) -> Dict[str, Any]:
+    """
+    Await process_lead without blocking the event loop
+    
+    The crew runs on crew_executor and shares the crew_slots limit with every
+    other caller, so concurrent API requests queue instead of piling onto OpenAI.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        crew_executor, partial(process_lead, lead_data, use_cache=use_cache, routing=routing)
+    )
+
+
+def parse_scout_verdicts(raw: str) -> Dict[int, Dict[str, Any]]:
+    """
+    Parse the batch scout's JSON array into {lead_index: verdict}
+    
+    Tolerates markdown fences and text around the array. Unparseable output
+    returns an empty dict, so every lead falls back to the full pipeline.
+    """
+    fenced = _FENCED_RE.search(raw or "")
+    text = fenced.group(1) if fenced else (raw or "")
+    start, end = text.find("["), text.rfind("]")
+    if start == -1 or end < start:
+        return {}
+    try:
+        items = json.loads(text[start:end + 1])
+    except ValueError:
+        return {}
+    
+    verdicts = {}
+    for item in items if isinstance(items, list) else []:
+        if not isinstance(item, dict):
+            continue
+        try:
+            verdicts[int(item.get("lead_index"))] = item
+        except (TypeError, ValueError):
+            continue
+    return verdicts
+
+
+def _scout_confidence(verdict: Dict[str, Any]) -> float:
+    try:
+        return float(verdict.get("confidence_score") or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _scout_output(verdict: Dict[str, Any]) -> Dict[str, Any]:
+    """Checkpoint a batch verdict as if the single-lead scout task had produced it"""
+    raw = (
+        f"User/Company: {verdict.get('user_or_company') or 'Unknown'}\n"
+        f"Trigger Text: \"{verdict.get('trigger_text') or ''}\"\n"
+        f"Confidence Score: {verdict.get('confidence_score')}/10"
+    )
+    return {
+        "description": "Batch Signal Scout screening",
+        "name": TASK_NAMES[0],
+        "expected_output": "Lead with Active Intent, with User/Company name, Trigger Text, and Confidence Score (1-10)",
+        "raw": raw,
+        "agent": "Intent Data Analyst"
+    }
+
+
+def scout_leads(leads: List[Dict[str, Any]], min_confidence: float = None) -> List[Optional[Dict[str, Any]]]:
+    """
+    Screen several leads with one Signal Scout call
+    
+    Qualifying leads get their scout verdict checkpointed, so a following
+    process_lead() call resumes at the researcher instead of scouting again.
+    Leads with a cached result or scout checkpoint are not sent to the scout.
+    
+    Args:
+        leads: Leads to screen
+        min_confidence: Minimum scout confidence (1-10) for a lead to qualify
+            (defaults to SCOUT_MIN_CONFIDENCE or 5)
+        
+    Returns:
+        One entry per lead: the scout verdict with a "qualified" flag, or None
+        when the lead was not screened (cached, or no usable verdict) and should
+        run through the full pipeline
+    """
+    min_confidence = float(os.getenv("SCOUT_MIN_CONFIDENCE", "5")) if min_confidence is None else min_confidence
+    lead_inputs = [format_lead_input(lead) for lead in leads]
+    keys = [lead_cache_key(lead_input) for lead_input in lead_inputs]
+    to_screen = [
+        i for i, key in enumerate(keys)
+        if key not in result_cache and f"{key}:{TASK_NAMES[0]}" not in step_cache
+    ]
+    verdicts: List[Optional[Dict[str, Any]]] = [None] * len(leads)
+    if not to_screen:
+        return verdicts
+    
+    leads_data = "\n".join(
+        f"Lead {number}:{lead_inputs[i]}" for number, i in enumerate(to_screen, 1)
+    )
+    recorder = TaskUsageRecorder(default_model=get_routing()["scout"])
+    try:
+        with crew_slots, scout_crew_pool.crew() as crew:
+            if not LLM_CALL_HOOKS:
+                rate_limiter.acquire(rate_limiter.estimate_tokens([leads_data]))
+            recorder.start(crew.tasks)
+            output = crew.kickoff(inputs={"leads_data": leads_data})
+            recorder.finish(crew.tasks[0], "batch_scout")
+        _record_usage(recorder.summary(), lead=False)
+    except Exception as e:
+        print(f"   ⚠️  Batch scout failed, falling back to per-lead scouting: {e}")
+        return verdicts
+    
+    parsed = parse_scout_verdicts(getattr(output, "raw", str(output)))
+    for number, i in enumerate(to_screen, 1):
+        verdict = parsed.get(number)
+        if verdict is None:
+            continue
+        verdict["qualified"] = bool(verdict.get("has_active_intent")) and _scout_confidence(verdict) >= min_confidence
+        if verdict["qualified"]:
+            step_cache.set(f"{keys[i]}:{TASK_NAMES[0]}", _scout_output(verdict))
+        verdicts[i] = verdict
+    return verdicts
+
 if __name__ == "__main__":
     # Example usage
     sample_lead = {
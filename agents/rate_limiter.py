@@ -0,0 +1,177 @@
+"""
+OpenAI Rate Limiter
+Client-side token buckets (requests and tokens per minute) shared by every LLM call,
+with adaptive slow-down on 429s and jittered exponential backoff for retries
+"""
+
+import os
+import random
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+
+# Characters per token, for estimating prompt size before the call
+CHARS_PER_TOKEN = 4
+
+# Rate multiplier bounds and steps (multiplicative decrease, additive increase)
+MIN_RATE_FACTOR = 0.1
+DECREASE_FACTOR = 0.5
+INCREASE_STEP = 0.05
+
+
+class TokenBucket:
+    """Bucket of `capacity` units refilled continuously over one minute"""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.level = float(per_minute)
+        self.updated = time.monotonic()
+
+    def refill(self, now: float, factor: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.capacity * factor / 60)
+        self.updated = now
+
+    def wait_time(self, amount: float, factor: float) -> float:
+        """Seconds until `amount` units are available (0 if they are now)"""
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) * 60 / (self.capacity * factor)
+
+
+class AdaptiveRateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute limiter for OpenAI calls
+
+    acquire() blocks until both buckets can cover the call. A 429 halves the
+    refill rate and pauses every caller for the server's Retry-After, if given;
+    each successful call then raises the rate again in small steps up to the
+    configured limits.
+    """
+
+    def __init__(self, rpm: float = None, tpm: float = None, completion_tokens: int = None):
+        """
+        Initialize the limiter
+
+        Args:
+            rpm: Requests per minute (defaults to OPENAI_RPM or 500)
+            tpm: Tokens per minute (defaults to OPENAI_TPM or 30000)
+            completion_tokens: Completion tokens assumed per call
+                (defaults to LLM_COMPLETION_TOKEN_ESTIMATE or 500)
+        """
+        self.requests = TokenBucket(rpm or float(os.getenv("OPENAI_RPM", "500")))
+        self.tokens = TokenBucket(tpm or float(os.getenv("OPENAI_TPM", "30000")))
+        self.completion_tokens = completion_tokens or int(os.getenv("LLM_COMPLETION_TOKEN_ESTIMATE", "500"))
+        self.factor = 1.0
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.throttled_calls = 0
+        self.wait_seconds = 0.0
+        self.rate_limited = 0
+
+    def estimate_tokens(self, messages: Iterable[Any]) -> int:
+        """Prompt tokens (from message text length) plus the completion allowance"""
+        chars = 0
+        for message in messages or []:
+            content = message.get("content") if isinstance(message, dict) else message
+            chars += len(content if isinstance(content, str) else str(content or ""))
+        return chars // CHARS_PER_TOKEN + self.completion_tokens
+
+    def acquire(self, tokens: int = None) -> float:
+        """
+        Block until a call of `tokens` tokens fits both limits
+
+        Returns:
+            Seconds spent waiting
+        """
+        tokens = tokens or self.completion_tokens
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.requests.refill(now, self.factor)
+                self.tokens.refill(now, self.factor)
+                delay = max(
+                    self._paused_until - now,
+                    self.requests.wait_time(1, self.factor),
+                    self.tokens.wait_time(tokens, self.factor)
+                )
+                if delay <= 0:
+                    self.requests.level -= 1
+                    self.tokens.level -= min(tokens, self.tokens.capacity)
+                    self.calls += 1
+                    if waited:
+                        self.throttled_calls += 1
+                        self.wait_seconds += waited
+                    return waited
+            time.sleep(delay)
+            waited += delay
+
+    def on_success(self) -> None:
+        """A call went through - creep back toward the configured rate"""
+        with self._lock:
+            self.factor = min(1.0, self.factor + INCREASE_STEP)
+
+    def on_rate_limited(self, retry_after: Optional[float] = None) -> None:
+        """A call got a 429 - slow everyone down and honor Retry-After"""
+        with self._lock:
+            self.rate_limited += 1
+            self.factor = max(MIN_RATE_FACTOR, self.factor * DECREASE_FACTOR)
+            if retry_after:
+                self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "rpm_limit": self.requests.capacity,
+                "tpm_limit": self.tokens.capacity,
+                "rate_factor": round(self.factor, 3),
+                "calls": self.calls,
+                "throttled_calls": self.throttled_calls,
+                "wait_seconds": round(self.wait_seconds, 3),
+                "rate_limited": self.rate_limited
+            }
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """True for retryable 429s (not for an exhausted quota, which retrying cannot fix)"""
+    message = str(error).lower()
+    if "insufficient_quota" in message or "exceeded your current quota" in message:
+        return False
+    return (
+        type(error).__name__ == "RateLimitError"
+        or getattr(error, "status_code", None) == 429
+        or "429" in message
+        or "rate limit" in message
+        or "rate_limit" in message
+    )
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """The Retry-After header of a 429 response, if the error carries one"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        value = headers.get("retry-after") or headers.get("Retry-After")
+        return float(value) if value else None
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, base: float = None, cap: float = None) -> float:
+    """
+    Full-jitter exponential backoff: uniform(0, min(cap, base * 2 ** attempt))
+
+    Args:
+        attempt: Retry number, starting at 0
+        base: First backoff ceiling in seconds (defaults to LLM_RETRY_BASE_SECONDS or 2)
+        cap: Largest backoff ceiling in seconds (defaults to LLM_RETRY_MAX_SECONDS or 60)
+    """
+    base = base or float(os.getenv("LLM_RETRY_BASE_SECONDS", "2"))
+    cap = cap or float(os.getenv("LLM_RETRY_MAX_SECONDS", "60"))
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+# Create singleton instance
+rate_limiter = AdaptiveRateLimiter()
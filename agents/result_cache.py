@@ -0,0 +1,186 @@
+"""
+Lead Result Cache
+Content-addressed cache of CrewAI results so repeat leads cost no tokens
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+DEFAULT_DB_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "result_cache.db"
+)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class LeadResultCache:
+    """
+    Two-tier (memory LRU + SQLite) cache of processed lead results
+
+    Keys are hashes of the normalized lead prompt plus everything that changes
+    the agents' output (model, temperature, prompt version), so a re-scraped or
+    retried lead maps to the same entry while a prompt change invalidates it.
+    Entries expire after ttl_seconds; each tier evicts least recently used entries.
+    Hits only touch memory: their access times reach disk with the next set() or close().
+    """
+
+    def __init__(self,
+                 db_path: str = None,
+                 ttl_seconds: float = None,
+                 max_entries: int = None,
+                 max_memory_entries: int = 256):
+        """
+        Initialize the cache
+
+        Args:
+            db_path: SQLite file (defaults to RESULT_CACHE_DB or data/result_cache.db);
+                use ":memory:" to keep nothing across restarts
+            ttl_seconds: Entry lifetime (defaults to RESULT_CACHE_TTL_SECONDS or 7 days)
+            max_entries: Maximum entries on disk (defaults to RESULT_CACHE_MAX_ENTRIES or 10000)
+            max_memory_entries: Maximum entries in the in-process LRU tier
+        """
+        self.db_path = db_path or os.getenv("RESULT_CACHE_DB", DEFAULT_DB_PATH)
+        self.ttl_seconds = ttl_seconds or float(os.getenv("RESULT_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+        self.max_entries = max_entries or int(os.getenv("RESULT_CACHE_MAX_ENTRIES", "10000"))
+        self.max_memory_entries = max_memory_entries
+        if self.db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._accessed: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS result_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_result_cache_access ON result_cache(last_access);
+        """)
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(lead_input: str, model: str, temperature: float, prompt_version: str) -> str:
+        """Hash the normalized prompt text together with the model settings"""
+        normalized = _WHITESPACE_RE.sub(" ", lead_input).strip()
+        payload = json.dumps([normalized, model, temperature, prompt_version])
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached result, or None on a miss or expired entry"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                row = self._conn.execute(
+                    "SELECT value, created_at FROM result_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row:
+                    entry = (json.loads(row[0]), row[1])
+
+            if entry is None or now - entry[1] > self.ttl_seconds:
+                if entry is not None:
+                    self._delete(key)
+                self.misses += 1
+                return None
+
+            self._remember(key, entry)
+            self._accessed[key] = now
+            self.hits += 1
+            return entry[0]
+
+    def __contains__(self, key: str) -> bool:
+        """True if a live entry exists (does not count as a hit or miss)"""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                created_at = entry[1]
+            else:
+                row = self._conn.execute(
+                    "SELECT created_at FROM result_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return False
+                created_at = row[0]
+        return time.time() - created_at <= self.ttl_seconds
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a JSON-serializable result"""
+        now = time.time()
+        with self._lock:
+            self._remember(key, (value, now))
+            self._accessed.pop(key, None)
+            # Disk eviction below goes by last_access, so record recent hits first
+            self._flush_accessed()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO result_cache (key, value, created_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value, default=str), now, now)
+            )
+            overflow = self._conn.execute("SELECT COUNT(*) FROM result_cache").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM result_cache WHERE key IN "
+                    "(SELECT key FROM result_cache ORDER BY last_access LIMIT ?)",
+                    (overflow,)
+                )
+            self._conn.commit()
+
+    def _remember(self, key: str, entry: tuple) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _flush_accessed(self) -> None:
+        if self._accessed:
+            self._conn.executemany(
+                "UPDATE result_cache SET last_access = ? WHERE key = ?",
+                [(accessed, key) for key, accessed in self._accessed.items()]
+            )
+            self._accessed.clear()
+
+    def _delete(self, key: str) -> None:
+        self._memory.pop(key, None)
+        self._accessed.pop(key, None)
+        self._conn.execute("DELETE FROM result_cache WHERE key = ?", (key,))
+        self._conn.commit()
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters"""
+        with self._lock:
+            self._memory.clear()
+            self._accessed.clear()
+            self._conn.execute("DELETE FROM result_cache")
+            self._conn.commit()
+            self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and entry counts"""
+        with self._lock:
+            disk_entries = self._conn.execute("SELECT COUNT(*) FROM result_cache").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups * 100) if lookups else 0,
+            "memory_entries": len(self._memory),
+            "disk_entries": disk_entries
+        }
+
+    def close(self) -> None:
+        """Write pending access times and close the database connection"""
+        with self._lock:
+            self._flush_accessed()
+            self._conn.commit()
+            self._conn.close()
@@ -0,0 +1,178 @@
+"""
+Auditor Result Parser
+Normalizes the Quality Auditor's free-text output into typed fields
+"""
+
+import json
+import re
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, ValidationError, field_validator, model_validator
+
+# Buyability at or above this is approved and becomes a Protected Asset
+APPROVAL_THRESHOLD = 80
+
+_FENCED_RE = re.compile(r"```(?:json)?\s*(.*?)(?:```|$)", re.DOTALL | re.IGNORECASE)
+_NUMBER_RE = re.compile(r"-?\d+(?:\.\d+)?")
+_SCORE_RE = re.compile(r"""["']?buyability[_ ]score["']?\s*[:=]\s*["']?(\d+(?:\.\d+)?)""", re.IGNORECASE)
+_APPROVED_RE = re.compile(r"""["']?is[_ ]approved["']?\s*[:=]\s*["']?(true|false|yes|no)""", re.IGNORECASE)
+
+
+class AuditorResult(BaseModel):
+    """Typed view of the auditor task's output"""
+    buyability_score: Optional[float] = None
+    is_approved: Optional[bool] = None
+    protected_asset: Optional[Dict[str, Any]] = None
+    mcp_notification: Optional[Dict[str, Any]] = None
+    feedback: Optional[str] = None
+
+    @field_validator("buyability_score", mode="before")
+    @classmethod
+    def _coerce_score(cls, value: Any) -> Optional[float]:
+        """Accept "85", "85/100"; out-of-range and non-numeric values (objects, lists) are dropped"""
+        if isinstance(value, str):
+            match = _NUMBER_RE.search(value)
+            value = match.group(0) if match else None
+        if value is None or isinstance(value, bool):
+            return None
+        try:
+            score = float(value)
+        except (TypeError, ValueError):
+            return None
+        return score if 0 <= score <= 100 else None
+
+    @field_validator("is_approved", mode="before")
+    @classmethod
+    def _coerce_approved(cls, value: Any) -> Optional[bool]:
+        if isinstance(value, str):
+            return value.strip().lower() in ("true", "yes", "1")
+        if value is None or isinstance(value, bool):
+            return value
+        if isinstance(value, (int, float)):
+            return bool(value)
+        return None
+
+    @field_validator("protected_asset", "mcp_notification", mode="before")
+    @classmethod
+    def _coerce_object(cls, value: Any) -> Optional[Dict[str, Any]]:
+        return value if isinstance(value, dict) else None
+
+    @field_validator("feedback", mode="before")
+    @classmethod
+    def _coerce_feedback(cls, value: Any) -> Optional[str]:
+        if value is None or isinstance(value, str):
+            return value
+        return json.dumps(value, default=str)
+
+    @model_validator(mode="after")
+    def _derive_approval(self) -> "AuditorResult":
+        if self.is_approved is None and self.buyability_score is not None:
+            self.is_approved = self.buyability_score >= APPROVAL_THRESHOLD
+        return self
+
+
+def _close_partial_json(text: str) -> str:
+    """Append the quotes and brackets a truncated JSON object is missing"""
+    stack = []
+    in_string = escaped = False
+    for char in text:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            stack.append("}" if char == "{" else "]")
+        elif char in "}]" and stack:
+            stack.pop()
+
+    closed = text + ('"' if in_string else "")
+    closed = re.sub(r"[,:\s]+$", "", closed)
+    return closed + "".join(reversed(stack))
+
+
+def _load_object(text: str) -> Optional[Dict[str, Any]]:
+    """Find and decode the JSON object in text, repairing truncation if needed"""
+    start = text.find("{")
+    if start == -1:
+        return None
+    candidate = text[start:text.rfind("}") + 1] or text[start:]
+    for attempt in (candidate, _close_partial_json(text[start:])):
+        try:
+            data = json.loads(attempt)
+        except ValueError:
+            continue
+        if isinstance(data, dict):
+            return data
+    return None
+
+
+def parse_auditor_output(raw: Any) -> AuditorResult:
+    """
+    Parse the auditor's output into an AuditorResult
+
+    Handles plain JSON (fast path), markdown-fenced JSON, JSON surrounded by
+    prose and truncated JSON. When no object can be decoded, the score and
+    approval are pulled out of the text directly.
+
+    Args:
+        raw: Auditor output - a dict or the raw string the LLM returned
+    """
+    if isinstance(raw, dict):
+        data = raw
+    else:
+        text = (raw or "").strip()
+        data = None
+        if text.startswith("{"):
+            try:
+                data = json.loads(text)
+            except ValueError:
+                pass
+        if not isinstance(data, dict):
+            fenced = _FENCED_RE.search(text)
+            data = _load_object(fenced.group(1) if fenced else text)
+        if data is None:
+            data = {}
+            score = _SCORE_RE.search(text)
+            approved = _APPROVED_RE.search(text)
+            if score:
+                data["buyability_score"] = score.group(1)
+            if approved:
+                data["is_approved"] = approved.group(1)
+
+    try:
+        return AuditorResult.model_validate(data)
+    except ValidationError as e:
+        # One unusable field must not cost the others (e.g. a valid score)
+        invalid = {error["loc"][0] for error in e.errors() if error["loc"]}
+    try:
+        return AuditorResult.model_validate({key: value for key, value in data.items() if key not in invalid})
+    except ValidationError:
+        return AuditorResult()
+
+
+def normalize_result(processed_result: Any) -> AuditorResult:
+    """
+    Extract the auditor fields from a processed crew result
+
+    Looks at structured output first (json_dict, legacy "audit"/"validation"
+    dicts), then at the final task's raw text.
+    """
+    if not isinstance(processed_result, dict):
+        return parse_auditor_output(getattr(processed_result, "raw", processed_result))
+
+    for key in ("json_dict", "audit", "validation"):
+        structured = processed_result.get(key)
+        if isinstance(structured, dict):
+            if key == "validation" and "buyability_score" not in structured:
+                structured = dict(structured, buyability_score=structured.get("quality_score"))
+            return parse_auditor_output(structured)
+
+    raw = processed_result.get("raw")
+    if not raw and processed_result.get("tasks_output"):
+        raw = (processed_result["tasks_output"][-1] or {}).get("raw")
+    return parse_auditor_output(raw)
@@ -0,0 +1,329 @@
+"""
+LLM Usage Metrics
+Per-agent latency, token and cost accounting for crew runs
+"""
+
+import contextvars
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+# USD per 1M (prompt, completion) tokens; override with LLM_PRICE_<MODEL>="in,out"
+MODEL_PRICES = {
+    "gpt-4": (30.0, 60.0),
+    "gpt-4-turbo": (10.0, 30.0),
+    "gpt-4o": (2.5, 10.0),
+    "gpt-4o-mini": (0.15, 0.6),
+    "gpt-4.1": (2.0, 8.0),
+    "gpt-4.1-mini": (0.4, 1.6),
+    "gpt-4.1-nano": (0.1, 0.4),
+    "gpt-3.5-turbo": (0.5, 1.5),
+}
+
+# Histogram bucket upper bounds
+LATENCY_BUCKETS = [1, 2, 5, 10, 20, 30, 60, 120, 300, 600]
+TOKEN_BUCKETS = [250, 500, 1000, 2000, 4000, 8000, 16000, 32000]
+COST_BUCKETS = [0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0]
+
+USAGE_FIELDS = ("prompt_tokens", "completion_tokens", "total_tokens", "successful_requests")
+
+# Token tally that metered LLM calls add to - the running recorder's, set per context
+_call_usage: contextvars.ContextVar = contextvars.ContextVar("call_usage", default=None)
+_meter_lock = threading.Lock()
+
+
+def model_price(model: str) -> tuple:
+    """(prompt, completion) USD per 1M tokens; unknown models cost 0"""
+    override = os.getenv("LLM_PRICE_" + model.upper().replace("-", "_").replace(".", "_"))
+    if override:
+        prompt_price, completion_price = (float(part) for part in override.split(","))
+        return prompt_price, completion_price
+    if model in MODEL_PRICES:
+        return MODEL_PRICES[model]
+    # Dated snapshots ("gpt-4o-mini-2024-07-18") price like their base model
+    for name in sorted(MODEL_PRICES, key=len, reverse=True):
+        if model.startswith(name + "-"):
+            return MODEL_PRICES[name]
+    return 0.0, 0.0
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """Estimated USD cost of a call"""
+    prompt_price, completion_price = model_price(model)
+    return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1_000_000
+
+
+def agent_token_usage(agent: Any) -> Dict[str, int]:
+    """
+    Cumulative token counters of an agent's LLM
+
+    CrewAI keeps these on the agent's LLM (or its token process for other LLM
+    types); they only grow, so per-task usage is the difference between two reads.
+    """
+    return _token_usage(
+        lambda: agent.llm.get_token_usage_summary(),
+        lambda: agent._token_process.get_summary(),
+    )
+
+
+def _token_usage(*getters: Any) -> Dict[str, int]:
+    summary = None
+    for getter in getters:
+        try:
+            summary = getter()
+            break
+        except Exception:
+            continue
+    if summary is None:
+        return {field: 0 for field in USAGE_FIELDS}
+    if hasattr(summary, "model_dump"):
+        summary = summary.model_dump()
+    return {field: int(summary.get(field) or 0) for field in USAGE_FIELDS}
+
+
+def usage_delta(before: Dict[str, int], after: Dict[str, int]) -> Dict[str, int]:
+    return {field: max(0, after.get(field, 0) - before.get(field, 0)) for field in USAGE_FIELDS}
+
+
+def meter_llm(llm: Any) -> Any:
+    """
+    Also count a CrewAI LLM's usage per call
+
+    An LLM shared by concurrent crews has one set of counters for all of them,
+    so the difference between two reads includes other leads' calls. A metered
+    LLM adds each call's usage to the tally of the TaskUsageRecorder running in
+    the caller's context (CrewAI copies the context into the threads it runs
+    agents and LLM calls on). Idempotent; LLMs without CrewAI's usage tracking
+    are returned unchanged.
+    """
+    track = getattr(llm, "_track_token_usage_internal", None)
+    if track is None or is_metered(llm):
+        return llm
+
+    def track_and_tally(usage_data: Dict[str, Any]) -> None:
+        # The lock keeps other threads' calls out of this call's difference
+        with _meter_lock:
+            before = _token_usage(llm.get_token_usage_summary)
+            track(usage_data)
+            tokens = usage_delta(before, _token_usage(llm.get_token_usage_summary))
+            tally = _call_usage.get()
+            if tally is not None:
+                for field in USAGE_FIELDS:
+                    tally[field] += tokens[field]
+
+    track_and_tally.metered = True
+    # CrewAI LLMs are pydantic models; set the wrapper on the instance only
+    object.__setattr__(llm, "_track_token_usage_internal", track_and_tally)
+    return llm
+
+
+def is_metered(llm: Any) -> bool:
+    return getattr(getattr(llm, "_track_token_usage_internal", None), "metered", False)
+
+
+def summarize_usage(agents: Dict[str, Dict[str, Any]], latency_seconds: float, cached: bool = False) -> Dict[str, Any]:
+    """Per-lead usage record: per-agent entries plus totals"""
+    return {
+        "agents": agents,
+        "latency_seconds": round(latency_seconds, 3),
+        "prompt_tokens": sum(a["prompt_tokens"] for a in agents.values()),
+        "completion_tokens": sum(a["completion_tokens"] for a in agents.values()),
+        "total_tokens": sum(a["total_tokens"] for a in agents.values()),
+        "cost_usd": round(sum(a["cost_usd"] for a in agents.values()), 6),
+        "cached": cached
+    }
+
+
+def rollup_usage(usages: List[Optional[Dict[str, Any]]]) -> Dict[str, Any]:
+    """Sum per-lead usage records (e.g. for a pipeline job)"""
+    usages = [usage for usage in usages if usage]
+    agents: Dict[str, Dict[str, Any]] = {}
+    for usage in usages:
+        for name, entry in usage["agents"].items():
+            total = agents.setdefault(name, {
+                "runs": 0, "latency_seconds": 0.0, "prompt_tokens": 0,
+                "completion_tokens": 0, "total_tokens": 0, "cost_usd": 0.0
+            })
+            total["runs"] += 1
+            for field in ("latency_seconds", "prompt_tokens", "completion_tokens", "total_tokens", "cost_usd"):
+                total[field] += entry[field]
+    return {
+        "leads": len(usages),
+        "cached_leads": sum(1 for usage in usages if usage.get("cached")),
+        "latency_seconds": round(sum(usage["latency_seconds"] for usage in usages), 3),
+        "prompt_tokens": sum(usage["prompt_tokens"] for usage in usages),
+        "completion_tokens": sum(usage["completion_tokens"] for usage in usages),
+        "total_tokens": sum(usage["total_tokens"] for usage in usages),
+        "cost_usd": round(sum(usage["cost_usd"] for usage in usages), 6),
+        "agents": agents
+    }
+
+
+class TaskUsageRecorder:
+    """
+    Times and meters the tasks of one crew run
+
+    Call start() right before kickoff and finish(task, name) from each task's
+    callback. Tasks run sequentially, so a task starts when the previous one ends.
+    Tokens come from the recorder's own tally for metered LLMs (see meter_llm),
+    else from the difference in the agent's LLM counters.
+    """
+
+    def __init__(self, model_for: Dict[str, str] = None, default_model: str = ""):
+        """
+        Args:
+            model_for: Model name per task name (for cost estimates)
+            default_model: Model of tasks missing from model_for
+        """
+        self._model_for = model_for or {}
+        self._default_model = default_model
+        self._before: Dict[int, Dict[str, int]] = {}
+        self._tally = dict.fromkeys(USAGE_FIELDS, 0)
+        self._last = None
+        self.started = None
+        self.agents: Dict[str, Dict[str, Any]] = {}
+
+    def start(self, tasks: List[Any]) -> None:
+        """Snapshot the token counters of the agents about to run (again on a retry)"""
+        self._last = time.monotonic()
+        if self.started is None:
+            self.started = self._last
+        # Metered calls made from here on (and from threads CrewAI starts) are this run's
+        _call_usage.set(self._tally)
+        for task in tasks:
+            self._before[id(task)] = agent_token_usage(task.agent)
+
+    def finish(self, task: Any, name: str) -> None:
+        """Record a finished task (call from its callback)"""
+        now = time.monotonic()
+        if is_metered(getattr(task.agent, "llm", None)):
+            with _meter_lock:
+                tokens = dict(self._tally)
+                self._tally.update(dict.fromkeys(USAGE_FIELDS, 0))
+        else:
+            tokens = usage_delta(self._before.get(id(task), {}), agent_token_usage(task.agent))
+        role = getattr(task.agent, "role", name)
+        model = self._model_for.get(name, self._default_model)
+        self.agents[name] = {
+            "agent": role,
+            "model": model,
+            "latency_seconds": round(now - self._last, 3),
+            **tokens,
+            "cost_usd": round(estimate_cost(model, tokens["prompt_tokens"], tokens["completion_tokens"]), 6)
+        }
+        self._last = now
+
+    def summary(self, cached: bool = False) -> Dict[str, Any]:
+        """Usage record of everything finished so far"""
+        elapsed = time.monotonic() - self.started if self.started else 0.0
+        return summarize_usage(self.agents, elapsed, cached)
+
+
+class Histogram:
+    """Fixed-bucket histogram (cumulative counts per upper bound, Prometheus style)"""
+
+    def __init__(self, bounds: List[float]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        index = next((i for i, bound in enumerate(self.bounds) if value <= bound), len(self.bounds))
+        self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+
+    def to_dict(self) -> Dict[str, Any]:
+        buckets, running = {}, 0
+        for bound, count in zip(self.bounds + ["+Inf"], self.counts):
+            running += count
+            buckets[str(bound)] = running
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "mean": round(self.sum / self.count, 6) if self.count else 0,
+            "buckets": buckets
+        }
+
+
+class UsageTracker:
+    """Process-wide rollup of lead and agent usage, with histograms"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self.leads = 0
+        self.cached_leads = 0
+        self.lead_latency = Histogram(LATENCY_BUCKETS)
+        self.lead_tokens = Histogram(TOKEN_BUCKETS)
+        self.lead_cost = Histogram(COST_BUCKETS)
+        self.agents: Dict[str, Dict[str, Any]] = {}
+
+    def record(self, usage: Dict[str, Any], lead: bool = True) -> None:
+        """
+        Add one usage record
+
+        Args:
+            usage: Record from summarize_usage()
+            lead: False for work not tied to one lead (e.g. a batched scout call)
+        """
+        with self._lock:
+            if lead:
+                self.leads += 1
+                if usage.get("cached"):
+                    self.cached_leads += 1
+                else:
+                    self.lead_latency.observe(usage["latency_seconds"])
+                    self.lead_tokens.observe(usage["total_tokens"])
+                    self.lead_cost.observe(usage["cost_usd"])
+            for name, entry in usage["agents"].items():
+                stats = self.agents.get(name)
+                if stats is None:
+                    stats = self.agents[name] = {
+                        "runs": 0, "prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0,
+                        "cost_usd": 0.0, "latency": Histogram(LATENCY_BUCKETS),
+                        "tokens": Histogram(TOKEN_BUCKETS)
+                    }
+                stats["runs"] += 1
+                for field in ("prompt_tokens", "completion_tokens", "total_tokens", "cost_usd"):
+                    stats[field] += entry[field]
+                stats["latency"].observe(entry["latency_seconds"])
+                stats["tokens"].observe(entry["total_tokens"])
+
+    def stats(self) -> Dict[str, Any]:
+        """Totals, per-agent breakdown and histograms since process start"""
+        with self._lock:
+            agents = {
+                name: {
+                    "runs": stats["runs"],
+                    "prompt_tokens": stats["prompt_tokens"],
+                    "completion_tokens": stats["completion_tokens"],
+                    "total_tokens": stats["total_tokens"],
+                    "cost_usd": round(stats["cost_usd"], 6),
+                    "latency_seconds": stats["latency"].to_dict(),
+                    "tokens": stats["tokens"].to_dict()
+                }
+                for name, stats in self.agents.items()
+            }
+            return {
+                "leads": self.leads,
+                "cached_leads": self.cached_leads,
+                "total_tokens": sum(a["total_tokens"] for a in agents.values()),
+                "cost_usd": round(sum(a["cost_usd"] for a in agents.values()), 6),
+                "lead_latency_seconds": self.lead_latency.to_dict(),
+                "lead_tokens": self.lead_tokens.to_dict(),
+                "lead_cost_usd": self.lead_cost.to_dict(),
+                "agents": agents
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._reset()
+
+
+# Create singleton instance
+usage_tracker = UsageTracker()
@@ -1,5 +1,5 @@
 """
-Script to add test leads directly to the processed_leads_store
+Script to add test leads directly to the lead store
 Run this to populate the system with test leads for Nevermined testing
 """
 
@@ -14,7 +14,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import the store from main.py
 # We'll need to import it directly
-from api.main import processed_leads_store
+from api.main import lead_store
 
 # Test leads with high buyability scores
 test_leads_data = [
@@ -163,7 +163,7 @@ test_leads_data = [
 ]
 
 def add_test_leads_to_store():
-    """Add test leads directly to the processed_leads_store"""
+    """Add test leads directly to the lead store"""
     print("=" * 60)
     print("Adding Test Leads to System")
     print("=" * 60)
@@ -180,7 +180,7 @@ def add_test_leads_to_store():
         }
         
         # Add to store
-        processed_leads_store[lead_id] = full_lead
+        lead_store.put(full_lead)
         added_leads.append({
             "lead_id": lead_id,
             "title": lead_data["original_lead"]["title"],
@@ -198,7 +198,7 @@ def add_test_leads_to_store():
     print("Summary")
     print("=" * 60)
     print(f"✅ Added {len(added_leads)} test leads")
-    print(f"📊 Total leads in system: {len(processed_leads_store)}")
+    print(f"📊 Total leads in system: {len(lead_store)}")
     print("\n📋 Lead IDs:")
     for lead in added_leads:
         print(f"   - {lead['lead_id']}: {lead['title'][:50]}... (Score: {lead['score']})")
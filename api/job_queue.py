@@ -0,0 +1,160 @@
+"""
+Background Job Queue
+Runs long pipeline work on worker threads so the API event loop stays responsive
+"""
+
+import asyncio
+import os
+import threading
+import traceback
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class JobStatus(Enum):
+    """Job status enumeration"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass
+class Job:
+    """A unit of background work and its progress"""
+    job_id: str
+    job_type: str
+    params: Dict[str, Any]
+    status: JobStatus = JobStatus.QUEUED
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    progress: Dict[str, Any] = field(default_factory=dict)
+    result: Any = None
+    error: Optional[str] = None
+
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        """Serialize the job for API responses"""
+        data = {
+            "job_id": self.job_id,
+            "job_type": self.job_type,
+            "status": self.status.value,
+            "params": self.params,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "progress": dict(self.progress),
+            "error": self.error,
+        }
+        if include_result:
+            data["result"] = self.result
+        return data
+
+
+class JobQueue:
+    """
+    Thread-pool backed job queue
+
+    Each job function is called as ``func(progress_callback=..., **params)`` on a
+    worker thread; whatever it returns becomes the job result. Only the most
+    recent ``max_history`` finished jobs are kept.
+    """
+
+    def __init__(self, max_workers: int = None, max_history: int = 200):
+        """
+        Initialize the queue
+
+        Args:
+            max_workers: Number of jobs run at once (defaults to JOB_WORKERS or 2)
+            max_history: Number of finished jobs kept for status queries
+        """
+        self.max_workers = max(1, max_workers or int(os.getenv("JOB_WORKERS", "2")))
+        self.max_history = max_history
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="job")
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, job_type: str, func: Callable[..., Any], params: Dict[str, Any]) -> Job:
+        """
+        Queue a job and return immediately
+
+        Args:
+            job_type: Label for the kind of work (e.g. "scrape_and_process")
+            func: Callable run on a worker thread
+            params: Keyword arguments passed to func (also shown in job status)
+        """
+        job = Job(job_id=str(uuid.uuid4()), job_type=job_type, params=params)
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._prune()
+            self._futures[job.job_id] = self._executor.submit(self._run, job, func)
+        return job
+
+    def _run(self, job: Job, func: Callable[..., Any]) -> Job:
+        job.status = JobStatus.RUNNING
+        job.started_at = datetime.now().isoformat()
+
+        def progress_callback(update: Dict[str, Any]) -> None:
+            job.progress.update(update)
+
+        try:
+            job.result = func(progress_callback=progress_callback, **job.params)
+            job.status = JobStatus.COMPLETED
+        except Exception as e:
+            print(f"❌ Job {job.job_id} failed: {e}")
+            traceback.print_exc()
+            job.error = str(e)
+            job.status = JobStatus.FAILED
+        finally:
+            job.finished_at = datetime.now().isoformat()
+            with self._lock:
+                self._futures.pop(job.job_id, None)
+        return job
+
+    def _prune(self) -> None:
+        """Drop the oldest finished jobs beyond max_history (caller holds the lock)"""
+        finished = [
+            job_id for job_id, job in self._jobs.items()
+            if job.status in (JobStatus.COMPLETED, JobStatus.FAILED)
+        ]
+        for job_id in finished[:max(0, len(finished) - self.max_history)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Return a job, or None if unknown (or pruned)"""
+        return self._jobs.get(job_id)
+
+    def list_jobs(self,
+                  limit: int = 20,
+                  offset: int = 0,
+                  status: Optional[str] = None) -> Tuple[int, List[Job]]:
+        """
+        Return jobs newest first
+
+        Returns:
+            Tuple of (total matching jobs, jobs on this page)
+        """
+        with self._lock:
+            jobs = [
+                job for job in reversed(self._jobs.values())
+                if status is None or job.status.value == status
+            ]
+        return len(jobs), jobs[offset:offset + limit]
+
+    async def wait(self, job_id: str) -> Optional[Job]:
+        """Wait for a job without blocking the event loop"""
+        with self._lock:
+            future = self._futures.get(job_id)
+        if future is not None:
+            await asyncio.wrap_future(future)
+        return self.get(job_id)
+
+
+# Create singleton instance
+job_queue = JobQueue()
@@ -0,0 +1,366 @@
+"""
+Processed Lead Storage
+Pluggable storage backends for processed leads (SQLite by default)
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_DB_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "leads.db"
+)
+
+
+# Compact list view; each field is a column of the SQLite store, so listing never parses the stored document
+SUMMARY_FIELDS = ("lead_id", "source", "title", "buyability_score", "status", "processed_at")
+
+# A projected field: a top-level key or a dotted path such as "audit.feedback"
+_FIELD_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)*$")
+
+
+def parse_fields(spec: Optional[str]) -> List[str]:
+    """
+    Fields of a "fields=" query parameter (the summary view if empty)
+
+    lead_id is always included. Raises ValueError for malformed field names.
+    """
+    if not spec or not spec.strip():
+        return list(SUMMARY_FIELDS)
+    fields = ["lead_id"]
+    for field in spec.split(","):
+        field = field.strip()
+        if not field:
+            continue
+        if not _FIELD_RE.match(field):
+            raise ValueError(f"Invalid field: {field!r}")
+        if field not in fields:
+            fields.append(field)
+    # "audit" already covers "audit.feedback"
+    return [field for field in fields if not any(field.startswith(other + ".") for other in fields)]
+
+
+def _set_path(record: Dict[str, Any], field: str, value: Any) -> None:
+    *parents, key = field.split(".")
+    for parent in parents:
+        record = record.setdefault(parent, {})
+    record[key] = value
+
+
+def project_lead(lead: Dict[str, Any], fields: Sequence[str]) -> Dict[str, Any]:
+    """
+    The requested fields of a lead, nested like the full record
+
+    "source" and "title" are the summary fields taken from original_lead;
+    missing paths are returned as None.
+    """
+    projected: Dict[str, Any] = {}
+    for field in fields:
+        if field == "source":
+            value = (lead.get("original_lead") or {}).get("source")
+        elif field == "title":
+            value = _lead_title(lead)
+        else:
+            value = lead
+            for key in field.split("."):
+                value = value.get(key) if isinstance(value, dict) else None
+        _set_path(projected, field, value)
+    return projected
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize CrewAI outputs, Lead records and other non-JSON values stored with a lead"""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _lead_title(lead: Dict[str, Any]) -> str:
+    original = lead.get("original_lead") or {}
+    return original.get("title") or original.get("name") or ""
+
+
+class LeadStore(ABC):
+    """
+    Base class for processed lead storage
+
+    Leads are dictionaries keyed by "lead_id". Backends must support filtering
+    and paging on source, status, buyability_score and is_approved, ordered by
+    processed_at. A backend missing any abstract method cannot be instantiated.
+    """
+
+    @abstractmethod
+    def put(self, lead: Dict[str, Any]) -> None:
+        """Insert or replace a lead"""
+
+    @abstractmethod
+    def get(self, lead_id: str) -> Optional[Dict[str, Any]]:
+        """Return a lead, or None if it does not exist"""
+
+    @abstractmethod
+    def delete(self, lead_id: str) -> bool:
+        """Delete a lead; returns False if it did not exist"""
+
+    @abstractmethod
+    def list_leads(self,
+                   limit: int = 10,
+                   offset: int = 0,
+                   source: Optional[str] = None,
+                   status: Optional[str] = None,
+                   min_score: Optional[float] = None,
+                   approved: Optional[bool] = None,
+                   fields: Optional[Sequence[str]] = None) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Return one page of leads matching the filters
+
+        Args:
+            min_score: Only leads scored at least this (unscored leads never match)
+            fields: Return only these fields of each lead (see parse_fields and
+                project_lead) instead of whole records
+
+        Returns:
+            Tuple of (total matching leads, leads on this page)
+        """
+
+    @abstractmethod
+    def stats(self) -> Dict[str, int]:
+        """Return total, successful (status == "processed") and protected (score >= 80) counts"""
+
+    @abstractmethod
+    def lead_ids(self, limit: int = 5) -> List[str]:
+        """Return a few lead IDs (for debugging output)"""
+
+    def __len__(self) -> int:
+        return self.stats()["total"]
+
+    def __contains__(self, lead_id: str) -> bool:
+        return self.get(lead_id) is not None
+
+
+def _score_at_least(score: Optional[float], min_score: float) -> bool:
+    # Same as SQL's "buyability_score >= ?": a NULL score matches no minimum
+    return score is not None and score >= min_score
+
+
+class InMemoryLeadStore(LeadStore):
+    """Dictionary-backed store; contents are lost on restart (useful for tests)"""
+
+    def __init__(self):
+        self._leads: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def put(self, lead: Dict[str, Any]) -> None:
+        with self._lock:
+            self._leads[lead["lead_id"]] = lead
+
+    def get(self, lead_id: str) -> Optional[Dict[str, Any]]:
+        return self._leads.get(lead_id)
+
+    def delete(self, lead_id: str) -> bool:
+        with self._lock:
+            return self._leads.pop(lead_id, None) is not None
+
+    def list_leads(self, limit=10, offset=0, source=None, status=None, min_score=None, approved=None, fields=None):
+        with self._lock:
+            leads = [
+                lead for lead in self._leads.values()
+                if (source is None or (lead.get("original_lead") or {}).get("source") == source)
+                and (status is None or lead.get("status") == status)
+                and (min_score is None or _score_at_least(lead.get("buyability_score"), min_score))
+                and (approved is None or bool(lead.get("is_approved")) == approved)
+            ]
+        leads.sort(key=lambda lead: lead.get("processed_at") or "")
+        page = leads[offset:offset + limit]
+        if fields is not None:
+            page = [project_lead(lead, fields) for lead in page]
+        return len(leads), page
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            leads = list(self._leads.values())
+        return {
+            "total": len(leads),
+            "successful": sum(1 for lead in leads if lead.get("status") == "processed"),
+            "protected": sum(1 for lead in leads if (lead.get("buyability_score") or 0) >= 80),
+        }
+
+    def lead_ids(self, limit: int = 5) -> List[str]:
+        return list(self._leads)[:limit]
+
+
+class SQLiteLeadStore(LeadStore):
+    """
+    SQLite-backed store that survives restarts
+
+    Filter columns are denormalized out of the JSON document and indexed, so
+    paging and stats queries never deserialize leads they do not return.
+    """
+
+    def __init__(self, db_path: str = None):
+        """
+        Initialize the store
+
+        Args:
+            db_path: SQLite file (defaults to LEAD_STORE_DB or data/leads.db)
+        """
+        self.db_path = db_path or os.getenv("LEAD_STORE_DB", DEFAULT_DB_PATH)
+        if self.db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS leads (
+                lead_id TEXT PRIMARY KEY,
+                source TEXT,
+                status TEXT,
+                buyability_score REAL,
+                is_approved INTEGER,
+                processed_at TEXT,
+                title TEXT,
+                data TEXT NOT NULL
+            );
+        """)
+        # Databases created before is_approved existed
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(leads)")}
+        if "is_approved" not in columns:
+            self._conn.execute("ALTER TABLE leads ADD COLUMN is_approved INTEGER")
+        self._conn.executescript("""
+            CREATE INDEX IF NOT EXISTS idx_leads_score ON leads(buyability_score);
+            CREATE INDEX IF NOT EXISTS idx_leads_approved ON leads(is_approved, processed_at);
+            CREATE INDEX IF NOT EXISTS idx_leads_source ON leads(source, processed_at);
+            CREATE INDEX IF NOT EXISTS idx_leads_status ON leads(status, processed_at);
+            CREATE INDEX IF NOT EXISTS idx_leads_processed_at ON leads(processed_at);
+        """)
+        self._conn.commit()
+
+    def put(self, lead: Dict[str, Any]) -> None:
+        original = lead.get("original_lead") or {}
+        row = (
+            lead["lead_id"],
+            original.get("source"),
+            lead.get("status"),
+            lead.get("buyability_score"),
+            None if lead.get("is_approved") is None else int(bool(lead["is_approved"])),
+            lead.get("processed_at"),
+            _lead_title(lead),
+            json.dumps(lead, default=_json_default),
+        )
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO leads "
+                "(lead_id, source, status, buyability_score, is_approved, processed_at, title, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                row
+            )
+            self._conn.commit()
+
+    def get(self, lead_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM leads WHERE lead_id = ?", (lead_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def __contains__(self, lead_id: str) -> bool:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM leads WHERE lead_id = ?", (lead_id,)
+            ).fetchone() is not None
+
+    def delete(self, lead_id: str) -> bool:
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM leads WHERE lead_id = ?", (lead_id,))
+            self._conn.commit()
+        return cursor.rowcount > 0
+
+    def list_leads(self, limit=10, offset=0, source=None, status=None, min_score=None, approved=None, fields=None):
+        clauses, params = [], []
+        if source is not None:
+            clauses.append("source = ?")
+            params.append(source)
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status)
+        if min_score is not None:
+            clauses.append("buyability_score >= ?")
+            params.append(min_score)
+        if approved is not None:
+            clauses.append("is_approved = 1" if approved else "(is_approved IS NULL OR is_approved = 0)")
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        if fields is None:
+            columns, column_params = "data", []
+        else:
+            # Summary fields come from their columns, others are extracted by SQLite -
+            # either way no stored document is parsed in Python
+            selected = []
+            column_params = []
+            for field in fields:
+                if field in SUMMARY_FIELDS:
+                    selected.append(f"json_quote({field})")
+                else:
+                    selected.append("json_quote(json_extract(data, ?))")
+                    column_params.append(f"$.{field}")
+            columns = ", ".join(selected)
+
+        with self._lock:
+            total = self._conn.execute(f"SELECT COUNT(*) FROM leads {where}", params).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT {columns} FROM leads {where} ORDER BY processed_at LIMIT ? OFFSET ?",
+                column_params + params + [limit, offset]
+            ).fetchall()
+        if fields is None:
+            return total, [json.loads(row[0]) for row in rows]
+        page = []
+        for row in rows:
+            projected: Dict[str, Any] = {}
+            for field, value in zip(fields, row):
+                _set_path(projected, field, json.loads(value))
+            page.append(projected)
+        return total, page
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            total, successful, protected = self._conn.execute(
+                "SELECT COUNT(*), "
+                "(SELECT COUNT(*) FROM leads WHERE status = 'processed'), "
+                "(SELECT COUNT(*) FROM leads WHERE buyability_score >= 80) "
+                "FROM leads"
+            ).fetchone()
+        return {"total": total, "successful": successful, "protected": protected}
+
+    def lead_ids(self, limit: int = 5) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT lead_id FROM leads ORDER BY processed_at LIMIT ?", (limit,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+def create_lead_store(backend: str = None) -> LeadStore:
+    """
+    Create the configured lead store
+
+    Args:
+        backend: "sqlite" (default) or "memory"; defaults to LEAD_STORE_BACKEND
+    """
+    backend = (backend or os.getenv("LEAD_STORE_BACKEND", "sqlite")).lower()
+    if backend == "memory":
+        return InMemoryLeadStore()
+    if backend == "sqlite":
+        return SQLiteLeadStore()
+    raise ValueError(f"Unknown LEAD_STORE_BACKEND: {backend}")
@@ -5,12 +5,14 @@ Integrates Apify Scraper with CrewAI Agents Workflow
 
 import os
 import sys
-from typing import List, Dict, Any, Optional
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from typing import List, Dict, Any, Optional, Union
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
+import json
 import uuid
 from datetime import datetime
 
@@ -18,9 +20,14 @@ from datetime import datetime
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from tools.apify_scraper import ApifyLeadScraper
-from agents.crew_setup import process_lead
+from agents.crew_setup import get_routing, process_lead_async, result_cache
+from agents.rate_limiter import rate_limiter
+from agents.result_parser import normalize_result
+from agents.usage_metrics import usage_tracker
 from integrate_scraper_agents import scrape_and_process_leads
 from api.nevermined_middleware import nevermined_middleware
+from api.lead_store import create_lead_store, parse_fields
+from api.job_queue import Job, JobStatus, job_queue
 
 load_dotenv()
 
@@ -39,8 +46,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# In-memory storage for processed leads (use database in production)
-processed_leads_store: Dict[str, Dict[str, Any]] = {}
+# Persistent storage for processed leads (SQLite by default, see LEAD_STORE_BACKEND)
+lead_store = create_lead_store()
 
 
 # Pydantic Models
@@ -53,6 +60,10 @@ class ScrapeRequest(BaseModel):
 
 class ProcessLeadRequest(BaseModel):
     lead_data: Dict[str, Any] = Field(..., description="Raw lead data from scraper")
+    use_cache: bool = Field(True, description="Reuse a cached result for an identical lead instead of re-running the agents")
+    routing: Optional[Union[str, Dict[str, str]]] = Field(
+        None, description="Model routing: a preset name (uniform, tiered, mini) or {stage: model} for scout/researcher/pitch/auditor"
+    )
 
 
 class ScrapeAndProcessRequest(BaseModel):
@@ -61,6 +72,13 @@ class ScrapeAndProcessRequest(BaseModel):
     linkedin_location: Optional[str] = None
     max_per_source: int = Field(10, ge=1, le=100)
     process_limit: int = Field(3, ge=1, le=10, description="Maximum leads to process through agents")
+    deduplicate: bool = Field(True, description="Skip leads already processed in earlier runs and near-duplicates across sources")
+    max_concurrent_leads: Optional[int] = Field(None, ge=1, le=10, description="Maximum leads processed through agents at once")
+    prefilter: bool = Field(True, description="Rank leads with local heuristics and send only the best ones to the agents")
+    prefilter_min_score: Optional[float] = Field(None, ge=0, le=100, description="Drop leads with a pre-filter score below this")
+    batch_scout: bool = Field(False, description="Screen leads with batched Signal Scout calls and fully process only qualifying leads")
+    scout_batch_size: Optional[int] = Field(None, ge=1, le=20, description="Leads per batched Signal Scout call")
+    incremental: bool = Field(False, description="Only scrape posts newer than the previous run of the same search")
 
 
 class LeadResponse(BaseModel):
@@ -88,8 +106,11 @@ async def root():
             "endpoints": {
             "health": "/health",
             "scrape": "/api/scrape",
+            "scrape_stream": "/api/scrape/stream",
             "process": "/api/process",
             "scrape_and_process": "/api/scrape-and-process",
+            "jobs": "/api/jobs",
+            "job_by_id": "/api/jobs/{job_id}",
             "leads": "/api/leads",
             "lead_by_id": "/api/leads/{lead_id}",
             "unlock": "/api/unlock",
@@ -123,7 +144,8 @@ async def scrape_leads(request: ScrapeRequest):
     """
     try:
         scraper = ApifyLeadScraper()
-        results = scraper.scrape_all(
+        results = await run_in_threadpool(
+            scraper.scrape_all,
             keywords=request.keywords,
             reddit_subreddits=request.reddit_subreddits,
             linkedin_location=request.linkedin_location,
@@ -144,6 +166,65 @@ async def scrape_leads(request: ScrapeRequest):
         raise HTTPException(status_code=500, detail=f"Scraping failed: {str(e)}")
 
 
+@app.post("/api/scrape/stream")
+async def scrape_leads_stream(request: ScrapeRequest):
+    """
+    Stream scraped leads as newline-delimited JSON (NDJSON)
+    
+    Each lead is sent as soon as it is read from an Apify dataset:
+    {"event": "lead", "lead": {...}}
+    
+    The stream ends with a summary line:
+    {"event": "complete", "total_leads": ..., "reddit_leads": ..., "linkedin_leads": ...}
+    """
+    try:
+        scraper = ApifyLeadScraper()
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    def ndjson_events():
+        # Sync generator - Starlette iterates it in a worker thread, off the event loop
+        counts = {"reddit": 0, "linkedin": 0}
+        try:
+            for lead in scraper.iter_all(
+                keywords=request.keywords,
+                reddit_subreddits=request.reddit_subreddits,
+                linkedin_location=request.linkedin_location,
+                max_per_source=request.max_per_source
+            ):
+                counts[lead["source"]] = counts.get(lead["source"], 0) + 1
+                yield json.dumps({"event": "lead", "lead": lead.to_dict()}, default=str) + "\n"
+        except Exception as e:
+            yield json.dumps({"event": "error", "detail": f"Scraping failed: {str(e)}"}) + "\n"
+            return
+        
+        yield json.dumps({
+            "event": "complete",
+            "total_leads": sum(counts.values()),
+            "reddit_leads": counts["reddit"],
+            "linkedin_leads": counts["linkedin"],
+            "timestamp": datetime.now().isoformat()
+        }) + "\n"
+    
+    return StreamingResponse(ndjson_events(), media_type="application/x-ndjson")
+
+
+def _lead_record(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the stored record for a successful process_lead result"""
+    audit = result.get("audit") or normalize_result(result.get("processed_result")).model_dump()
+    return {
+        "lead_id": str(uuid.uuid4()),
+        "original_lead": result["original_lead"],
+        "processed_result": result.get("processed_result", {}),
+        "status": "processed",
+        "processed_at": datetime.now().isoformat(),
+        "buyability_score": audit.get("buyability_score"),
+        "is_approved": audit.get("is_approved"),
+        "audit": audit,
+        "usage": result.get("usage")
+    }
+
+
 @app.post("/api/process")
 async def process_single_lead(request: ProcessLeadRequest):
     """
@@ -158,51 +239,19 @@ async def process_single_lead(request: ProcessLeadRequest):
     If buyability score >= 80, creates a Protected Asset for Nevermined monetization.
     """
     try:
-        result = process_lead(request.lead_data)
+        routing = get_routing(request.routing)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    try:
+        result = await process_lead_async(request.lead_data, use_cache=request.use_cache, routing=routing)
         
         if result.get("success"):
-            # Generate lead ID and store
-            lead_id = str(uuid.uuid4())
+            processed_lead_data = _lead_record(result)
+            lead_id = processed_lead_data["lead_id"]
+            buyability_score = processed_lead_data["buyability_score"]
             
-            # Extract buyability score from processed result (if available)
-            processed_result = result.get("processed_result", {})
-            buyability_score = None
-            
-            # Try to extract buyability score from auditor's output
-            if isinstance(processed_result, dict):
-                # Check various possible locations for the score
-                audit_result = processed_result.get("audit") or processed_result.get("validation") or {}
-                buyability_score = audit_result.get("buyability_score") or audit_result.get("quality_score")
-                
-                # If not found, try parsing from raw string (CrewAI output)
-                if not buyability_score and isinstance(processed_result.get("raw"), str):
-                    import json as json_lib
-                    try:
-                        raw_data = json_lib.loads(processed_result.get("raw", "{}"))
-                        buyability_score = raw_data.get("buyability_score")
-                    except:
-                        # Try to extract from string if JSON parsing fails
-                        raw_str = processed_result.get("raw", "")
-                        if '"buyability_score":' in raw_str:
-                            try:
-                                # Extract buyability_score value from string
-                                import re
-                                match = re.search(r'"buyability_score":\s*(\d+(?:\.\d+)?)', raw_str)
-                                if match:
-                                    buyability_score = float(match.group(1))
-                            except:
-                                pass
-            
-            processed_lead_data = {
-                "lead_id": lead_id,
-                "original_lead": result["original_lead"],
-                "processed_result": processed_result,
-                "status": "processed",
-                "processed_at": datetime.now().isoformat(),
-                "buyability_score": buyability_score
-            }
-            
-            processed_leads_store[lead_id] = processed_lead_data
+            lead_store.put(processed_lead_data)
             
             # If buyability score >= 80, create Protected Asset and MCP notification
             mcp_notification = None
@@ -243,8 +292,76 @@ async def process_single_lead(request: ProcessLeadRequest):
         raise HTTPException(status_code=500, detail=f"Processing error: {str(e)}")
 
 
+def _run_scrape_and_process(progress_callback=None, **params) -> Dict[str, Any]:
+    """
+    Run the scrape-and-process pipeline and store its leads (runs on a job worker thread)
+    
+    Returns the /api/scrape-and-process response body.
+    """
+    lead_ids = []
+    
+    def store_result(processed: Dict[str, Any]) -> None:
+        # Store each processed lead as soon as it finishes
+        if not processed.get("success"):
+            return
+        record = _lead_record(processed)
+        lead_store.put(record)
+        lead_ids.append(record["lead_id"])
+    
+    results = scrape_and_process_leads(
+        progress_callback=progress_callback,
+        result_callback=store_result,
+        **params
+    )
+    if results.get("error"):
+        raise RuntimeError(results["error"])
+    
+    # Extract error details from failed leads for better debugging
+    failed_errors = []
+    if results.get("failed_leads"):
+        for failed in results.get("failed_leads", [])[:3]:  # Show first 3 errors
+            failed_errors.append({
+                "lead_title": failed.get("lead", {}).get("title", failed.get("lead", {}).get("name", "Unknown"))[:50],
+                "error": failed.get("error", "Unknown error")
+            })
+    
+    scrape_results = results.get("scrape_results") or {}
+    return {
+        "status": "success",
+        "summary": results.get("summary", {}),
+        "scrape_results": {
+            "total": scrape_results.get("total", 0),
+            "reddit": len(scrape_results.get("reddit", [])),
+            "linkedin": len(scrape_results.get("linkedin", []))
+        },
+        "processed_leads_count": len(results.get("processed_leads", [])),
+        "failed_leads_count": len(results.get("failed_leads", [])),
+        "processed_leads": results.get("processed_leads", []),
+        "lead_ids": lead_ids,
+        "failed_leads_errors": failed_errors,  # Include error details
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+def _submit_scrape_and_process(request: ScrapeAndProcessRequest) -> Job:
+    return job_queue.submit("scrape_and_process", _run_scrape_and_process, {
+        "keywords": request.keywords,
+        "reddit_subreddits": request.reddit_subreddits,
+        "linkedin_location": request.linkedin_location,
+        "max_per_source": request.max_per_source,
+        "process_limit": request.process_limit,
+        "deduplicate": request.deduplicate,
+        "max_concurrent_leads": request.max_concurrent_leads,
+        "prefilter": request.prefilter,
+        "prefilter_min_score": request.prefilter_min_score,
+        "batch_scout": request.batch_scout,
+        "scout_batch_size": request.scout_batch_size,
+        "incremental": request.incremental
+    })
+
+
 @app.post("/api/scrape-and-process")
-async def scrape_and_process(request: ScrapeAndProcessRequest, background_tasks: BackgroundTasks):
+async def scrape_and_process(request: ScrapeAndProcessRequest):
     """
     Complete pipeline: Scrape leads and process them through CrewAI agents
     
@@ -252,69 +369,98 @@ async def scrape_and_process(request: ScrapeAndProcessRequest, background_tasks:
     1. Scrapes leads from Reddit and LinkedIn
     2. Processes top leads through the 4-agent crew
     3. Returns both raw and processed leads
+    
+    The pipeline runs on a background job worker, so other requests are served
+    while this one waits. Use POST /api/jobs/scrape-and-process to get a job ID
+    back immediately instead.
     """
-    try:
-        results = scrape_and_process_leads(
-            keywords=request.keywords,
-            reddit_subreddits=request.reddit_subreddits,
-            linkedin_location=request.linkedin_location,
-            max_per_source=request.max_per_source,
-            process_limit=request.process_limit
-        )
-        
-        # Store processed leads
-        for processed in results.get("processed_leads", []):
-            lead_id = str(uuid.uuid4())
-            processed_leads_store[lead_id] = {
-                "lead_id": lead_id,
-                **processed,
-                "processed_at": datetime.now().isoformat()
-            }
-        
-        # Extract error details from failed leads for better debugging
-        failed_errors = []
-        if results.get("failed_leads"):
-            for failed in results.get("failed_leads", [])[:3]:  # Show first 3 errors
-                failed_errors.append({
-                    "lead_title": failed.get("lead", {}).get("title", failed.get("lead", {}).get("name", "Unknown"))[:50],
-                    "error": failed.get("error", "Unknown error")
-                })
-        
-        return {
-            "status": "success",
-            "summary": results.get("summary", {}),
-            "scrape_results": {
-                "total": results.get("scrape_results", {}).get("total", 0),
-                "reddit": len(results.get("scrape_results", {}).get("reddit", [])),
-                "linkedin": len(results.get("scrape_results", {}).get("linkedin", []))
-            },
-            "processed_leads_count": len(results.get("processed_leads", [])),
-            "failed_leads_count": len(results.get("failed_leads", [])),
-            "processed_leads": results.get("processed_leads", []),
-            "failed_leads_errors": failed_errors,  # Include error details
-            "timestamp": datetime.now().isoformat()
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Pipeline error: {str(e)}")
+    job = await job_queue.wait(_submit_scrape_and_process(request).job_id)
+    if job.status != JobStatus.COMPLETED:
+        raise HTTPException(status_code=500, detail=f"Pipeline error: {job.error}")
+    
+    return {**job.result, "job_id": job.job_id}
+
+
+@app.post("/api/jobs/scrape-and-process", status_code=202)
+async def submit_scrape_and_process_job(request: ScrapeAndProcessRequest):
+    """
+    Queue the scrape-and-process pipeline and return its job ID immediately
+    
+    Poll GET /api/jobs/{job_id} for progress and the final result.
+    """
+    job = _submit_scrape_and_process(request)
+    return {
+        "status": "accepted",
+        "job_id": job.job_id,
+        "status_url": f"/api/jobs/{job.job_id}",
+        "job": job.to_dict(include_result=False)
+    }
+
+
+@app.get("/api/jobs")
+async def list_jobs(limit: int = 20, offset: int = 0, status: Optional[str] = None):
+    """
+    List background jobs, newest first (results omitted)
+    """
+    total, jobs = job_queue.list_jobs(limit=limit, offset=offset, status=status)
+    return {
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+        "jobs": [job.to_dict(include_result=False) for job in jobs]
+    }
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str):
+    """
+    Get a background job's status, progress and (once completed) result
+    """
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.to_dict()
 
 
 @app.get("/api/leads")
-async def get_all_leads(limit: int = 10, offset: int = 0):
+async def get_all_leads(
+    limit: int = 10,
+    offset: int = 0,
+    source: Optional[str] = None,
+    status: Optional[str] = None,
+    min_score: Optional[float] = None,
+    approved: Optional[bool] = None,
+    fields: Optional[str] = None
+):
     """
     Get all processed leads
     
-    Returns a list of processed leads with pagination
+    Returns a page of lead summaries (lead_id, source, title, buyability_score,
+    status, processed_at), optionally filtered by source, status, minimum
+    buyability score and auditor approval. Pass fields= (comma separated, dotted
+    paths allowed, e.g. "title,audit.feedback") to pick other fields; the full
+    record is served by /api/leads/{lead_id}.
     """
-    leads_list = list(processed_leads_store.values())
+    try:
+        selected = parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    # Simple pagination
-    total = len(leads_list)
-    paginated_leads = leads_list[offset:offset + limit]
+    total, paginated_leads = lead_store.list_leads(
+        limit=limit,
+        offset=offset,
+        source=source,
+        status=status,
+        min_score=min_score,
+        approved=approved,
+        fields=selected
+    )
     
     return {
         "total": total,
         "limit": limit,
         "offset": offset,
+        "fields": selected,
         "leads": paginated_leads
     }
 
@@ -330,10 +476,10 @@ async def get_lead_by_id(
     If the lead has buyability_score >= 80, it's protected and requires payment.
     Pass access_token if you've already paid for the lead.
     """
-    if lead_id not in processed_leads_store:
+    lead_data = lead_store.get(lead_id)
+    if lead_data is None:
         raise HTTPException(status_code=404, detail="Lead not found")
     
-    lead_data = processed_leads_store[lead_id]
     buyability_score = lead_data.get("buyability_score")
     
     # Check if lead is protected (high-value lead)
@@ -368,10 +514,9 @@ async def delete_lead(lead_id: str):
     """
     Delete a processed lead
     """
-    if lead_id not in processed_leads_store:
+    if not lead_store.delete(lead_id):
         raise HTTPException(status_code=404, detail="Lead not found")
     
-    del processed_leads_store[lead_id]
     return {"status": "success", "message": f"Lead {lead_id} deleted"}
 
 
@@ -386,12 +531,12 @@ async def unlock_lead(request: UnlockRequest):
         print(f"🔓 Unlock request received for lead_id: {request.lead_id}")
         print(f"   Payment method: {request.payment_method}")
         
-        if request.lead_id not in processed_leads_store:
+        lead_data = lead_store.get(request.lead_id)
+        if lead_data is None:
             print(f"   ❌ Lead {request.lead_id} not found in store")
-            print(f"   Available leads: {list(processed_leads_store.keys())[:5]}")
+            print(f"   Available leads: {lead_store.lead_ids(5)}")
             raise HTTPException(status_code=404, detail=f"Lead {request.lead_id} not found")
         
-        lead_data = processed_leads_store[request.lead_id]
         buyability_score = lead_data.get("buyability_score")
         
         print(f"   Lead found, buyability_score: {buyability_score}")
@@ -448,7 +593,7 @@ async def get_payment_status(lead_id: str, access_token: Optional[str] = None):
     """
     Check payment status for a lead
     """
-    if lead_id not in processed_leads_store:
+    if lead_id not in lead_store:
         raise HTTPException(status_code=404, detail="Lead not found")
     
     payment_status = await nevermined_middleware.verify_payment(lead_id, access_token)
@@ -463,23 +608,25 @@ async def get_payment_status(lead_id: str, access_token: Optional[str] = None):
 
 
 @app.get("/api/protected-assets")
-async def get_protected_assets(limit: int = 10, offset: int = 0):
+async def get_protected_assets(limit: int = 10, offset: int = 0, fields: Optional[str] = None):
     """
     Get list of protected assets (high-value leads ready for monetization)
+    
+    Returns lead summaries like /api/leads, with the same fields= projection.
     """
-    # Filter leads with buyability_score >= 80
-    protected_leads = [
-        lead for lead in processed_leads_store.values()
-        if lead.get("buyability_score") and lead.get("buyability_score") >= 80
-    ]
+    try:
+        selected = parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    total = len(protected_leads)
-    paginated = protected_leads[offset:offset + limit]
+    # Filter leads with buyability_score >= 80 (served from the score index)
+    total, paginated = lead_store.list_leads(limit=limit, offset=offset, min_score=80, fields=selected)
     
     return {
         "total": total,
         "limit": limit,
         "offset": offset,
+        "fields": selected,
         "protected_assets": paginated
     }
 
@@ -608,7 +755,7 @@ async def add_test_leads():
             "status": "processed",
             "processed_at": datetime.now().isoformat()
         }
-        processed_leads_store[lead_id] = full_lead
+        lead_store.put(full_lead)
         added_leads.append({
             "lead_id": lead_id,
             "title": lead_data["original_lead"]["title"],
@@ -619,7 +766,7 @@ async def add_test_leads():
         "status": "success",
         "message": f"Added {len(added_leads)} test leads",
         "leads": added_leads,
-        "total_leads": len(processed_leads_store)
+        "total_leads": len(lead_store)
     }
 
 
@@ -628,15 +775,20 @@ async def get_stats():
     """
     Get statistics about processed leads
     """
-    total_leads = len(processed_leads_store)
-    successful = sum(1 for lead in processed_leads_store.values() if lead.get("status") == "processed")
+    counts = lead_store.stats()
+    total_leads = counts["total"]
+    successful = counts["successful"]
     failed = total_leads - successful
     
     return {
         "total_leads": total_leads,
         "successful": successful,
         "failed": failed,
-        "success_rate": (successful / total_leads * 100) if total_leads > 0 else 0
+        "protected_assets": counts["protected"],
+        "success_rate": (successful / total_leads * 100) if total_leads > 0 else 0,
+        "result_cache": result_cache.stats(),
+        "usage": usage_tracker.stats(),
+        "rate_limiter": rate_limiter.stats()
     }
 
 
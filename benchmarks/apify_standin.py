@@ -0,0 +1,491 @@
+"""
+Offline Apify Stand-in
+Local HTTP server speaking the slice of the Apify API that ApifyLeadScraper uses
+(actor runs, run waits/aborts/logs, dataset items), replaying recorded datasets for
+the Reddit and LinkedIn actors with configurable run latency, failures and size
+
+Usage:
+    python benchmarks/apify_standin.py --port 8765 --latency 2 --failure-rate 0.1 --dataset-size 200
+    APIFY_API_URL=http://127.0.0.1:8765 APIFY_API_TOKEN=offline python integrate_scraper_agents.py
+
+    # Capture a real dataset (costs nothing extra - the run already happened)
+    python benchmarks/apify_standin.py --record <dataset_id> --fixture reddit-scraper
+
+In code:
+    with ApifyStandin(latency=0.5, dataset_size=100) as api_url:
+        scraper = ApifyLeadScraper(api_token="offline", api_url=api_url)
+
+Replayed items keep the fixture's fields. IDs, URLs and dates are rewritten so each
+search (query + subreddit/region) gets its own stable set of posts, newest first at
+one post per --item-interval minutes before server start. The same search returns
+the same posts on every run; sort and date-range inputs are honored.
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+DEFAULT_FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# Longest waitForFinish the real API honors per request
+MAX_WAIT_SECONDS = 60
+
+# Actor endpoints: apify-client 1.x/2.x use /v2/acts, 3.x uses /v2/actors
+ACTOR_RESOURCES = ("acts", "actors")
+
+# LinkedIn "date_posted" filters
+DATE_WINDOWS = {
+    "Past 24 hours": timedelta(days=1),
+    "Past week": timedelta(days=7),
+    "Past month": timedelta(days=30),
+}
+
+
+@dataclass(frozen=True)
+class ActorFixture:
+    """How to replay one actor's recorded dataset"""
+    fixture: str
+    id_field: str
+    url_field: str
+    time_field: str
+    search_fields: Tuple[str, ...]
+    date_only: bool = False
+    limit_field: Optional[str] = None
+    sort_field: Optional[str] = None
+    window_field: Optional[str] = None
+    scope_field: Optional[str] = None
+    scope_item_field: Optional[str] = None
+
+
+ACTORS = {
+    "benthepythondev/reddit-scraper": ActorFixture(
+        fixture="reddit-scraper",
+        id_field="id",
+        url_field="url",
+        time_field="createdAt",
+        search_fields=("searchQuery", "searchSubreddit"),
+        limit_field="maxPosts",
+        sort_field="sort",
+        scope_field="searchSubreddit",
+        scope_item_field="subreddit",
+    ),
+    "freshdata/linkedin-job-scraper": ActorFixture(
+        fixture="linkedin-job-scraper",
+        id_field="jobId",
+        url_field="jobUrl",
+        time_field="postedDate",
+        search_fields=("keywords", "geo_code"),
+        date_only=True,
+        window_field="date_posted",
+    ),
+}
+
+
+def load_fixture(name: str, fixtures_dir: str = DEFAULT_FIXTURES_DIR) -> List[Dict[str, Any]]:
+    with open(os.path.join(fixtures_dir, f"{name}.json")) as f:
+        return json.load(f)
+
+
+def _iso(moment: datetime) -> str:
+    return moment.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+class ApifyStandin:
+    """
+    In-process stand-in for the Apify API
+
+    Runs take `latency` seconds (plus up to `latency_jitter`), end FAILED with
+    probability `failure_rate`, and produce `dataset_size` items (default: the
+    fixture's size). Failures and replayed content are seeded, so a benchmark
+    sees the same runs every time.
+    """
+
+    def __init__(self,
+                 latency: float = 1.0,
+                 latency_jitter: float = 0.0,
+                 failure_rate: float = 0.0,
+                 dataset_size: int = None,
+                 page_latency: float = 0.0,
+                 item_interval_minutes: float = 60,
+                 seed: int = 0,
+                 fixtures_dir: str = DEFAULT_FIXTURES_DIR):
+        """
+        Initialize the stand-in
+
+        Args:
+            latency: Seconds from run start to finish
+            latency_jitter: Extra random seconds (0..jitter) added per run
+            failure_rate: Fraction of runs that end with status FAILED
+            dataset_size: Items per run before actor limits (maxPosts) and date filters
+            page_latency: Seconds added to every dataset items page request
+            item_interval_minutes: Gap between the posting times of consecutive items
+            seed: Seed for failures, jitter and replayed content
+            fixtures_dir: Directory of <fixture>.json recorded datasets
+        """
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.failure_rate = failure_rate
+        self.dataset_size = dataset_size
+        self.page_latency = page_latency
+        self.item_interval = timedelta(minutes=item_interval_minutes)
+        self.seed = seed
+        self.fixtures = {actor: load_fixture(spec.fixture, fixtures_dir) for actor, spec in ACTORS.items()}
+        self.anchor = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+
+        self._rng = random.Random(seed)
+        self._runs: Dict[str, Dict[str, Any]] = {}
+        self._datasets: Dict[str, List[Dict[str, Any]]] = {}
+        self._changed = threading.Condition()
+        self._counters = {"requests": 0, "runs": 0, "failed_runs": 0, "aborted_runs": 0, "items_served": 0,
+                          "item_bytes_served": 0}
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    # ---- Replay ----
+
+    def generate_items(self, actor: str, run_input: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Dataset a run of `actor` with `run_input` produces"""
+        spec, fixture = ACTORS[actor], self.fixtures[actor]
+        search = json.dumps([run_input.get(field) for field in spec.search_fields], default=str)
+        tag = hashlib.blake2b(f"{self.seed}|{actor}|{search}".encode(), digest_size=3).hexdigest()
+        rng = random.Random(tag)
+        order = list(range(len(fixture)))
+        rng.shuffle(order)
+        scope = str(run_input.get(spec.scope_field) or "") if spec.scope_field else ""
+
+        items = []
+        for n in range(self.dataset_size or len(fixture)):
+            base = fixture[order[n % len(fixture)]]
+            posted = self.anchor - n * self.item_interval
+            window = DATE_WINDOWS.get(run_input.get(spec.window_field)) if spec.window_field else None
+            if window is not None and self.anchor - posted > window:
+                break
+            item = dict(base)
+            item[spec.id_field] = f"{base.get(spec.id_field, 'item')}-{tag}{n}"
+            item[spec.url_field] = f"{str(base.get(spec.url_field, '')).rstrip('/')}-{tag}{n}/"
+            item[spec.time_field] = posted.date().isoformat() if spec.date_only else _iso(posted)
+            if scope and spec.scope_item_field:
+                item[spec.scope_item_field] = scope
+            items.append(item)
+
+        if spec.sort_field and run_input.get(spec.sort_field) != "new":
+            rng.shuffle(items)  # relevance order
+        if spec.limit_field and run_input.get(spec.limit_field):
+            items = items[:int(run_input[spec.limit_field])]
+        return items
+
+    # ---- Runs ----
+
+    def _status(self, state: Dict[str, Any]) -> str:
+        if state["aborted"]:
+            return "ABORTED"
+        if time.monotonic() < state["finish_at"]:
+            return "RUNNING"
+        return "FAILED" if state["fail"] else "SUCCEEDED"
+
+    def _run_view(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        status = self._status(state)
+        run = dict(state["run"], status=status)
+        if status != "RUNNING":
+            run["finishedAt"] = _iso(datetime.now(timezone.utc) if state["aborted"] else state["finished_at"])
+        return run
+
+    def start_run(self, actor: str, run_input: Dict[str, Any]) -> Dict[str, Any]:
+        with self._changed:
+            delay = self.latency + (self._rng.uniform(0, self.latency_jitter) if self.latency_jitter else 0)
+            fail = self._rng.random() < self.failure_rate
+            run_id = uuid.uuid4().hex[:17]
+            dataset_id = uuid.uuid4().hex[:17]
+            now = datetime.now(timezone.utc)
+            self._runs[run_id] = {
+                "run": {
+                    "id": run_id,
+                    "actId": actor,
+                    "userId": "offline",
+                    "startedAt": _iso(now),
+                    "finishedAt": None,
+                    "buildId": "offline",
+                    "defaultDatasetId": dataset_id,
+                    "defaultKeyValueStoreId": uuid.uuid4().hex[:17],
+                    "defaultRequestQueueId": uuid.uuid4().hex[:17],
+                    "options": {"build": "latest", "timeoutSecs": 3600, "memoryMbytes": 1024, "diskMbytes": 2048},
+                    "stats": {},
+                    "meta": {"origin": "API"},
+                },
+                "finish_at": time.monotonic() + delay,
+                "finished_at": now + timedelta(seconds=delay),
+                "fail": fail,
+                "aborted": False,
+            }
+            self._datasets[dataset_id] = [] if fail else self.generate_items(actor, run_input)
+            self._counters["runs"] += 1
+            self._counters["failed_runs"] += int(fail)
+            return self._run_view(self._runs[run_id])
+
+    def wait_run(self, run_id: str, wait_seconds: float) -> Optional[Dict[str, Any]]:
+        """Run record, after waiting up to wait_seconds for it to finish"""
+        deadline = time.monotonic() + min(wait_seconds, MAX_WAIT_SECONDS)
+        with self._changed:
+            state = self._runs.get(run_id)
+            if state is None:
+                return None
+            while self._status(state) == "RUNNING":
+                remaining = min(deadline, state["finish_at"]) - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._changed.wait(remaining)
+            return self._run_view(state)
+
+    def abort_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        with self._changed:
+            state = self._runs.get(run_id)
+            if state is None:
+                return None
+            if self._status(state) == "RUNNING":
+                state["aborted"] = True
+                self._datasets[state["run"]["defaultDatasetId"]] = []
+                self._counters["aborted_runs"] += 1
+                self._changed.notify_all()
+            return self._run_view(state)
+
+    def dataset_items(self, dataset_id: str, params: Dict[str, str]) -> Optional[Tuple[List[Dict[str, Any]], int, int, int]]:
+        """(page, total, offset, limit) of a dataset items request"""
+        with self._changed:
+            items = self._datasets.get(dataset_id)
+            run = next((s for s in self._runs.values() if s["run"]["defaultDatasetId"] == dataset_id), None)
+            if items is None:
+                return None
+            # Items only appear once the run has finished
+            if run is not None and self._status(run) == "RUNNING":
+                items = []
+        if params.get("desc") in ("1", "true"):
+            items = items[::-1]
+        offset = int(params.get("offset") or 0)
+        limit = int(params.get("limit") or 999999999999)
+        page = items[offset:offset + limit]
+        if params.get("fields"):
+            fields = params["fields"].split(",")
+            page = [{field: item[field] for field in fields if field in item} for item in page]
+        if params.get("omit"):
+            omit = set(params["omit"].split(","))
+            page = [{k: v for k, v in item.items() if k not in omit} for item in page]
+        with self._changed:
+            self._counters["items_served"] += len(page)
+            self._counters["item_bytes_served"] += len(json.dumps(page))
+        if self.page_latency:
+            time.sleep(self.page_latency)
+        return page, len(items), offset, limit
+
+    def stats(self) -> Dict[str, int]:
+        with self._changed:
+            return dict(self._counters)
+
+    # ---- HTTP ----
+
+    def handle(self, method: str, path: str, query: Dict[str, str], body: Any) -> Tuple[int, Any, Dict[str, str]]:
+        """Route one API request to (status, JSON body, extra headers)"""
+        with self._changed:
+            self._counters["requests"] += 1
+        parts = [unquote(part) for part in path.strip("/").split("/")]
+        if parts[:1] == ["v2"]:
+            parts = parts[1:]
+
+        if method == "GET" and len(parts) == 2 and parts[0] in ACTOR_RESOURCES:
+            actor = parts[1].replace("~", "/")
+            if actor not in ACTORS:
+                return 404, _error("record-not-found", f"Actor {actor} was not found"), {}
+            username, name = actor.split("/", 1)
+            created = _iso(self.anchor)
+            return 200, {"data": {
+                "id": actor, "userId": username, "name": name, "username": username, "isPublic": True,
+                "createdAt": created, "modifiedAt": created, "stats": {}, "versions": [], "defaultRunOptions": {},
+            }}, {}
+
+        if method == "POST" and len(parts) == 3 and parts[0] in ACTOR_RESOURCES and parts[2] == "runs":
+            actor = parts[1].replace("~", "/")
+            if actor not in ACTORS:
+                return 404, _error("record-not-found", f"Actor {actor} was not found"), {}
+            run = self.start_run(actor, body if isinstance(body, dict) else {})
+            if query.get("waitForFinish"):
+                run = self.wait_run(run["id"], float(query["waitForFinish"]))
+            return 201, {"data": run}, {}
+
+        if len(parts) >= 2 and parts[0] == "actor-runs":
+            if method == "GET" and len(parts) == 2:
+                run = self.wait_run(parts[1], float(query.get("waitForFinish") or 0))
+            elif method == "POST" and parts[2:] == ["abort"]:
+                run = self.abort_run(parts[1])
+            elif method == "GET" and parts[2:] == ["log"]:
+                # Replayed runs write no log; the client's log redirection reads an empty stream
+                return 200, "", {}
+            else:
+                return 404, _error("page-not-found", f"{method} {path} is not supported"), {}
+            if run is None:
+                return 404, _error("record-not-found", f"Actor run {parts[1]} was not found"), {}
+            return 200, {"data": run}, {}
+
+        if method == "GET" and len(parts) == 3 and parts[0] == "datasets" and parts[2] == "items":
+            result = self.dataset_items(parts[1], query)
+            if result is None:
+                return 404, _error("record-not-found", f"Dataset {parts[1]} was not found"), {}
+            page, total, offset, limit = result
+            return 200, page, {
+                "x-apify-pagination-total": str(total),
+                "x-apify-pagination-offset": str(offset),
+                "x-apify-pagination-limit": str(limit),
+                "x-apify-pagination-count": str(len(page)),
+                "x-apify-pagination-desc": "1" if query.get("desc") in ("1", "true") else "",
+            }
+
+        return 404, _error("page-not-found", f"{method} {path} is not supported"), {}
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Serve on a background thread and return the API URL (port 0 picks a free port)"""
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _dispatch(self, method):
+                url = urlsplit(self.path)
+                query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+                body = None
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    raw = self.rfile.read(length)
+                    if self.headers.get("Content-Encoding") == "gzip":
+                        raw = gzip.decompress(raw)
+                    try:
+                        body = json.loads(raw)
+                    except ValueError:
+                        body = None
+                status, payload, headers = standin.handle(method, url.path, query, body)
+                if isinstance(payload, str):
+                    data, content_type = payload.encode(), "text/plain; charset=utf-8"
+                else:
+                    data, content_type = json.dumps(payload).encode(), "application/json; charset=utf-8"
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                self._dispatch("GET")
+
+            def do_POST(self):
+                self._dispatch("POST")
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="apify-standin", daemon=True)
+        self._thread.start()
+        return self.url
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> str:
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def _error(error_type: str, message: str) -> Dict[str, Any]:
+    return {"error": {"type": error_type, "message": message}}
+
+
+def record_fixture(dataset_id: str, fixture: str, limit: int = 200,
+                   api_token: str = None, fixtures_dir: str = DEFAULT_FIXTURES_DIR) -> str:
+    """
+    Save a real Apify dataset as a replay fixture
+
+    Args:
+        dataset_id: Dataset of a finished actor run
+        fixture: Fixture name (reddit-scraper or linkedin-job-scraper)
+        limit: Maximum items to keep
+        api_token: Apify API token (defaults to APIFY_API_TOKEN)
+
+    Returns:
+        Path of the written fixture
+    """
+    from apify_client import ApifyClient
+
+    client = ApifyClient(api_token or os.getenv("APIFY_API_TOKEN"))
+    items = list(client.dataset(dataset_id).iterate_items(limit=limit))
+    path = os.path.join(fixtures_dir, f"{fixture}.json")
+    with open(path, "w") as f:
+        json.dump(items, f, indent=2, default=str)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve recorded Apify datasets locally")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=1.0, help="Seconds per actor run")
+    parser.add_argument("--latency-jitter", type=float, default=0.0, help="Extra random seconds per run")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Fraction of runs that fail (0-1)")
+    parser.add_argument("--dataset-size", type=int, default=None, help="Items per run (default: fixture size)")
+    parser.add_argument("--page-latency", type=float, default=0.0, help="Seconds per dataset page request")
+    parser.add_argument("--item-interval", type=float, default=60, help="Minutes between consecutive posts")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES_DIR, help="Directory of recorded datasets")
+    parser.add_argument("--record", metavar="DATASET_ID", help="Save a real dataset as a fixture and exit")
+    parser.add_argument("--fixture", choices=[spec.fixture for spec in ACTORS.values()],
+                        help="Fixture written by --record")
+    args = parser.parse_args()
+
+    if args.record:
+        if not args.fixture:
+            parser.error("--record needs --fixture")
+        path = record_fixture(args.record, args.fixture, fixtures_dir=args.fixtures)
+        print(f"✅ Recorded dataset {args.record} to {path}")
+        return
+
+    standin = ApifyStandin(
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        failure_rate=args.failure_rate,
+        dataset_size=args.dataset_size,
+        page_latency=args.page_latency,
+        item_interval_minutes=args.item_interval,
+        seed=args.seed,
+        fixtures_dir=args.fixtures,
+    )
+    url = standin.start(args.host, args.port)
+    print(f"🛰️  Apify stand-in listening on {url}")
+    print(f"   export APIFY_API_URL={url} APIFY_API_TOKEN=offline")
+    try:
+        while True:
+            time.sleep(60)
+            print(f"   {standin.stats()}")
+    except KeyboardInterrupt:
+        standin.stop()
+
+
+if __name__ == "__main__":
+    main()
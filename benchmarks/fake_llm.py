@@ -0,0 +1,158 @@
+"""
+Benchmark Stand-ins for the LLM and the Scraper
+A deterministic CrewAI LLM with configurable per-call latency and canned agent
+outputs, and a scraper that returns synthetic leads built from the Apify fixtures
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, List
+
+from crewai import BaseLLM
+
+from tools.lead_model import Lead
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+CHARS_PER_TOKEN = 4
+
+# Canned answer per agent, picked by a keyword of the agent's role
+CANNED_OUTPUTS = {
+    "Intent Data Analyst": (
+        "1. {author} - Trigger Text: \"{trigger}\" - Confidence Score: {confidence}/10"
+    ),
+    "Business Intelligence Analyst": (
+        "Lead: {author}\nIndustry: B2B SaaS\nCompany size: 10-50 employees\n"
+        "Pain points: manual processes, tooling that does not scale\n"
+        "Likely budget: $500-2,000/month\nDecision maker: founder or head of operations"
+    ),
+    "Strategic Growth Copywriter": (
+        "Hi {author} - saw your post about \"{trigger}\". We help teams like yours replace "
+        "spreadsheets with a tool that fits in a day, not a quarter. Worth a 15-minute look?"
+    ),
+    "Quality Assurance": (
+        '{{"buyability_score": {score}, "is_approved": {approved}, '
+        '"protected_asset": {asset}, "mcp_notification": {notification}, '
+        '"feedback": "Clear trigger, plausible budget; pitch references the exact pain."}}'
+    ),
+}
+
+
+def _digest(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "big")
+
+
+class FakeLLM(BaseLLM):
+    """
+    CrewAI LLM that sleeps instead of calling a provider
+
+    Every call takes `latency` seconds plus up to `jitter` seconds, derived from a hash
+    of the prompt, so repeated runs are identical. Answers are canned per agent
+    and the auditor's score comes from the lead text. Token usage (4 characters
+    per token) is tracked like a real provider, so usage metrics and cost
+    estimates still work.
+    """
+
+    latency: float = 0.05
+    jitter: float = 0.0
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None, response_model=None) -> str:
+        if isinstance(messages, str):
+            prompt = messages
+        else:
+            prompt = "\n".join(str(message.get("content") or "") for message in messages)
+        digest = _digest(prompt)
+        time.sleep(self.latency + self.jitter * (digest % 1000) / 1000)
+
+        answer = "Final Answer: " + self.answer(getattr(from_agent, "role", "") or prompt, prompt, digest)
+        response = "Thought: I now can give a great answer\n" + answer
+        prompt_tokens = len(prompt) // CHARS_PER_TOKEN
+        completion_tokens = len(response) // CHARS_PER_TOKEN
+        self._track_token_usage_internal({
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        })
+        return response
+
+    @staticmethod
+    def answer(role: str, prompt: str, digest: int) -> str:
+        """Canned output of the agent with this role, filled from the prompt"""
+        template = next((text for key, text in CANNED_OUTPUTS.items() if key in role), "Done.")
+        author = "the team"
+        for line in prompt.splitlines():
+            if line.strip().startswith(("Author:", "Company:")):
+                author = line.split(":", 1)[1].strip() or author
+                break
+        # The lead text fixes the score, so every agent call for one lead agrees
+        lead_digest = _digest(prompt[prompt.find("Lead Data"):][:2000]) if "Lead Data" in prompt else digest
+        score = 55 + lead_digest % 41
+        approved = score >= 80
+        return template.format(
+            author=author,
+            trigger="looking for a better tool",
+            confidence=3 + lead_digest % 8,
+            score=score,
+            approved=json.dumps(approved),
+            asset=json.dumps({"tier": "premium"} if approved else None),
+            notification=json.dumps({"notification_type": "high_value_lead_ready"} if approved else None),
+        )
+
+    def supports_function_calling(self) -> bool:
+        return False
+
+    def get_context_window_size(self) -> int:
+        return 128000
+
+
+def build_leads(count: int, tag: str = "bench") -> List[Lead]:
+    """
+    Synthetic scraped leads, as ApifyLeadScraper yields them
+
+    Alternates Reddit posts and LinkedIn jobs from the fixtures; `tag` makes URLs
+    unique so leads from different benchmark runs never hit each other's cache.
+    """
+    with open(os.path.join(FIXTURES_DIR, "reddit-scraper.json")) as f:
+        posts = json.load(f)
+    with open(os.path.join(FIXTURES_DIR, "linkedin-job-scraper.json")) as f:
+        jobs = json.load(f)
+
+    leads = []
+    for n in range(count):
+        if n % 2 == 0:
+            item = posts[(n // 2) % len(posts)]
+            item = {**item, "url": f"{item['url'].rstrip('/')}-{tag}-{n}/"}
+            leads.append(Lead.from_reddit(item, item["subreddit"], raw_fields=["id"]))
+        else:
+            item = jobs[(n // 2) % len(jobs)]
+            item = {**item, "jobUrl": f"{item['jobUrl'].rstrip('/')}-{tag}-{n}/"}
+            leads.append(Lead.from_linkedin(item, raw_fields=["jobId", "applicants"]))
+    return leads
+
+
+class StubScraper:
+    """Drop-in for ApifyLeadScraper in scrape_and_process_leads, serving preset leads"""
+
+    leads: List[Dict[str, Any]] = []
+    latency: float = 0.0
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def scrape_all(self, keywords: List[str], reddit_subreddits: List[str] = None,
+                   linkedin_location: str = None, max_per_source: int = 50) -> Dict[str, List[Dict[str, Any]]]:
+        time.sleep(self.latency)
+        results = {
+            "reddit": [lead for lead in self.leads if lead["source"] == "reddit"],
+            "linkedin": [lead for lead in self.leads if lead["source"] == "linkedin"],
+        }
+        results["total"] = len(self.leads)
+        return results
+
+    @classmethod
+    def serving(cls, leads: List[Dict[str, Any]], latency: float = 0.0) -> type:
+        """A StubScraper class whose instances return `leads` after `latency` seconds"""
+        return type("StubScraper", (cls,), {"leads": leads, "latency": latency})
@@ -0,0 +1,366 @@
+"""
+End-to-End Pipeline Benchmark
+Runs scrape_and_process_leads and the /api/process endpoint against a deterministic
+fake LLM and a stub scraper, and measures throughput, per-lead latency, event-loop
+blocking and peak memory
+
+Usage:
+    python benchmarks/pipeline_benchmark.py
+    python benchmarks/pipeline_benchmark.py --sizes 1,10,100 --modes pipeline --llm-latency 0.02
+    python benchmarks/pipeline_benchmark.py --compare benchmarks/results/pipeline-abc1234.json
+
+No network or API keys are needed: every agent call sleeps for --llm-latency seconds
+and returns a canned answer, so the numbers measure the pipeline's own overhead and
+concurrency. Results are written as JSON (benchmarks/results/pipeline-<commit>.json by
+default) so runs on different commits can be compared with --compare.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+# Add project root to path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Keep every store in memory and the rate limiter out of the way before the repo reads its config
+for _name, _value in {
+    "RESULT_CACHE_DB": ":memory:",
+    "STEP_CACHE_DB": ":memory:",
+    "LEAD_DEDUP_DB": ":memory:",
+    "SCRAPE_CURSOR_DB": ":memory:",
+    "LEAD_STORE_BACKEND": "memory",
+    "OPENAI_API_KEY": "sk-benchmark",
+    "OPENAI_RPM": "1000000",
+    "OPENAI_TPM": "1000000000",
+    "CREWAI_DISABLE_TELEMETRY": "true",
+    "OTEL_SDK_DISABLED": "true",
+}.items():
+    os.environ.setdefault(_name, _value)
+
+import agents.crew_setup as crew_setup
+import integrate_scraper_agents
+from benchmarks.fake_llm import FakeLLM, StubScraper, build_leads
+from benchmarks.routing_benchmark import percentile
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+# Metrics compared by --compare, and whether a higher value is better
+COMPARED_METRICS = {
+    "leads_per_minute": True,
+    "latency_p50_seconds": False,
+    "latency_p95_seconds": False,
+    "latency_p99_seconds": False,
+    "loop_lag_max_ms": False,
+    "loop_blocked_seconds": False,
+    "peak_rss_mb": False,
+}
+
+
+def git_commit() -> str:
+    """Short commit hash of the tree being benchmarked ("-dirty" with uncommitted changes)"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "diff", "--quiet", "HEAD"], cwd=ROOT).returncode != 0
+        return commit + ("-dirty" if dirty else "")
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def rss_mb() -> float:
+    """Current resident set size in MB (peak RSS where /proc is unavailable)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10
+
+
+@contextlib.contextmanager
+def quiet(enabled: bool = True):
+    """Send stdout (crew logs included, which write straight to the file descriptor) to /dev/null"""
+    if not enabled:
+        yield
+        return
+    sys.stdout.flush()
+    saved = os.dup(1)
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    try:
+        with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+            yield
+    finally:
+        sys.stdout.flush()
+        os.dup2(saved, 1)
+        os.close(saved)
+        os.close(devnull)
+
+
+class LoopMonitor:
+    """
+    Measures how long the event loop is blocked while a scenario runs
+
+    A task sleeps `interval` seconds at a time; any time it wakes up late is time
+    the loop could not serve other requests. Also samples RSS on every tick.
+    """
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.lags: List[float] = []
+        self.peak_rss_mb = rss_mb()
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.lags.append(max(0.0, time.perf_counter() - started - self.interval))
+            self.peak_rss_mb = max(self.peak_rss_mb, rss_mb())
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "loop_lag_max_ms": round(max(self.lags, default=0.0) * 1000, 2),
+            "loop_lag_p99_ms": round(percentile(self.lags, 99) * 1000, 2),
+            # Lag under 5ms is timer noise, not blocking
+            "loop_blocked_seconds": round(sum(lag for lag in self.lags if lag > 0.005), 3),
+        }
+
+
+def install_fakes(llm_latency: float, llm_jitter: float, concurrency: int) -> None:
+    """Route every crew to the fake LLM and size the crew limits for the run"""
+    def build_crew():
+        return crew_setup.create_lead_processing_crew(
+            llm=FakeLLM(model="fake-llm", latency=llm_latency, jitter=llm_jitter)
+        )
+
+    crew_setup.crew_pool = crew_setup.CrewPool(factory=build_crew, max_idle=concurrency)
+    crew_setup.crew_slots = threading.BoundedSemaphore(concurrency)
+
+
+def timed(func: Callable[..., Dict[str, Any]], timings: List[Dict[str, Any]]) -> Callable[..., Dict[str, Any]]:
+    """Wrap process_lead so every call's latency and usage are recorded"""
+    def wrapper(lead_data, *args, **kwargs):
+        started = time.perf_counter()
+        result = func(lead_data, *args, **kwargs)
+        timings.append({
+            "latency_seconds": time.perf_counter() - started,
+            "success": bool(result.get("success")),
+            "total_tokens": (result.get("usage") or {}).get("total_tokens", 0),
+        })
+        return result
+    return wrapper
+
+
+async def run_pipeline(leads: List[Dict[str, Any]], concurrency: int) -> None:
+    """scrape_and_process_leads over the stub scraper's leads, off the event loop like the job queue"""
+    scraper = integrate_scraper_agents.ApifyLeadScraper
+    integrate_scraper_agents.ApifyLeadScraper = StubScraper.serving(leads)
+    loop = asyncio.get_running_loop()
+    try:
+        result = await loop.run_in_executor(None, lambda: integrate_scraper_agents.scrape_and_process_leads(
+            keywords=["need", "hiring"],
+            max_per_source=len(leads),
+            process_limit=len(leads),
+            # Synthetic leads reuse fixture text - dedup would collapse them
+            deduplicate=False,
+            prefilter_min_score=0,
+            max_concurrent_leads=concurrency,
+        ))
+    finally:
+        integrate_scraper_agents.ApifyLeadScraper = scraper
+    if result.get("error"):
+        raise RuntimeError(result["error"])
+
+
+async def run_api(app: Any, leads: List[Dict[str, Any]]) -> List[float]:
+    """Every lead POSTed to /api/process at once, in-process over ASGI; returns request latencies"""
+    import httpx
+
+    async def post(client, lead):
+        started = time.perf_counter()
+        response = await client.post("/api/process", json={"lead_data": lead.to_dict()})
+        response.raise_for_status()
+        return time.perf_counter() - started
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=None) as client:
+        return list(await asyncio.gather(*(post(client, lead) for lead in leads)))
+
+
+async def run_scenario(mode: str, size: int, concurrency: int, trace_memory: bool) -> Dict[str, Any]:
+    """Run one (mode, lead count) scenario and summarize it"""
+    leads = build_leads(size, tag=f"{mode}-{size}-{time.time_ns()}")
+    timings: List[Dict[str, Any]] = []
+    original = integrate_scraper_agents.process_lead
+    integrate_scraper_agents.process_lead = timed(original, timings)
+    process_lead = crew_setup.process_lead
+    crew_setup.process_lead = timed(process_lead, timings) if mode == "api" else process_lead
+
+    if mode == "api":
+        # Imported here so pipeline-only runs don't need fastapi; before the monitor starts
+        from api.main import app
+
+    monitor = LoopMonitor()
+    if trace_memory:
+        tracemalloc.start()
+    rss_before = rss_mb()
+    monitor.start()
+    started = time.perf_counter()
+    request_latencies: List[float] = []
+    try:
+        if mode == "pipeline":
+            await run_pipeline(leads, concurrency)
+        else:
+            request_latencies = await run_api(app, leads)
+    finally:
+        wall = time.perf_counter() - started
+        await monitor.stop()
+        integrate_scraper_agents.process_lead = original
+        crew_setup.process_lead = process_lead
+
+    latencies = [timing["latency_seconds"] for timing in timings if timing["success"]]
+    summary = {
+        "mode": mode,
+        "leads": size,
+        "processed": len(latencies),
+        "failed": len(timings) - len(latencies),
+        "wall_seconds": round(wall, 3),
+        "leads_per_minute": round(len(latencies) / wall * 60, 2) if wall else 0.0,
+        "latency_p50_seconds": round(percentile(latencies, 50), 4),
+        "latency_p95_seconds": round(percentile(latencies, 95), 4),
+        "latency_p99_seconds": round(percentile(latencies, 99), 4),
+        "latency_mean_seconds": round(sum(latencies) / len(latencies), 4) if latencies else 0.0,
+        **monitor.summary(),
+        "peak_rss_mb": round(monitor.peak_rss_mb, 1),
+        "rss_growth_mb": round(rss_mb() - rss_before, 1),
+        "total_tokens": sum(timing["total_tokens"] for timing in timings),
+    }
+    if request_latencies:
+        summary["request_p50_seconds"] = round(percentile(request_latencies, 50), 4)
+        summary["request_p99_seconds"] = round(percentile(request_latencies, 99), 4)
+    if trace_memory:
+        summary["tracemalloc_peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 2 ** 20, 1)
+        tracemalloc.stop()
+    return summary
+
+
+def compare_reports(baseline: Dict[str, Any], report: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Print metric changes against a baseline report
+
+    Args:
+        baseline: Report of an earlier run
+        report: Report of this run
+        threshold: Percent change in the wrong direction counted as a regression
+
+    Returns:
+        Descriptions of the regressions found
+    """
+    previous = {(s["mode"], s["leads"]): s for s in baseline.get("scenarios", [])}
+    regressions = []
+    print(f"\n📊 Compared with {baseline.get('commit', 'baseline')}:")
+    for scenario in report["scenarios"]:
+        before = previous.get((scenario["mode"], scenario["leads"]))
+        if not before:
+            continue
+        print(f"   {scenario['mode']} x{scenario['leads']}:")
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            old, new = before.get(metric), scenario.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old * 100
+            worse = change < -threshold if higher_is_better else change > threshold
+            print(f"      {metric:<24} {old:>10} → {new:<10} ({change:+.1f}%){'  ⚠️' if worse else ''}")
+            if worse:
+                regressions.append(f"{scenario['mode']} x{scenario['leads']} {metric} {change:+.1f}%")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the lead pipeline with a fake LLM and stub scraper")
+    parser.add_argument("--sizes", default="1,10,100,1000", help="Comma separated lead counts")
+    parser.add_argument("--modes", default="pipeline,api",
+                        help="pipeline (scrape_and_process_leads) and/or api (/api/process, needs fastapi and httpx)")
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="Seconds per fake LLM call")
+    parser.add_argument("--llm-jitter", type=float, default=0.0, help="Extra 0..N seconds per call, fixed per prompt")
+    parser.add_argument("--concurrency", type=int, default=4, help="Crews running at once")
+    parser.add_argument("--tracemalloc", action="store_true", help="Also report Python heap peaks (slower)")
+    parser.add_argument("--output", default=None, help="JSON report path (defaults to benchmarks/results/pipeline-<commit>.json)")
+    parser.add_argument("--compare", default=None, help="Earlier JSON report to compare against")
+    parser.add_argument("--regression-threshold", type=float, default=10.0,
+                        help="Percent change counted as a regression by --compare (exit status 1)")
+    parser.add_argument("--verbose", action="store_true", help="Show pipeline and crew output")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    modes = [mode for mode in args.modes.split(",") if mode]
+    install_fakes(args.llm_latency, args.llm_jitter, args.concurrency)
+
+    print("=" * 60)
+    print("Lead Sniper AI - Pipeline Benchmark")
+    print("=" * 60)
+    print(f"Fake LLM: {args.llm_latency * 1000:.0f}ms per call, {args.concurrency} crews at once")
+
+    report = {
+        "benchmark": "pipeline",
+        "timestamp": datetime.now().isoformat(),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            "sizes": sizes,
+            "modes": modes,
+            "llm_latency_seconds": args.llm_latency,
+            "llm_jitter_seconds": args.llm_jitter,
+            "concurrency": args.concurrency,
+        },
+        "scenarios": []
+    }
+    for mode in modes:
+        for size in sizes:
+            print(f"\n⏱️  {mode} with {size} leads...")
+            with quiet(not args.verbose):
+                scenario = asyncio.run(run_scenario(mode, size, args.concurrency, args.tracemalloc))
+            report["scenarios"].append(scenario)
+            print(f"   {scenario['leads_per_minute']:.0f} leads/min, p50 {scenario['latency_p50_seconds']:.3f}s, "
+                  f"p99 {scenario['latency_p99_seconds']:.3f}s, loop lag max {scenario['loop_lag_max_ms']:.1f}ms, "
+                  f"peak RSS {scenario['peak_rss_mb']:.0f}MB, {scenario['failed']} failed")
+
+    output = args.output or os.path.join(RESULTS_DIR, f"pipeline-{report['commit']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✅ Report written to {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare_reports(json.load(f), report, args.regression_threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regressions over {args.regression_threshold:.0f}%")
+            sys.exit(1)
+        print("\n✅ No regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+Model Routing Benchmark
+Runs a fixed lead corpus through several per-agent model routings and compares
+latency, estimated cost and agreement of the auditor's verdicts
+
+Usage:
+    python benchmarks/routing_benchmark.py --routings uniform,tiered,mini
+    python benchmarks/routing_benchmark.py --routings uniform "scout=gpt-4o-mini,auditor=gpt-4o-mini"
+
+The first routing is the baseline the others are compared against. Every lead is
+processed without the result cache, so this spends real OpenAI tokens.
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Union
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.crew_setup import get_routing, process_lead, routing_signature
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lead_corpus.json")
+
+# Auditor scores this close count as agreeing
+SCORE_TOLERANCE = 10
+
+
+def parse_routing(spec: str) -> Union[str, Dict[str, str]]:
+    """Preset name, or "stage=model,stage=model" for a custom routing"""
+    if "=" not in spec:
+        return spec
+    return dict(part.split("=", 1) for part in spec.split(",") if part)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile (0 for no values)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run_routing(leads: List[Dict[str, Any]], routing: Dict[str, str], concurrency: int = 1) -> List[Dict[str, Any]]:
+    """Process every lead under one routing and keep what the comparison needs"""
+    def run(lead: Dict[str, Any]) -> Dict[str, Any]:
+        started = time.monotonic()
+        result = process_lead(lead, use_cache=False, routing=routing)
+        audit = result.get("audit") or {}
+        usage = result.get("usage") or {}
+        return {
+            "url": lead.get("url"),
+            "success": bool(result.get("success")),
+            "error": result.get("error"),
+            "latency_seconds": round(time.monotonic() - started, 3),
+            "buyability_score": audit.get("buyability_score"),
+            "is_approved": audit.get("is_approved"),
+            "total_tokens": usage.get("total_tokens", 0),
+            "cost_usd": usage.get("cost_usd", 0.0),
+            "agents": usage.get("agents", {})
+        }
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        return list(executor.map(run, leads))
+
+
+def summarize_runs(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Latency, token and cost figures of one routing"""
+    ok = [run for run in runs if run["success"]]
+    latencies = [run["latency_seconds"] for run in ok]
+    agents: Dict[str, Dict[str, float]] = {}
+    for run in ok:
+        for name, entry in run["agents"].items():
+            totals = agents.setdefault(name, {"latency_seconds": 0.0, "total_tokens": 0, "cost_usd": 0.0})
+            for field in totals:
+                totals[field] += entry.get(field, 0)
+    cost = sum(run["cost_usd"] for run in runs)
+    return {
+        "leads": len(runs),
+        "failed": len(runs) - len(ok),
+        "latency_p50_seconds": percentile(latencies, 50),
+        "latency_p95_seconds": percentile(latencies, 95),
+        "latency_mean_seconds": round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+        "total_tokens": sum(run["total_tokens"] for run in runs),
+        "cost_usd": round(cost, 6),
+        "cost_per_lead_usd": round(cost / len(runs), 6) if runs else 0.0,
+        "agents": {
+            name: {field: round(value / len(ok), 6) for field, value in totals.items()}
+            for name, totals in agents.items()
+        }
+    }
+
+
+def compare_scores(baseline: List[Dict[str, Any]], candidate: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """How closely a routing's auditor verdicts match the baseline's, lead by lead"""
+    pairs = [
+        (base, other) for base, other in zip(baseline, candidate)
+        if base["buyability_score"] is not None and other["buyability_score"] is not None
+    ]
+    if not pairs:
+        return {"compared": 0, "mean_abs_score_diff": None, "within_tolerance": None, "approval_agreement": None}
+    diffs = [abs(base["buyability_score"] - other["buyability_score"]) for base, other in pairs]
+    return {
+        "compared": len(pairs),
+        "mean_abs_score_diff": round(sum(diffs) / len(diffs), 2),
+        "within_tolerance": round(sum(1 for diff in diffs if diff <= SCORE_TOLERANCE) / len(pairs) * 100, 1),
+        "approval_agreement": round(
+            sum(1 for base, other in pairs if bool(base["is_approved"]) == bool(other["is_approved"]))
+            / len(pairs) * 100, 1
+        )
+    }
+
+
+def run_benchmark(leads: List[Dict[str, Any]],
+                  routings: List[Union[str, Dict[str, str]]],
+                  concurrency: int = 1) -> Dict[str, Any]:
+    """
+    Benchmark routings on the same leads
+
+    Args:
+        leads: Lead corpus
+        routings: Preset names or {stage: model} dicts; the first is the baseline
+        concurrency: Leads processed at once per routing
+
+    Returns:
+        Report with per-routing summaries, score agreement and raw per-lead runs
+    """
+    report = {"timestamp": datetime.now().isoformat(), "leads": len(leads), "routings": []}
+    baseline_runs = None
+    for spec in routings:
+        routing = get_routing(spec)
+        name = spec if isinstance(spec, str) else routing_signature(routing)
+        print(f"\n🚦 Routing '{name}': {routing}")
+        runs = run_routing(leads, routing, concurrency)
+        summary = summarize_runs(runs)
+        print(f"   p50 {summary['latency_p50_seconds']:.1f}s, p95 {summary['latency_p95_seconds']:.1f}s, "
+              f"{summary['total_tokens']} tokens, ~${summary['cost_usd']:.4f}, {summary['failed']} failed")
+
+        entry = {"name": name, "models": routing, "summary": summary, "runs": runs}
+        if baseline_runs is None:
+            baseline_runs = runs
+        else:
+            entry["agreement"] = compare_scores(baseline_runs, runs)
+            print(f"   Agreement with baseline: {entry['agreement']}")
+        report["routings"].append(entry)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-agent model routings on a fixed lead corpus")
+    parser.add_argument("--routings", nargs="+", default=["uniform", "tiered"],
+                        help="Preset names or stage=model lists (comma separated presets also accepted)")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="JSON file with a list of leads")
+    parser.add_argument("--limit", type=int, default=None, help="Only use the first N leads")
+    parser.add_argument("--concurrency", type=int, default=1, help="Leads processed at once per routing")
+    parser.add_argument("--output", default=None, help="Write the JSON report here")
+    args = parser.parse_args()
+
+    specs = []
+    for value in args.routings:
+        specs.extend([value] if "=" in value else value.split(","))
+
+    with open(args.corpus) as f:
+        leads = json.load(f)[:args.limit]
+
+    print("=" * 60)
+    print("Lead Sniper AI - Model Routing Benchmark")
+    print("=" * 60)
+    print(f"Corpus: {len(leads)} leads from {args.corpus}")
+
+    report = run_benchmark(leads, [parse_routing(spec) for spec in specs], args.concurrency)
+
+    print("\n" + "=" * 60)
+    print(f"{'Routing':<30} {'p50 s':>7} {'p95 s':>7} {'$/lead':>9} {'Agree %':>8}")
+    print("=" * 60)
+    for entry in report["routings"]:
+        summary, agreement = entry["summary"], entry.get("agreement") or {}
+        agree = agreement.get("approval_agreement")
+        print(f"{entry['name'][:30]:<30} {summary['latency_p50_seconds']:>7.1f} "
+              f"{summary['latency_p95_seconds']:>7.1f} {summary['cost_per_lead_usd']:>9.4f} "
+              f"{'baseline' if not agreement else ('n/a' if agree is None else agree):>8}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, default=str)
+        print(f"\n✅ Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,24 +5,180 @@ Scrapes leads and processes them through the 4-agent crew pipeline
 
 import os
 import sys
-from typing import List, Dict, Any
+import threading
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
+from typing import Callable, Iterator, List, Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from tools.apify_scraper import ApifyLeadScraper
-from agents.crew_setup import process_lead
+from tools.lead_dedup import LeadDedupIndex
+from tools.lead_scoring import rank_leads
+from agents.crew_setup import CrewSlot, process_lead, scout_leads
+from agents.usage_metrics import rollup_usage
 
 load_dotenv()
 
 
+def _report_progress(progress_callback: Optional[Callable[[Dict[str, Any]], None]], **progress) -> None:
+    """Send a progress update to the caller, if it asked for one"""
+    if progress_callback:
+        progress_callback(progress)
+
+
+def iter_processed_leads(
+    leads: List[Dict[str, Any]],
+    max_concurrent: int = None,
+    lead_timeout: float = None
+) -> Iterator[Tuple[int, Dict[str, Any], Dict[str, Any]]]:
+    """
+    Process leads through the CrewAI pipeline on a worker pool
+    
+    Results are yielded as each lead finishes, not in input order. Exceptions and
+    timeouts are turned into failed results, so one lead never stops the others.
+    
+    Args:
+        leads: Leads to process
+        max_concurrent: Maximum leads processed at once (defaults to LEAD_PROCESS_CONCURRENCY or 3)
+        lead_timeout: Seconds a lead's crew may run before it is reported as failed,
+            counted from when it gets a crew slot (defaults to LEAD_TIMEOUT_SECONDS or 600).
+            A timed-out lead's thread cannot be killed: it gives back its crew slot and
+            its place among the max_concurrent leads, but its crew keeps running (and
+            spending tokens) in the background until its current call returns
+        
+    Yields:
+        (index, lead, result) tuples, index starting at 1
+    """
+    max_concurrent = max(1, max_concurrent or int(os.getenv("LEAD_PROCESS_CONCURRENCY", "3")))
+    lead_timeout = lead_timeout or float(os.getenv("LEAD_TIMEOUT_SECONDS", "600"))
+    started: Dict[int, float] = {}
+    slots: Dict[int, CrewSlot] = {}
+    abandoned = set()
+    stop = threading.Event()
+    
+    def crew_started(index: int, slot: CrewSlot) -> None:
+        # Leads still waiting for a crew slot when the caller stopped (or gave up on them) never run
+        if stop.is_set() or index in abandoned:
+            raise RuntimeError("Lead processing was stopped")
+        slots[index] = slot
+        # Queued time is not run time - the timeout starts with the crew
+        started.setdefault(index, time.monotonic())
+    
+    def run(index: int, lead: Dict[str, Any]) -> Dict[str, Any]:
+        print(f"\n   Processing lead {index}/{len(leads)}: {lead.get('title', lead.get('name', 'Unknown'))[:50]}...")
+        return process_lead(lead, on_start=partial(crew_started, index))
+    
+    # Timed-out leads keep their threads, so leads are submitted max_concurrent at a
+    # time onto a pool that has room for all of them
+    executor = ThreadPoolExecutor(max_workers=len(leads) or 1)
+    queued = iter(enumerate(leads, 1))
+    pending = {}
+    
+    def submit_queued() -> None:
+        while len(pending) < max_concurrent:
+            item = next(queued, None)
+            if item is None:
+                return
+            pending[executor.submit(run, *item)] = item
+    
+    submit_queued()
+    try:
+        while pending:
+            done, _ = wait(pending, timeout=1.0, return_when=FIRST_COMPLETED)
+            finished = []
+            for future in done:
+                index, lead = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = {
+                        "original_lead": lead,
+                        "status": "error",
+                        "success": False,
+                        "error": str(e),
+                        "error_type": type(e).__name__,
+                        "traceback": traceback.format_exc()
+                    }
+                finished.append((index, lead, result))
+            
+            # The worker thread cannot be killed; stop waiting for it and hand its crew slot on
+            now = time.monotonic()
+            for future, (index, lead) in list(pending.items()):
+                if index in started and now - started[index] > lead_timeout:
+                    del pending[future]
+                    abandoned.add(index)
+                    slots[index].release()
+                    finished.append((index, lead, {
+                        "original_lead": lead,
+                        "status": "error",
+                        "success": False,
+                        "error": f"Lead processing timed out after {lead_timeout:g}s",
+                        "error_type": "TimeoutError"
+                    }))
+            
+            submit_queued()
+            yield from finished
+    finally:
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def screen_leads(
+    leads: List[Dict[str, Any]],
+    limit: int,
+    batch_size: int = None
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Screen leads with batched Signal Scout passes until enough of them qualify
+    
+    Leads are sent to the scout batch_size at a time, in order, so the scout's
+    prompt overhead is paid once per batch instead of once per lead.
+    
+    Args:
+        leads: Candidate leads, best first
+        limit: Number of qualifying leads wanted
+        batch_size: Leads per scout call (defaults to SCOUT_BATCH_SIZE or 5)
+        
+    Returns:
+        Tuple of (leads to process, leads the scout rejected)
+    """
+    batch_size = max(1, batch_size or int(os.getenv("SCOUT_BATCH_SIZE", "5")))
+    selected, rejected = [], []
+    for start in range(0, len(leads), batch_size):
+        if len(selected) >= limit:
+            break
+        batch = leads[start:start + batch_size]
+        print(f"   🔎 Scouting leads {start + 1}-{start + len(batch)} in one pass...")
+        for lead, verdict in zip(batch, scout_leads(batch)):
+            if verdict is not None and not verdict["qualified"]:
+                rejected.append(lead)
+            elif len(selected) < limit:
+                # No verdict means the lead is cached or unscreened - the full pipeline handles it
+                selected.append(lead)
+    return selected, rejected
+
+
 def scrape_and_process_leads(
     keywords: List[str],
     reddit_subreddits: List[str] = None,
     linkedin_location: str = None,
     max_per_source: int = 10,
-    process_limit: int = 3
+    process_limit: int = 3,
+    deduplicate: bool = True,
+    progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+    max_concurrent_leads: int = None,
+    lead_timeout: float = None,
+    result_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+    prefilter: bool = True,
+    prefilter_min_score: float = None,
+    batch_scout: bool = False,
+    scout_batch_size: int = None,
+    incremental: bool = False
 ) -> Dict[str, Any]:
     """
     Complete pipeline: Scrape leads from Apify and process through CrewAI agents
@@ -33,6 +189,24 @@ def scrape_and_process_leads(
         linkedin_location: Optional location filter for LinkedIn
         max_per_source: Maximum leads to scrape per source
         process_limit: Maximum number of leads to process through agents (to control costs)
+        deduplicate: Drop leads seen in earlier runs and near-duplicates across sources
+            before they reach the agents
+        progress_callback: Optional callable receiving progress updates
+            (e.g. {"stage": "processing", "processed": 1, "failed": 0, "total": 3})
+        max_concurrent_leads: Maximum leads processed through the crew at once
+            (defaults to LEAD_PROCESS_CONCURRENCY or 3)
+        lead_timeout: Seconds before a single lead is reported as failed
+            (defaults to LEAD_TIMEOUT_SECONDS or 600)
+        result_callback: Optional callable receiving each process_lead result as soon as it finishes
+        prefilter: Rank leads with local heuristics (intent, detail, engagement, recency)
+            and send only the best process_limit leads to the agents
+        prefilter_min_score: Drop leads scoring below this (0-100, defaults to
+            PREFILTER_MIN_SCORE or 50)
+        batch_scout: Screen candidates with batched Signal Scout calls and send only
+            qualifying leads on to the researcher, pitch and audit stages
+        scout_batch_size: Leads per batched scout call (defaults to SCOUT_BATCH_SIZE or 5)
+        incremental: Only scrape posts newer than the previous run of the same
+            search (per-query high-water marks), e.g. for scheduled scrapes
         
     Returns:
         Dictionary with scraping results and processed leads
@@ -43,7 +217,8 @@ def scrape_and_process_leads(
     
     # Step 1: Scrape leads
     print(f"\n📡 Step 1: Scraping leads with keywords: {keywords}")
-    scraper = ApifyLeadScraper()
+    _report_progress(progress_callback, stage="scraping")
+    scraper = ApifyLeadScraper(incremental=incremental)
     
     try:
         scrape_results = scraper.scrape_all(
@@ -62,51 +237,90 @@ def scrape_and_process_leads(
         processed_leads = []
         failed_leads = []
         
+        # Drop repeats before they cost four LLM calls each
+        dedup_index = LeadDedupIndex() if deduplicate else None
+        duplicates = 0
+        if dedup_index:
+            unique_leads = dedup_index.filter_new(all_leads)
+            duplicates = len(all_leads) - len(unique_leads)
+            all_leads = unique_leads
+            print(f"\n🧹 Dropped {duplicates} duplicate leads ({len(all_leads)} unique)")
+        
+        # Rank locally so the agents only see the most promising leads
+        prefiltered = 0
+        if prefilter:
+            ranked_leads = rank_leads(all_leads, min_score=prefilter_min_score)
+            prefiltered = len(all_leads) - len(ranked_leads)
+            all_leads = ranked_leads
+            print(f"\n🎯 Pre-filter dropped {prefiltered} low-scoring leads ({len(all_leads)} remaining)")
+        
         # Limit processing to control API costs
-        leads_to_process = all_leads[:process_limit]
+        rejected = 0
+        if batch_scout:
+            print(f"\n🔎 Screening {len(all_leads)} leads with batched Signal Scout passes...")
+            _report_progress(progress_callback, stage="scouting", total_candidates=len(all_leads))
+            leads_to_process, rejected_leads = screen_leads(all_leads, process_limit, scout_batch_size)
+            rejected = len(rejected_leads)
+            if dedup_index:
+                # Already judged by the scout - don't pay to screen them again next run
+                for lead in rejected_leads:
+                    dedup_index.add(lead)
+            print(f"   Scout rejected {rejected} leads ({len(leads_to_process)} qualify)")
+        else:
+            leads_to_process = all_leads[:process_limit]
         
         print(f"\n🤖 Step 2: Processing {len(leads_to_process)} leads through CrewAI agents...")
+        _report_progress(
+            progress_callback,
+            stage="processing",
+            total_scraped=scrape_results['total'],
+            total_duplicates=duplicates,
+            total_prefiltered=prefiltered,
+            total_scout_rejected=rejected,
+            total=len(leads_to_process),
+            processed=0,
+            failed=0
+        )
         print("   (Processing through: Signal Scout → Researcher → Pitch Architect → Auditor)")
         
-        for i, lead in enumerate(leads_to_process, 1):
-            print(f"\n   Processing lead {i}/{len(leads_to_process)}: {lead.get('title', lead.get('name', 'Unknown'))[:50]}...")
-            
-            try:
-                result = process_lead(lead)
-                
-                if result.get('success'):
-                    processed_leads.append(result)
-                    print(f"   ✅ Lead {i} processed successfully")
-                else:
-                    error_msg = result.get('error', 'Unknown error')
-                    failed_leads.append({
-                        'lead': lead,
-                        'error': error_msg,
-                        'result': result  # Include full result for debugging
-                    })
-                    print(f"   ❌ Lead {i} failed: {error_msg}")
-                    # Print more details for debugging
-                    if 'processed_result' in result:
-                        print(f"      Result type: {type(result.get('processed_result'))}")
-                    
-            except Exception as e:
-                import traceback
-                error_details = traceback.format_exc()
+        for i, lead, result in iter_processed_leads(leads_to_process, max_concurrent_leads, lead_timeout):
+            if result.get('success'):
+                processed_leads.append(result)
+                if dedup_index:
+                    dedup_index.add(lead)
+                print(f"   ✅ Lead {i} processed successfully")
+            else:
+                error_msg = result.get('error', 'Unknown error')
                 failed_leads.append({
                     'lead': lead,
-                    'error': str(e),
-                    'traceback': error_details
+                    'error': error_msg,
+                    'result': result  # Include full result for debugging
                 })
-                print(f"   ❌ Lead {i} exception: {str(e)}")
-                print(f"      Traceback: {error_details[:200]}...")
+                print(f"   ❌ Lead {i} failed: {error_msg}")
+                # Print more details for debugging
+                if 'traceback' in result:
+                    print(f"      Traceback: {result['traceback'][:200]}...")
+            
+            if result_callback:
+                result_callback(result)
+            _report_progress(progress_callback, processed=len(processed_leads), failed=len(failed_leads))
         
         # Step 3: Summary
         print("\n" + "=" * 60)
         print("Pipeline Summary")
         print("=" * 60)
         print(f"Total leads scraped: {scrape_results['total']}")
+        print(f"Duplicates dropped: {duplicates}")
+        print(f"Pre-filtered out: {prefiltered}")
+        print(f"Rejected by scout: {rejected}")
         print(f"Leads processed: {len(processed_leads)}")
         print(f"Leads failed: {len(failed_leads)}")
+        usage = rollup_usage(
+            [lead.get('usage') for lead in processed_leads] +
+            [failed['result'].get('usage') for failed in failed_leads]
+        )
+        print(f"Tokens used: {usage['total_tokens']} (~${usage['cost_usd']:.4f})")
+        _report_progress(progress_callback, stage="completed")
         
         return {
             "scrape_results": scrape_results,
@@ -114,15 +328,18 @@ def scrape_and_process_leads(
             "failed_leads": failed_leads,
             "summary": {
                 "total_scraped": scrape_results['total'],
+                "total_duplicates": duplicates,
+                "total_prefiltered": prefiltered,
+                "total_scout_rejected": rejected,
                 "total_processed": len(processed_leads),
                 "total_failed": len(failed_leads),
-                "success_rate": len(processed_leads) / len(leads_to_process) * 100 if leads_to_process else 0
+                "success_rate": len(processed_leads) / len(leads_to_process) * 100 if leads_to_process else 0,
+                "usage": usage
             }
         }
         
     except Exception as e:
         print(f"\n❌ Pipeline error: {str(e)}")
-        import traceback
         traceback.print_exc()
         return {
             "error": str(e),
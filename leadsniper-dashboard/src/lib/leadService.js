@@ -55,3 +55,47 @@ export async function getLead(id) {
     return mockLeads.find(lead => lead.id === id) || null;
   }
 }
+
+/**
+ * Stream scraped leads from the API as they are found (NDJSON)
+ * @param {{keywords: string[], reddit_subreddits?: string[], linkedin_location?: string, max_per_source?: number}} params
+ * @param {(lead: Object) => void} onLead - Called for each lead as soon as it arrives
+ * @returns {Promise<Object>} The final "complete" summary event
+ */
+export async function streamScrape(params, onLead) {
+  const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000'}/api/scrape/stream`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify(params)
+  });
+  if (!response.ok || !response.body) {
+    throw new Error('API request failed');
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  let summary = null;
+
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    const lines = buffer.split('\n');
+    buffer = lines.pop();
+    for (const line of lines) {
+      if (!line.trim()) continue;
+      const event = JSON.parse(line);
+      if (event.event === 'lead') {
+        onLead(event.lead);
+      } else if (event.event === 'complete') {
+        summary = event;
+      } else if (event.event === 'error') {
+        throw new Error(event.detail);
+      }
+    }
+  }
+
+  return summary;
+}
@@ -111,8 +111,8 @@ def verify_leads():
             if leads:
                 print("\n   Sample leads:")
                 for i, lead in enumerate(leads[:5], 1):
-                    title = lead.get("original_lead", {}).get("title", "N/A")
-                    source = lead.get("original_lead", {}).get("source", "N/A")
+                    title = lead.get("title") or "N/A"
+                    source = lead.get("source") or "N/A"
                     score = lead.get("buyability_score", "N/A")
                     print(f"   {i}. {title[:60]}...")
                     print(f"      Source: {source} | Score: {score}")
@@ -13,6 +13,7 @@ def test_apify_api_connection():
     """Test direct Apify API connection using apify-client"""
     try:
         from apify_client import ApifyClient
+        from tools.apify_scraper import api_record
         
         api_token = os.getenv("APIFY_API_TOKEN")
         if not api_token:
@@ -23,7 +24,7 @@ def test_apify_api_connection():
         client = ApifyClient(api_token)
         
         # Test connection by getting user info
-        user_info = client.user().get()
+        user_info = api_record(client.user().get()) or {}
         print(f"✅ Apify API connection successful!")
         print(f"   User: {user_info.get('username', 'N/A')}")
         print(f"   Email: {user_info.get('email', 'N/A')}")
@@ -0,0 +1,102 @@
+"""
+Test script for the offline Apify stand-in
+Talks to the stand-in over HTTP with urllib, so it runs without apify-client or network
+"""
+
+import json
+import os
+import sys
+import time
+from urllib.request import Request, urlopen
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from benchmarks.apify_standin import ApifyStandin
+
+REDDIT = "benthepythondev~reddit-scraper"
+LINKEDIN = "freshdata~linkedin-job-scraper"
+
+
+def api(url, method="GET", body=None):
+    data = json.dumps(body).encode() if body is not None else None
+    request = Request(url, data=data, method=method, headers={"Content-Type": "application/json"})
+    with urlopen(request) as response:
+        return json.loads(response.read()), response.headers
+
+
+def test_run_lifecycle():
+    """Runs take the configured latency, then expose their dataset"""
+    print("🔌 Testing run lifecycle...")
+    with ApifyStandin(latency=0.3, dataset_size=40) as url:
+        run_input = {"searchQuery": "need", "searchSubreddit": "startups", "sort": "new", "maxPosts": 30}
+        run = api(f"{url}/v2/acts/{REDDIT}/runs", "POST", run_input)[0]["data"]
+        assert run["status"] == "RUNNING"
+
+        started = time.monotonic()
+        run = api(f"{url}/v2/actor-runs/{run['id']}?waitForFinish=10")[0]["data"]
+        print(f"   Run finished in {time.monotonic() - started:.2f}s with {run['status']}")
+        assert run["status"] == "SUCCEEDED" and run["finishedAt"]
+
+        items, headers = api(f"{url}/v2/datasets/{run['defaultDatasetId']}/items?offset=10&limit=5")
+        assert len(items) == 5 and headers["x-apify-pagination-total"] == "30"
+        assert all(item["subreddit"] == "startups" for item in items)
+
+        # Newest first, and the same search replays the same posts
+        first = api(f"{url}/v2/datasets/{run['defaultDatasetId']}/items")[0]
+        assert [item["createdAt"] for item in first] == sorted((item["createdAt"] for item in first), reverse=True)
+        # apify-client 3.x starts runs under /v2/actors
+        again = api(f"{url}/v2/actors/{REDDIT}/runs?waitForFinish=10", "POST", run_input)[0]["data"]
+        assert api(f"{url}/v2/datasets/{again['defaultDatasetId']}/items")[0] == first
+    print("✅ Runs replayed")
+
+
+def test_failures_aborts_and_windows():
+    """Failure rate, aborts and LinkedIn date ranges are honored"""
+    print("\n🔌 Testing failures, aborts and date ranges...")
+    with ApifyStandin(latency=0.05, failure_rate=1.0) as url:
+        run = api(f"{url}/v2/acts/{LINKEDIN}/runs?waitForFinish=10", "POST", {"keywords": "python"})[0]["data"]
+        assert run["status"] == "FAILED"
+
+    standin = ApifyStandin(latency=5, dataset_size=200, item_interval_minutes=120)
+    with standin as url:
+        run = api(f"{url}/v2/acts/{LINKEDIN}/runs", "POST", {"keywords": "python", "date_posted": "Past 24 hours"})[0]["data"]
+        assert api(f"{url}/v2/actor-runs/{run['id']}/abort", "POST")[0]["data"]["status"] == "ABORTED"
+        recent = standin.generate_items("freshdata/linkedin-job-scraper",
+                                        {"keywords": "python", "date_posted": "Past 24 hours"})
+        assert len(recent) == 13  # one posting every 2 hours
+        stats = standin.stats()
+    print(f"   Stats: {stats}")
+    assert stats["runs"] == 1 and stats["aborted_runs"] == 1
+    print("✅ Failures, aborts and date ranges honored")
+
+
+def main():
+    """Run all tests"""
+    print("=" * 60)
+    print("Apify Stand-in Test")
+    print("=" * 60)
+
+    tests = [
+        ("Run Lifecycle", test_run_lifecycle),
+        ("Failures/Aborts/Date Ranges", test_failures_aborts_and_windows),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            test_func()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"❌ {name} test failed: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("Test Summary:")
+    print("=" * 60)
+    for name, result in results:
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{name}: {status}")
+
+
+if __name__ == "__main__":
+    main()
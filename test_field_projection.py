@@ -0,0 +1,96 @@
+"""
+Test script for dataset field projection
+Scrapes the offline Apify stand-in and checks only the normalized fields are downloaded,
+and that runs are not left going once the caller stops reading
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from benchmarks.apify_standin import ApifyStandin
+from tools.apify_scraper import ITEM_FIELDS, RAW_FIELDS, ApifyLeadScraper
+
+
+def test_linkedin_projection():
+    """LinkedIn leads carry only the declared raw fields"""
+    print("🔌 Testing LinkedIn projection...")
+    with ApifyStandin(latency=0.1, dataset_size=20) as url:
+        scraper = ApifyLeadScraper(api_token="offline", api_url=url)
+        leads = scraper.scrape_linkedin(["python"], max_results=10)
+    assert leads, "no leads scraped"
+    for lead in leads:
+        assert set(lead["raw_data"]) <= set(RAW_FIELDS["linkedin"]), lead["raw_data"]
+        assert lead["title"] and lead["content"] and lead["company"] and lead["url"]
+    print(f"   {len(leads)} leads, raw_data e.g. {leads[0]['raw_data']}")
+    print("✅ LinkedIn items projected")
+
+
+def test_reddit_projection():
+    """Reddit items are projected server-side, which shrinks the transfer"""
+    print("\n🔌 Testing Reddit projection...")
+    standin = ApifyStandin(latency=0.1)
+    with standin as url:
+        scraper = ApifyLeadScraper(api_token="offline", api_url=url)
+        leads = scraper.scrape_reddit(["need"], subreddits=["startups"], max_posts=30)
+        projected_bytes = standin.stats()["item_bytes_served"]
+        dataset = scraper.client.dataset(next(iter(standin._datasets)))
+        full = dataset.list_items().items
+        full_bytes = standin.stats()["item_bytes_served"] - projected_bytes
+    for lead in leads:
+        assert set(lead["raw_data"]) <= set(RAW_FIELDS["reddit"]), lead["raw_data"]
+        assert lead["content"] and lead["posted_at"]
+    assert any(set(item) - set(ITEM_FIELDS["reddit"] + RAW_FIELDS["reddit"]) for item in full)
+    assert projected_bytes < full_bytes
+    print(f"   {len(leads)} leads, {projected_bytes} bytes downloaded ({full_bytes} without projection)")
+    print("✅ Reddit items projected")
+
+
+def test_closed_stream_aborts_runs():
+    """A LinkedIn stream the caller stops reading aborts the runs still in progress"""
+    print("\n🔌 Testing runs aborted on close...")
+    standin = ApifyStandin(latency=0.1, latency_jitter=30, dataset_size=20)
+    with standin as url:
+        scraper = ApifyLeadScraper(api_token="offline", api_url=url)
+        stream = scraper.iter_linkedin(["python"], max_results=50)
+        first = next(stream)
+        stream.close()  # e.g. an NDJSON client disconnected
+        stats = standin.stats()
+    assert first["url"]
+    print(f"   Stats: {stats}")
+    assert stats["runs"] == 3 and stats["aborted_runs"] >= 1
+    print("✅ Remaining runs aborted")
+
+
+def main():
+    """Run all tests"""
+    print("=" * 60)
+    print("Field Projection Test")
+    print("=" * 60)
+
+    tests = [
+        ("LinkedIn Projection", test_linkedin_projection),
+        ("Reddit Projection", test_reddit_projection),
+        ("Closed Stream Aborts Runs", test_closed_stream_aborts_runs),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            test_func()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"❌ {name} test failed: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("Test Summary:")
+    print("=" * 60)
+    for name, result in results:
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{name}: {status}")
+
+
+if __name__ == "__main__":
+    main()
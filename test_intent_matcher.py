@@ -0,0 +1,81 @@
+"""
+Test script for the shared buying intent matcher
+Runs offline - no Apify or OpenAI calls
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tools.intent_matcher import (
+    IntentMatcher,
+    scraper_intent_matcher,
+    validation_intent_matcher
+)
+
+
+def test_find_all_offsets():
+    """Every keyword occurrence is reported with its offset"""
+    print("🔌 Testing keyword offsets...")
+    matcher = IntentMatcher(["need", "looking for", "looking"])
+    text = "We are Looking for a CRM and need it fast"
+    
+    matches = matcher.find_all(text)
+    print(f"   Matches: {matches}")
+    assert matches == [("looking for", 7), ("need", 29)]
+    print("✅ Offsets correct (longest keyword wins)")
+
+
+def test_word_anchoring():
+    """Keywords only match at the start of a word"""
+    print("\n🔌 Testing word anchoring...")
+    assert scraper_intent_matcher.search("Any recommendations for a CRM?")
+    assert scraper_intent_matcher.search("We needs a tool")
+    assert not scraper_intent_matcher.search("Tissue paper in Spain")
+    assert not scraper_intent_matcher.search("")
+    print("✅ Prefix matches kept, mid-word matches rejected")
+
+
+def test_validation_keywords():
+    """Validator keywords are returned once each, in order of appearance"""
+    print("\n🔌 Testing validation keywords...")
+    found = validation_intent_matcher.matched_keywords(
+        "Hiring now. We need help and need it soon, considering options"
+    )
+    print(f"   Found: {found}")
+    assert found == ["hiring", "need", "considering"]
+    print("✅ Distinct keywords in order")
+
+
+def main():
+    """Run all tests"""
+    print("=" * 60)
+    print("Intent Matcher Test")
+    print("=" * 60)
+    
+    tests = [
+        ("Offsets", test_find_all_offsets),
+        ("Word Anchoring", test_word_anchoring),
+        ("Validation Keywords", test_validation_keywords),
+    ]
+    
+    results = []
+    for name, test_func in tests:
+        try:
+            test_func()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"❌ {name} test failed: {e}")
+            results.append((name, False))
+    
+    print("\n" + "=" * 60)
+    print("Test Summary:")
+    print("=" * 60)
+    for name, result in results:
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{name}: {status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Test script for the lead deduplication index
+Runs offline against in-memory and temporary SQLite indexes
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tools.lead_dedup import LeadDedupIndex, canonical_url
+
+SAMPLE_LEAD = {
+    "source": "reddit",
+    "title": "Looking for a CRM for our startup",
+    "content": "We're a 10-person SaaS startup and need a CRM that integrates with Slack. "
+               "We've been using spreadsheets but it's getting messy.",
+    "url": "https://www.reddit.com/r/startups/comments/abc123/looking_for_a_crm/?utm_source=share"
+}
+
+
+def test_canonical_url():
+    """Tracking parameters, hosts prefixes and trailing slashes are normalized"""
+    print("🔌 Testing URL canonicalization...")
+    assert canonical_url(SAMPLE_LEAD["url"]) == canonical_url(
+        "https://old.reddit.com/r/startups/comments/abc123/looking_for_a_crm"
+    )
+    assert canonical_url("https://example.com/a?utm_medium=x&id=7") == "https://example.com/a?id=7"
+    print("✅ URLs canonicalized")
+
+
+def test_cross_source_duplicates():
+    """The same post without a URL or with a small edit is dropped; a different URL is kept"""
+    print("\n🔌 Testing duplicate filtering...")
+    index = LeadDedupIndex(":memory:")
+    crosspost = dict(SAMPLE_LEAD, url="https://reddit.com/r/SaaS/comments/zzz999/crm")
+    copy = dict(SAMPLE_LEAD, url=None, content=SAMPLE_LEAD["content"] + " Any ideas?")
+    other = {
+        "source": "linkedin",
+        "title": "Hiring: Senior Backend Engineer",
+        "content": "Join our platform team to scale Go services on Kubernetes across three regions.",
+        "url": "https://www.linkedin.com/jobs/view/42/?refId=abc"
+    }
+    
+    unique = index.filter_new([SAMPLE_LEAD, crosspost, copy, other])
+    print(f"   Unique leads: {len(unique)}")
+    assert unique == [SAMPLE_LEAD, crosspost, other]
+    print("✅ Batch duplicates dropped")
+
+
+def test_distinct_leads_kept():
+    """Same job titles at other companies and empty-text leads are never merged"""
+    print("\n🔌 Testing distinct leads...")
+    index = LeadDedupIndex(":memory:")
+    leads = [
+        {"source": "linkedin", "title": "Software Engineer", "company": "Acme",
+         "url": "https://www.linkedin.com/jobs/view/1/"},
+        {"source": "linkedin", "title": "Software Engineer", "company": "Globex",
+         "url": "https://www.linkedin.com/jobs/view/2/"},
+        {"source": "reddit", "title": "", "content": "", "author": "alice"},
+        {"source": "reddit", "title": "", "content": "", "author": "bob"},
+    ]
+    
+    unique = index.filter_new(leads)
+    print(f"   Unique leads: {len(unique)}")
+    assert unique == leads
+    
+    for lead in leads:
+        index.add(lead)
+    short = {"source": "reddit", "title": "", "content": "", "author": "alice"}
+    assert not index.is_duplicate(short)
+    assert not index.is_duplicate(dict(leads[0], company="Initech", url=None))
+    print("✅ Distinct leads kept")
+
+
+def test_persisted_across_runs():
+    """Leads added in one run are duplicates after the index is closed and reopened"""
+    print("\n🔌 Testing persistence...")
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "lead_dedup.db")
+        index = LeadDedupIndex(db_path)
+        assert not index.is_duplicate(SAMPLE_LEAD)
+        index.add(SAMPLE_LEAD)
+        index.close()
+        
+        index = LeadDedupIndex(db_path)
+        assert len(index) == 1
+        assert index.is_duplicate(dict(SAMPLE_LEAD, url=SAMPLE_LEAD["url"] + "#comments"))
+        assert index.is_duplicate(dict(SAMPLE_LEAD, url=None))
+        assert index.filter_new([SAMPLE_LEAD]) == []
+        index.close()
+    print("✅ Seen leads persisted")
+
+
+def main():
+    """Run all tests"""
+    print("=" * 60)
+    print("Lead Dedup Index Test")
+    print("=" * 60)
+    
+    tests = [
+        ("Canonical URL", test_canonical_url),
+        ("Cross-Source Duplicates", test_cross_source_duplicates),
+        ("Distinct Leads", test_distinct_leads_kept),
+        ("Persistence", test_persisted_across_runs),
+    ]
+    
+    results = []
+    for name, test_func in tests:
+        try:
+            test_func()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"❌ {name} test failed: {e}")
+            results.append((name, False))
+    
+    print("\n" + "=" * 60)
+    print("Test Summary:")
+    print("=" * 60)
+    for name, result in results:
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{name}: {status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Test script for the compact Lead record
+Runs offline - normalization, dict compatibility, blobs and memory per lead
+"""
+
+import json
+import os
+import pickle
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tools.lead_model import Lead, as_lead
+from tools.lead_scoring import rank_leads
+
+REDDIT_ITEM = {
+    "id": "t3_abc",
+    "title": "Looking for a CRM that fits a 5 person team",
+    "text": "We need something simple. Budget is around $50/month. " * 30,
+    "author": "founder_jane",
+    "url": "https://www.reddit.com/r/startups/comments/abc/",
+    "upvotes": 42,
+    "numComments": 17,
+    "createdAt": "2026-03-01T10:00:00Z",
+    "flair": "Help",
+}
+
+
+def test_normalization():
+    """Reddit and LinkedIn items normalize to the same shape"""
+    print("🔌 Testing normalization...")
+    lead = Lead.from_reddit(REDDIT_ITEM, "startups", raw_fields=["id", "flair"])
+    assert lead.source == "reddit" and lead.subreddit == "startups"
+    assert lead.comments == 17 and lead.posted_at == "2026-03-01T10:00:00Z"
+    assert lead.raw_data == {"id": "t3_abc", "flair": "Help"}
+
+    job = Lead.from_linkedin({"title": "Ops Lead", "description": "Hiring", "companyName": "Acme",
+                              "jobUrl": "https://linkedin.com/jobs/1", "postedDate": "2026-03-02"}, "Berlin")
+    assert job.company == "Acme" and job.location == "Berlin" and job.author is None
+
+    # Interned: every lead shares one string object per value
+    other = Lead.from_reddit(dict(REDDIT_ITEM), "".join(["start", "ups"]))
+    assert other.subreddit is lead.subreddit
+    print("✅ Items normalized")
+
+
+def test_dict_compatibility():
+    """Code written for lead dicts keeps working"""
+    print("\n🔌 Testing dict compatibility...")
+    lead = Lead.from_reddit(REDDIT_ITEM, "startups")
+    assert lead["title"] == REDDIT_ITEM["title"]
+    assert lead.get("company", "N/A") == "N/A" and "company" not in lead and lead["company"] is None
+    assert set(lead) == {"source", "platform", "title", "content", "author", "subreddit", "url",
+                         "upvotes", "comments", "posted_at"}
+
+    lead["email"] = "jane@example.com"
+    assert lead["email"] == "jane@example.com" and dict(lead)["email"] == "jane@example.com"
+
+    api_lead = as_lead({"source": "reddit", "name": "Jane", "text": "Need a CRM", "createdAt": "2026-03-01"})
+    assert api_lead.title == "Jane" and api_lead.content == "Need a CRM" and api_lead.posted_at == "2026-03-01"
+
+    ranked = rank_leads([lead], min_score=0)
+    assert ranked[0]["prefilter_score"] == lead.prefilter_score > 0
+    print("✅ Dict access works")
+
+
+def test_null_fields():
+    """Null item fields read as None instead of breaking dict access"""
+    print("\n🔌 Testing null fields...")
+    job = Lead.from_linkedin({"title": "Ops Lead", "description": "Hiring", "companyName": None,
+                              "jobUrl": None, "postedDate": "2026-03-02"}, "Berlin")
+    assert job["url"] is None and job["company"] is None
+    assert "url" not in job and "url" not in job.to_dict()
+    try:
+        del job["url"]
+        assert False, "deleting an unset field should raise KeyError"
+    except KeyError:
+        pass
+
+    try:
+        from tools.apify_scraper import ApifyLeadScraper
+    except ImportError as e:
+        print(f"   Skipped dedup check: {e}")
+    else:
+        seen = set()
+        assert ApifyLeadScraper._first_sighting(job, seen)
+        assert not ApifyLeadScraper._first_sighting(Lead.from_linkedin(
+            {"title": "Ops Lead", "companyName": None, "jobUrl": None}), seen)
+    print("✅ Null fields handled")
+
+
+def test_blobs_and_json():
+    """Long content is compressed and everything round-trips through JSON and pickle"""
+    print("\n🔌 Testing blobs and JSON...")
+    lead = Lead.from_reddit(REDDIT_ITEM, "startups", raw_fields=["id"])
+    assert isinstance(lead._content, bytes) and len(lead._content) < len(REDDIT_ITEM["text"])
+    assert lead.content == REDDIT_ITEM["text"]
+
+    restored = Lead.from_json(lead.to_json())
+    assert restored == lead and restored.raw_data == {"id": "t3_abc"}
+    assert pickle.loads(pickle.dumps(lead)) == lead
+    assert json.loads(lead.to_json())["content"] == REDDIT_ITEM["text"]
+    print(f"   Content stored in {len(lead._content)} bytes ({len(REDDIT_ITEM['text'])} chars)")
+    print("✅ Blobs and JSON round-trip")
+
+
+def test_memory_per_lead():
+    """A Lead takes less memory than the dict it replaces"""
+    print("\n🔌 Testing memory per lead...")
+
+    def measure(build):
+        tracemalloc.start()
+        leads = [build(n) for n in range(5000)]
+        size = tracemalloc.get_traced_memory()[0] / len(leads)
+        tracemalloc.stop()
+        return size
+
+    def as_dict(n):
+        item = {**REDDIT_ITEM, "url": f"{REDDIT_ITEM['url']}{n}", "text": f"{n} {REDDIT_ITEM['text']}"}
+        return {"source": "reddit", "platform": "reddit", "title": item["title"], "content": item["text"],
+                "author": item["author"], "subreddit": "startups", "url": item["url"], "upvotes": 42,
+                "comments": 17, "posted_at": item["createdAt"],
+                "raw_data": {"id": item["id"], "flair": item["flair"]}}
+
+    def as_record(n):
+        item = {**REDDIT_ITEM, "url": f"{REDDIT_ITEM['url']}{n}", "text": f"{n} {REDDIT_ITEM['text']}"}
+        return Lead.from_reddit(item, "startups", raw_fields=["id", "flair"])
+
+    dict_size, lead_size = measure(as_dict), measure(as_record)
+    print(f"   {dict_size:.0f} bytes per dict lead, {lead_size:.0f} per Lead")
+    assert lead_size < dict_size / 2
+    print("✅ Leads are smaller")
+
+
+def main():
+    """Run all tests"""
+    print("=" * 60)
+    print("Lead Model Test")
+    print("=" * 60)
+
+    tests = [
+        ("Normalization", test_normalization),
+        ("Dict Compatibility", test_dict_compatibility),
+        ("Null Fields", test_null_fields),
+        ("Blobs/JSON", test_blobs_and_json),
+        ("Memory Per Lead", test_memory_per_lead),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            test_func()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"❌ {name} test failed: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("Test Summary:")
+    print("=" * 60)
+    for name, result in results:
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{name}: {status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Test script for the processed lead store backends
+Runs offline against in-memory and temporary SQLite stores and dict stores
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from api.lead_store import InMemoryLeadStore, LeadStore, SQLiteLeadStore, parse_fields
+
+
+def _sample_leads():
+    return [
+        {
+            "lead_id": f"lead-{i}",
+            "original_lead": {"source": "reddit" if i % 2 else "linkedin", "title": f"Lead {i}"},
+            "status": "processed" if i != 3 else "error",
+            "buyability_score": 70 + 5 * i,
+            "is_approved": 70 + 5 * i >= 80,
+            "processed_at": f"2025-01-0{i + 1}T12:00:00",
+            "audit": {"buyability_score": 70 + 5 * i, "feedback": f"Feedback {i}"},
+            "processed_result": {"raw": "x" * 1000}
+        }
+        for i in range(5)
+    ]
+
+
+def _check_backend(store):
+    for lead in _sample_leads():
+        store.put(lead)
+    
+    total, page = store.list_leads(limit=2, offset=1)
+    assert total == 5
+    assert [lead["lead_id"] for lead in page] == ["lead-1", "lead-2"]
+    
+    total, protected = store.list_leads(min_score=80)
+    assert total == 3 and all(lead["buyability_score"] >= 80 for lead in protected)
+    
+    assert store.list_leads(source="reddit")[0] == 2
+    assert store.list_leads(approved=True)[0] == 3 and store.list_leads(approved=False)[0] == 2
+    assert store.stats() == {"total": 5, "successful": 4, "protected": 3}
+    
+    total, summaries = store.list_leads(limit=1, fields=parse_fields(None))
+    assert summaries == [{"lead_id": "lead-0", "source": "linkedin", "title": "Lead 0",
+                          "buyability_score": 70, "status": "processed", "processed_at": "2025-01-01T12:00:00"}]
+    total, page = store.list_leads(min_score=90, fields=parse_fields("title, audit.feedback,audit.missing"))
+    assert page == [{"lead_id": "lead-4", "title": "Lead 4", "audit": {"feedback": "Feedback 4", "missing": None}}]
+    
+    assert "lead-3" in store
+    assert store.delete("lead-3") and not store.delete("lead-3")
+    assert store.get("lead-3") is None and len(store) == 4
+    
+    # An unscored lead matches no min_score, on every backend
+    store.put(dict(_sample_leads()[0], lead_id="unscored", buyability_score=None, is_approved=None))
+    assert store.list_leads()[0] == 5
+    assert store.list_leads(min_score=0)[0] == 4
+    assert "unscored" not in [lead["lead_id"] for lead in store.list_leads(min_score=-1, limit=10)[1]]
+
+
+def test_parse_fields():
+    """fields= values always include lead_id and reject anything but dotted names"""
+    print("🔌 Testing field parsing...")
+    assert parse_fields("") == ["lead_id", "source", "title", "buyability_score", "status", "processed_at"]
+    assert parse_fields("title,title,audit.feedback") == ["lead_id", "title", "audit.feedback"]
+    assert parse_fields("audit.feedback,audit") == ["lead_id", "audit"]
+    for bad in ("title;drop", "audit..feedback", "$.data", "a b"):
+        try:
+            parse_fields(bad)
+        except ValueError:
+            continue
+        raise AssertionError(f"accepted {bad!r}")
+    print("✅ Fields parsed")
+
+
+def test_sqlite_store():
+    """SQLite backend filters, pages and counts through its indexes"""
+    print("\n🔌 Testing SQLite lead store...")
+    _check_backend(SQLiteLeadStore(":memory:"))
+    print("✅ SQLite store working")
+
+
+def test_sqlite_store_persists():
+    """A file-backed SQLite store keeps its leads across close and reopen"""
+    print("\n🔌 Testing SQLite persistence...")
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "leads.db")
+        store = SQLiteLeadStore(db_path)
+        for lead in _sample_leads():
+            store.put(lead)
+        store.close()
+        
+        store = SQLiteLeadStore(db_path)
+        assert len(store) == 5
+        assert store.get("lead-2") == _sample_leads()[2]
+        assert store.list_leads(min_score=80)[0] == 3
+        assert store.stats() == {"total": 5, "successful": 4, "protected": 3}
+        store.close()
+    print("✅ SQLite store persisted")
+
+
+def test_memory_store():
+    """In-memory backend behaves like the SQLite backend"""
+    print("\n🔌 Testing in-memory lead store...")
+    _check_backend(InMemoryLeadStore())
+    print("✅ In-memory store working")
+
+
+def test_incomplete_backend():
+    """A backend missing a method fails when it is created, not when the method is called"""
+    print("\n🔌 Testing incomplete backends...")
+
+    class PutOnlyStore(LeadStore):
+        def put(self, lead):
+            pass
+
+    try:
+        PutOnlyStore()
+        assert False, "an incomplete backend was instantiated"
+    except TypeError as e:
+        print(f"   {e}")
+    print("✅ Incomplete backend rejected")
+
+
+def main():
+    """Run all tests"""
+    print("=" * 60)
+    print("Lead Store Test")
+    print("=" * 60)
+    
+    tests = [
+        ("Field Parsing", test_parse_fields),
+        ("SQLite Store", test_sqlite_store),
+        ("SQLite Persistence", test_sqlite_store_persists),
+        ("In-Memory Store", test_memory_store),
+        ("Incomplete Backend", test_incomplete_backend),
+    ]
+    
+    results = []
+    for name, test_func in tests:
+        try:
+            test_func()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"❌ {name} test failed: {e}")
+            results.append((name, False))
+    
+    print("\n" + "=" * 60)
+    print("Test Summary:")
+    print("=" * 60)
+    for name, result in results:
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{name}: {status}")
+
+
+if __name__ == "__main__":
+    main()
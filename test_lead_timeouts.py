@@ -0,0 +1,119 @@
+"""
+Test script for lead timeouts and crew slots in the processing pipeline
+Runs offline with a stubbed crew kickoff and in-memory caches
+"""
+
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ.setdefault("OPENAI_API_KEY", "offline")
+os.environ["RESULT_CACHE_DB"] = ":memory:"
+os.environ["STEP_CACHE_DB"] = ":memory:"
+
+import agents.crew_setup as crew_setup
+from integrate_scraper_agents import iter_processed_leads
+
+HUNG_SECONDS = 4.0
+
+AUDIT = '{"buyability_score": 84, "is_approved": true, "protected_asset": null, "mcp_notification": null}'
+
+
+class StubCrewPool:
+    """Crew pool that hands out placeholder crews and counts checkouts"""
+
+    def __init__(self):
+        self.checkouts = 0
+
+    @contextmanager
+    def crew(self):
+        self.checkouts += 1
+        yield object()
+
+
+def _stub_kickoff(crew, lead_input, cache_key, resume=True, recorder=None):
+    # The "hang" lead stalls like a crew stuck on a provider call
+    time.sleep(HUNG_SECONDS if "hang" in lead_input else 0.1)
+    return {"raw": AUDIT, "tasks_output": []}
+
+
+def _lead(title):
+    return {"source": "reddit", "title": title, "content": f"{title} details", "url": f"https://reddit.com/{title}"}
+
+
+def _use_stubs(slots):
+    crew_setup.result_cache.clear()
+    crew_setup.step_cache.clear()
+    crew_setup.crew_slots = threading.BoundedSemaphore(slots)
+    crew_setup.crew_pool = StubCrewPool()
+    crew_setup._kickoff_with_checkpoints = _stub_kickoff
+    return crew_setup.crew_pool
+
+
+def test_timed_out_lead_frees_its_slot():
+    """Leads queued behind a hung one still run once it times out"""
+    print("🔌 Testing timeouts with a hung lead...")
+    _use_stubs(slots=1)
+    leads = [_lead("hang"), _lead("quick-1"), _lead("quick-2")]
+
+    started = time.monotonic()
+    results = {index: result for index, _, result in iter_processed_leads(leads, max_concurrent=1, lead_timeout=0.5)}
+    elapsed = time.monotonic() - started
+    print(f"   Finished in {elapsed:.1f}s: {[(i, r['success'], r.get('error_type')) for i, r in sorted(results.items())]}")
+
+    assert results[1]["error_type"] == "TimeoutError"
+    assert results[2]["success"] and results[3]["success"]
+    assert elapsed < HUNG_SECONDS
+    print("✅ Queued leads ran past the hung lead")
+
+
+def test_on_start_failure_keeps_crews():
+    """A lead failing in on_start gives its slot back and never checks out a crew"""
+    print("\n🔌 Testing on_start failures...")
+    pool = _use_stubs(slots=1)
+
+    def refuse(slot):
+        raise RuntimeError("Lead processing was stopped")
+
+    result = crew_setup.process_lead(_lead("refused"), on_start=refuse)
+    assert not result["success"] and "stopped" in result["error"]
+    assert pool.checkouts == 0
+    assert crew_setup.crew_slots.acquire(blocking=False)
+    crew_setup.crew_slots.release()
+    print("✅ Crews untouched")
+
+
+def main():
+    """Run all tests"""
+    print("=" * 60)
+    print("Lead Timeout Test")
+    print("=" * 60)
+
+    tests = [
+        ("Timed-Out Lead Frees Slot", test_timed_out_lead_frees_its_slot),
+        ("On-Start Failure", test_on_start_failure_keeps_crews),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            test_func()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"❌ {name} test failed: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("Test Summary:")
+    print("=" * 60)
+    for name, result in results:
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{name}: {status}")
+
+
+if __name__ == "__main__":
+    main()
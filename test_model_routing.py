@@ -0,0 +1,109 @@
+"""
+Test script for per-stage model routing
+Runs offline; no crew is built or run
+"""
+
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ.setdefault("OPENAI_API_KEY", "offline")
+os.environ["RESULT_CACHE_DB"] = ":memory:"
+os.environ["STEP_CACHE_DB"] = ":memory:"
+
+import agents.crew_setup as crew_setup
+from agents.crew_setup import AGENT_STAGES, LLM_MODEL, ROUTING_PRESETS, get_routing
+
+
+def test_resolve_routing():
+    """Presets, partial dicts and the LLM_ROUTING default resolve to a model per stage"""
+    print("🔌 Testing routing resolution...")
+    assert get_routing("tiered") == ROUTING_PRESETS["tiered"]
+    assert get_routing({"pitch": "gpt-4o"}) == {
+        stage: "gpt-4o" if stage == "pitch" else LLM_MODEL for stage in AGENT_STAGES
+    }
+
+    os.environ["LLM_ROUTING"] = "mini"
+    try:
+        assert get_routing() == ROUTING_PRESETS["mini"]
+    finally:
+        del os.environ["LLM_ROUTING"]
+    print("✅ Routings resolved")
+
+
+def test_unknown_routing():
+    """An unknown preset, in a request or in LLM_ROUTING, is a ValueError naming the valid ones"""
+    print("\n🔌 Testing unknown routings...")
+    for bad_call in (lambda: get_routing("turbo"), lambda: get_routing({"critic": "gpt-4o"})):
+        try:
+            bad_call()
+            assert False, "expected ValueError"
+        except ValueError as e:
+            print(f"   {e}")
+
+    os.environ["LLM_ROUTING"] = "turbo"
+    try:
+        get_routing()
+        assert False, "expected ValueError"
+    except ValueError as e:
+        print(f"   {e}")
+        assert all(preset in str(e) for preset in ROUTING_PRESETS)
+    finally:
+        del os.environ["LLM_ROUTING"]
+    print("✅ Unknown routings rejected")
+
+
+def test_routed_pool_shared():
+    """Threads asking for the same new routing at once share one crew pool"""
+    print("\n🔌 Testing routed crew pools...")
+    routing = get_routing("tiered")
+    pools = []
+    barrier = threading.Barrier(8)
+
+    def checkout():
+        barrier.wait()
+        pools.append(crew_setup._crew_pool_for(routing))
+
+    threads = [threading.Thread(target=checkout) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(pools) == 8 and all(pool is pools[0] for pool in pools)
+    assert crew_setup._crew_pool_for(get_routing()) is crew_setup.crew_pool
+    print("✅ One pool per routing")
+
+
+def main():
+    """Run all tests"""
+    print("=" * 60)
+    print("Model Routing Test")
+    print("=" * 60)
+
+    tests = [
+        ("Resolve Routing", test_resolve_routing),
+        ("Unknown Routing", test_unknown_routing),
+        ("Routed Crew Pools", test_routed_pool_shared),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            test_func()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"❌ {name} test failed: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("Test Summary:")
+    print("=" * 60)
+    for name, result in results:
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{name}: {status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Test script for the OpenAI rate limiter
+Runs offline; limits are small so throttling shows up within a second
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agents.rate_limiter import (
+    AdaptiveRateLimiter, backoff_delay, is_rate_limit_error, retry_after_seconds
+)
+
+
+class FakeResponse:
+    def __init__(self, headers):
+        self.headers = headers
+
+
+class RateLimitError(Exception):
+    def __init__(self, message, headers=None):
+        super().__init__(message)
+        self.status_code = 429
+        self.response = FakeResponse(headers or {})
+
+
+def test_token_budget_throttles():
+    """Calls beyond the per-minute token budget wait for the bucket to refill"""
+    print("🔌 Testing token budget...")
+    limiter = AdaptiveRateLimiter(rpm=6000, tpm=6000, completion_tokens=50)
+    assert limiter.acquire(5950) == 0
+    waited = limiter.acquire(100)  # 50 tokens short at 100 tokens/second
+    print(f"   Waited {waited:.2f}s")
+    assert 0.3 < waited < 1.5
+    stats = limiter.stats()
+    assert stats["calls"] == 2 and stats["throttled_calls"] == 1
+    assert limiter.estimate_tokens([{"role": "user", "content": "x" * 400}]) == 150
+    print("✅ Token budget enforced")
+
+
+def test_adapts_to_429s():
+    """A 429 halves the rate and pauses for Retry-After; successes recover it"""
+    print("\n🔌 Testing adaptive rate...")
+    limiter = AdaptiveRateLimiter(rpm=600, tpm=100000)
+    limiter.on_rate_limited(0.3)
+    assert limiter.factor == 0.5
+    started = time.monotonic()
+    limiter.acquire(10)
+    assert time.monotonic() - started >= 0.25
+    for _ in range(20):
+        limiter.on_success()
+    assert limiter.factor == 1.0
+    for _ in range(10):
+        limiter.on_rate_limited()
+    assert limiter.factor == 0.1
+    print("✅ Rate adapted")
+
+
+def test_error_classification_and_backoff():
+    """Only retryable 429s are retried; backoff is jittered and capped"""
+    print("\n🔌 Testing error classification...")
+    error = RateLimitError("Rate limit reached for gpt-4", {"retry-after": "7"})
+    assert is_rate_limit_error(error) and retry_after_seconds(error) == 7
+    assert is_rate_limit_error(Exception("Error code: 429 - too many requests"))
+    assert not is_rate_limit_error(Exception("429 insufficient_quota"))
+    assert not is_rate_limit_error(ValueError("bad input"))
+    assert retry_after_seconds(ValueError("bad input")) is None
+    delays = [backoff_delay(attempt, base=1, cap=5) for attempt in range(10)]
+    assert all(0 <= delay <= 5 for delay in delays)
+    assert backoff_delay(0, base=1, cap=5) <= 1
+    print("✅ Errors classified")
+
+
+def main():
+    """Run all tests"""
+    print("=" * 60)
+    print("Rate Limiter Test")
+    print("=" * 60)
+
+    tests = [
+        ("Token Budget", test_token_budget_throttles),
+        ("Adaptive Rate", test_adapts_to_429s),
+        ("Error Classification", test_error_classification_and_backoff),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            test_func()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"❌ {name} test failed: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("Test Summary:")
+    print("=" * 60)
+    for name, result in results:
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{name}: {status}")
+
+
+if __name__ == "__main__":
+    main()
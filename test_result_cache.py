@@ -0,0 +1,141 @@
+"""
+Test script for the lead result cache
+Runs offline against in-memory and temporary SQLite caches
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agents.result_cache import LeadResultCache
+
+RESULT = {"raw": '{"buyability_score": 84}', "tasks_output": [{"raw": "scout"}]}
+
+
+def test_ttl_expiry():
+    """Entries older than ttl_seconds are misses and are dropped from both tiers"""
+    print("🔌 Testing TTL expiry...")
+    cache = LeadResultCache(":memory:", ttl_seconds=0.2)
+    cache.set("lead", RESULT)
+    assert cache.get("lead") == RESULT
+    assert "lead" in cache
+
+    time.sleep(0.3)
+    assert "lead" not in cache
+    assert cache.get("lead") is None
+    stats = cache.stats()
+    assert stats["memory_entries"] == 0 and stats["disk_entries"] == 0
+    print("✅ Expired entries dropped")
+
+
+def test_lru_eviction():
+    """Each tier keeps its most recently used entries"""
+    print("\n🔌 Testing LRU eviction...")
+    cache = LeadResultCache(":memory:", max_entries=2, max_memory_entries=1)
+    cache.set("a", {"n": 1})
+    cache.set("b", {"n": 2})
+    assert cache.stats()["memory_entries"] == 1
+
+    # "a" is read back from disk, so "b" is now the least recently used on disk
+    assert cache.get("a") == {"n": 1}
+    cache.set("c", {"n": 3})
+    print(f"   Stats: {cache.stats()}")
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    assert cache.stats()["disk_entries"] == 2
+    print("✅ Least recently used entries evicted")
+
+
+def test_memory_hits_skip_disk():
+    """A memory-tier hit writes nothing to SQLite"""
+    print("\n🔌 Testing memory-tier hits...")
+    cache = LeadResultCache(":memory:")
+    cache.set("lead", RESULT)
+    changes = cache._conn.total_changes
+    for _ in range(100):
+        assert cache.get("lead") == RESULT
+    assert cache._conn.total_changes == changes
+    print("✅ Memory hits stayed in memory")
+
+
+def test_disk_tier_persists():
+    """Entries and access times survive closing and reopening a file-backed cache"""
+    print("\n🔌 Testing disk persistence...")
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "result_cache.db")
+        cache = LeadResultCache(db_path, max_entries=2)
+        cache.set("a", {"n": 1})
+        cache.set("b", {"n": 2})
+        assert cache.get("a") == {"n": 1}
+        cache.close()
+
+        cache = LeadResultCache(db_path, max_entries=2)
+        assert cache.stats() == {"hits": 0, "misses": 0, "hit_rate": 0, "memory_entries": 0, "disk_entries": 2}
+        # The hit on "a" before closing was written, so "b" is the one evicted
+        cache.set("c", {"n": 3})
+        assert cache.get("a") == {"n": 1}
+        assert "b" not in cache and "c" in cache
+        cache.close()
+    print("✅ Disk tier persisted")
+
+
+def test_hit_miss_counters():
+    """Hits, misses and hit rate match what /api/stats reports"""
+    print("\n🔌 Testing hit/miss counters...")
+    cache = LeadResultCache(":memory:")
+    key = LeadResultCache.make_key("Lead Data:\n  Title: CRM", "gpt-4o-mini", 0.7, "1")
+    assert key == LeadResultCache.make_key("Lead Data: Title: CRM ", "gpt-4o-mini", 0.7, "1")
+    assert key != LeadResultCache.make_key("Lead Data: Title: CRM", "gpt-4o", 0.7, "1")
+
+    assert cache.get(key) is None
+    cache.set(key, RESULT)
+    assert cache.get(key) == RESULT
+    assert cache.get(key) == RESULT
+    assert "missing" not in cache  # not counted
+
+    stats = cache.stats()
+    print(f"   Stats: {stats}")
+    assert stats["hits"] == 2 and stats["misses"] == 1
+    assert abs(stats["hit_rate"] - 200 / 3) < 1e-9
+
+    cache.clear()
+    assert cache.stats() == {"hits": 0, "misses": 0, "hit_rate": 0, "memory_entries": 0, "disk_entries": 0}
+    print("✅ Counters reported")
+
+
+def main():
+    """Run all tests"""
+    print("=" * 60)
+    print("Lead Result Cache Test")
+    print("=" * 60)
+
+    tests = [
+        ("TTL Expiry", test_ttl_expiry),
+        ("LRU Eviction", test_lru_eviction),
+        ("Memory-Tier Hits", test_memory_hits_skip_disk),
+        ("Disk Persistence", test_disk_tier_persists),
+        ("Hit/Miss Counters", test_hit_miss_counters),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            test_func()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"❌ {name} test failed: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("Test Summary:")
+    print("=" * 60)
+    for name, result in results:
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{name}: {status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Test script for the auditor result parser
+Runs offline on canned auditor outputs
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agents.result_parser import normalize_result, parse_auditor_output
+
+
+def test_plain_and_fenced_json():
+    """Plain JSON takes the fast path; fenced JSON with prose around it also parses"""
+    print("🔌 Testing plain and fenced JSON...")
+    plain = parse_auditor_output('{"buyability_score": 92, "is_approved": true, "feedback": "strong"}')
+    assert plain.buyability_score == 92 and plain.is_approved and plain.feedback == "strong"
+
+    fenced = parse_auditor_output(
+        'Here is my audit:\n```json\n{"buyability_score": "85/100", '
+        '"mcp_notification": {"notification_type": "high_value_lead_ready"}}\n```\nThanks!'
+    )
+    print(f"   Fenced score: {fenced.buyability_score}, approved: {fenced.is_approved}")
+    assert fenced.buyability_score == 85
+    assert fenced.is_approved  # derived from the score
+    assert fenced.mcp_notification["notification_type"] == "high_value_lead_ready"
+    print("✅ JSON outputs parsed")
+
+
+def test_partial_and_prose_output():
+    """Truncated JSON is repaired; prose falls back to field extraction"""
+    print("\n🔌 Testing partial and prose outputs...")
+    partial = parse_auditor_output('{"buyability_score": 64, "is_approved": false, "feedback": "Generic pi')
+    assert partial.buyability_score == 64 and partial.is_approved is False
+    assert partial.feedback == "Generic pi"
+
+    prose = parse_auditor_output("Buyability score: 71. Is approved: no - the hook is weak.")
+    assert prose.buyability_score == 71 and prose.is_approved is False
+
+    empty = parse_auditor_output("I could not evaluate this lead.")
+    assert empty.buyability_score is None and empty.is_approved is None
+    print("✅ Partial and prose outputs parsed")
+
+
+def test_normalize_result():
+    """Serialized crew outputs and legacy dicts are normalized"""
+    print("\n🔌 Testing crew result normalization...")
+    crew_output = {
+        "raw": "",
+        "tasks_output": [{"raw": "scout"}, {"raw": '```\n{"buyability_score": 88}\n```'}]
+    }
+    assert normalize_result(crew_output).buyability_score == 88
+    assert normalize_result({"validation": {"quality_score": 75}}).buyability_score == 75
+    assert normalize_result({"json_dict": {"buyability_score": 150}}).buyability_score is None
+    print("✅ Crew results normalized")
+
+
+def test_malformed_fields():
+    """Objects or lists where scalars belong drop that field only, never raise"""
+    print("\n🔌 Testing malformed fields...")
+    score_object = parse_auditor_output('{"buyability_score": {"value": 90}, "feedback": "ok"}')
+    assert score_object.buyability_score is None and score_object.feedback == "ok"
+
+    approved_object = parse_auditor_output({"buyability_score": 91, "is_approved": {"yes": True}})
+    print(f"   Score kept: {approved_object.buyability_score}, approved: {approved_object.is_approved}")
+    assert approved_object.buyability_score == 91 and approved_object.is_approved  # derived from the score
+
+    lists = normalize_result({"json_dict": {"buyability_score": [85], "is_approved": [], "feedback": ["a", "b"],
+                                            "protected_asset": ["tier"]}})
+    assert lists.buyability_score is None and lists.is_approved is None and lists.protected_asset is None
+    assert lists.feedback == '["a", "b"]'
+    print("✅ Malformed fields dropped")
+
+
+def main():
+    """Run all tests"""
+    print("=" * 60)
+    print("Auditor Result Parser Test")
+    print("=" * 60)
+
+    tests = [
+        ("Plain/Fenced JSON", test_plain_and_fenced_json),
+        ("Partial/Prose Output", test_partial_and_prose_output),
+        ("Normalize Result", test_normalize_result),
+        ("Malformed Fields", test_malformed_fields),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            test_func()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"❌ {name} test failed: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("Test Summary:")
+    print("=" * 60)
+    for name, result in results:
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{name}: {status}")
+
+
+if __name__ == "__main__":
+    main()
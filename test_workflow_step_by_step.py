@@ -108,8 +108,8 @@ def test_step_3_verify():
             if leads:
                 print(f"\n   Recent leads:")
                 for i, lead in enumerate(leads[:3], 1):
-                    title = lead.get("original_lead", {}).get("title", "N/A")
-                    source = lead.get("original_lead", {}).get("source", "N/A")
+                    title = lead.get("title") or "N/A"
+                    source = lead.get("source") or "N/A"
                     score = lead.get("buyability_score", "N/A")
                     print(f"   {i}. {title[:50]}...")
                     print(f"      Source: {source} | Score: {score}")
@@ -4,24 +4,103 @@ Scrapes buying intent signals from social platforms
 """
 
 import os
-from typing import List, Dict, Any, Optional
+import queue
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import Callable, Iterator, List, Dict, Any, Optional, Tuple
 from apify_client import ApifyClient
 
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.intent_matcher import scraper_intent_matcher
+from tools.lead_model import Lead
+from tools.scrape_cursors import ScrapeCursor, ScrapeCursorStore
+
+# United States (default LinkedIn search region)
+LINKEDIN_GEO_CODE = 92000000
+
+# LinkedIn date filters, narrowest first, with the age of posts each one covers
+LINKEDIN_DATE_RANGES = [
+    ("Past 24 hours", timedelta(days=1)),
+    ("Past week", timedelta(days=7)),
+    ("Past month", timedelta(days=30)),
+]
+
+# Dataset fields each source's normalizer reads; nothing else is downloaded
+ITEM_FIELDS = {
+    "reddit": ["id", "title", "text", "body", "author", "url", "upvotes", "score",
+               "numComments", "comments", "createdAt", "created"],
+    "linkedin": ["id", "title", "jobTitle", "description", "jobDescription", "companyName", "company",
+                 "location", "jobUrl", "url", "postedDate", "datePosted"],
+}
+
+# Fields kept as a lead's raw_data (shown to the agents as "Additional Data") besides the normalized ones
+RAW_FIELDS = {
+    "reddit": ["id", "flair"],
+    "linkedin": ["jobId", "applicants", "employmentType", "seniorityLevel"],
+}
+
+
+def api_record(record: Any) -> Optional[Dict[str, Any]]:
+    """API record (run, user, ...) as a dict of API field names; apify-client 3.x returns pydantic models"""
+    if record is None or isinstance(record, dict):
+        return record
+    return record.model_dump(by_alias=True)
+
 
 class ApifyLeadScraper:
     """Scrapes leads from Reddit and LinkedIn using Apify actors"""
     
-    def __init__(self, api_token: str = None):
-        """Initialize Apify client"""
+    def __init__(self,
+                 api_token: str = None,
+                 api_url: str = None,
+                 max_workers: int = None,
+                 stream_buffer: int = 100,
+                 incremental: bool = False,
+                 cursor_store: ScrapeCursorStore = None,
+                 raw_fields: Dict[str, List[str]] = None):
+        """
+        Initialize Apify client
+        
+        Args:
+            api_token: Apify API token (defaults to APIFY_API_TOKEN)
+            api_url: Apify API base URL (defaults to APIFY_API_URL, else the public API);
+                point it at benchmarks/apify_standin.py to scrape offline
+            max_workers: Maximum number of actor runs in flight at once
+                (defaults to APIFY_MAX_CONCURRENCY or 8)
+            stream_buffer: Maximum number of leads buffered between streaming
+                workers and the consumer
+            incremental: Keep a high-water mark per search and only return (and,
+                where the actor allows, only request) posts newer than the last run
+            cursor_store: Cursor store to use (implies incremental)
+            raw_fields: Extra dataset fields to keep as raw_data, per source
+                (defaults to RAW_FIELDS)
+        """
         self.api_token = api_token or os.getenv("APIFY_API_TOKEN")
         if not self.api_token:
             raise ValueError("APIFY_API_TOKEN not found in environment variables")
-        self.client = ApifyClient(self.api_token)
+        self.client = ApifyClient(self.api_token, api_url=api_url or os.getenv("APIFY_API_URL") or None)
+        self.max_workers = max(1, max_workers or int(os.getenv("APIFY_MAX_CONCURRENCY", "8")))
+        self.stream_buffer = stream_buffer
+        if cursor_store is None and incremental:
+            cursor_store = ScrapeCursorStore()
+        self.cursor_store = cursor_store
+        self.raw_fields = {**RAW_FIELDS, **(raw_fields or {})}
+    
+    def _iterate_items(self, dataset_id: str, source: str) -> Iterator[Dict[str, Any]]:
+        """Dataset items of a run, projected server-side to the fields the source's leads use"""
+        fields = list(dict.fromkeys(ITEM_FIELDS[source] + self.raw_fields.get(source, [])))
+        return self.client.dataset(dataset_id).iterate_items(fields=fields)
     
     def scrape_reddit(self, 
                      keywords: List[str],
                      subreddits: List[str] = None,
-                     max_posts: int = 50) -> List[Dict[str, Any]]:
+                     max_posts: int = 50,
+                     concurrent: bool = True) -> List[Dict[str, Any]]:
         """
         Scrape Reddit for buying intent signals
         
@@ -31,10 +110,27 @@ class ApifyLeadScraper:
             keywords: List of keywords to search for (e.g., ["hiring", "looking for", "need"])
             subreddits: Optional list of subreddits to target
             max_posts: Maximum number of posts to scrape
+            concurrent: Run all subreddit searches at once (bounded by max_workers)
+                instead of one after another
             
         Returns:
             List of lead dictionaries with buying intent signals
         """
+        all_leads = list(self.iter_reddit(keywords, subreddits, max_posts, concurrent))
+        print(f"  ✅ Found {len(all_leads)} Reddit leads with buying intent")
+        return all_leads
+    
+    def iter_reddit(self,
+                    keywords: List[str],
+                    subreddits: List[str] = None,
+                    max_posts: int = 50,
+                    concurrent: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Stream Reddit leads as they are read from each subreddit's dataset
+        
+        Same arguments as scrape_reddit. Stopping iteration early stops the
+        remaining subreddit streams.
+        """
         # Expanded subreddit list - more sources for high-intent leads
         default_subreddits = [
             "startups", "entrepreneur", "SaaS", "smallbusiness", 
@@ -44,75 +140,129 @@ class ApifyLeadScraper:
         ]
         subreddits = subreddits or default_subreddits
         
-        all_leads = []
+        # Use more keywords in search (increased from 3 to 5)
+        search_query = " OR ".join(keywords[:5])
         
         # Search in more subreddits (increased from 3 to 8)
-        for subreddit in subreddits[:8]:
-            try:
-                # Use more keywords in search (increased from 3 to 5)
-                search_query = " OR ".join(keywords[:5])
-                
-                run_input = {
-                    "mode": "search",
-                    "searchQuery": search_query,
-                    "searchSubreddit": subreddit,
-                    "sort": "relevance",
-                    "maxPosts": min(max_posts, 30),  # Increased from 20 to 30 per subreddit
-                    "outputFormat": "text",
-                    "includeComments": False,  # Faster, cheaper
-                }
+        subreddits = subreddits[:8]
+        cursors = {}
+        if self.cursor_store is not None:
+            cursors = {subreddit: self.cursor_store.get("reddit", subreddit, search_query) for subreddit in subreddits}
+        streams = {
+            subreddit: partial(self._iter_subreddit, subreddit, search_query, max_posts, cursors.get(subreddit))
+            for subreddit in subreddits
+        }
+        
+        if concurrent and len(streams) > 1:
+            # Launch every subreddit run at once and read datasets as they finish
+            merged = self._merge_streams(streams)
+            entries = merged
+        else:
+            merged = None
+            entries = self._chain_streams(streams)
+        
+        count = 0
+        finished = set()
+        try:
+            for subreddit, entry in entries:
+                if entry is None:
+                    finished.add(subreddit)
+                    continue
+                lead, item_id, posted_at = entry
+                # Only posts that reach the caller count as seen; buffered ones are read again next run
+                if subreddit in cursors:
+                    cursors[subreddit].observe(item_id, posted_at)
+                if lead is None:
+                    continue
                 
-                print(f"  Searching r/{subreddit} for: {search_query}")
-                run = self.client.actor("benthepythondev/reddit-scraper").call(run_input=run_input)
+                yield lead
+                count += 1
+                if count >= max_posts:
+                    break
+        finally:
+            if merged is not None:
+                merged.close()
+            for subreddit, cursor in cursors.items():
+                # The mark only moves past a subreddit whose every new post was delivered
+                self._save_cursor(cursor, cursor.complete and subreddit in finished, f"r/{subreddit}")
+    
+    def _iter_subreddit(self,
+                        subreddit: str,
+                        search_query: str,
+                        max_posts: int,
+                        cursor: ScrapeCursor = None) -> Iterator[Tuple[Optional[Lead], Optional[str], Any]]:
+        """
+        Run the Reddit actor for a single subreddit and yield (lead, item_id, posted_at) entries
+        
+        Given a cursor, every new post read is yielded (lead None if it shows no
+        buying intent) so the consumer can record what it actually delivered;
+        cursor.complete is set once every new post was read. Errors are caught
+        here so one failing subreddit never affects the others.
+        """
+        # Once a search has a high-water mark, newest-first results let us stop at the first old post
+        newest_first = cursor is not None and cursor.high_water is not None
+        complete = False
+        try:
+            run_input = {
+                "mode": "search",
+                "searchQuery": search_query,
+                "searchSubreddit": subreddit,
+                "sort": "new" if newest_first else "relevance",
+                "maxPosts": min(max_posts, 30),  # Increased from 20 to 30 per subreddit
+                "outputFormat": "text",
+                "includeComments": False,  # Faster, cheaper
+            }
+            
+            print(f"  Searching r/{subreddit} for: {search_query}")
+            run = api_record(self.client.actor("benthepythondev/reddit-scraper").call(run_input=run_input))
+            
+            # Extract leads from dataset
+            dataset_id = run.get("defaultDatasetId") if run else None
+            if not dataset_id:
+                return
+            
+            count = 0
+            read = 0
+            reached_old = False
+            for item in self._iterate_items(dataset_id, "reddit"):
+                read += 1
+                posted_at = item.get("createdAt", item.get("created", ""))
+                item_id = item.get("id") or item.get("url")
+                if cursor is not None:
+                    if newest_first and cursor.is_older(posted_at):
+                        reached_old = True
+                        break
+                    if not cursor.check(item_id, posted_at):
+                        continue
                 
-                # Extract leads from dataset
-                dataset_id = run.get("defaultDatasetId")
-                if dataset_id:
-                    for item in self.client.dataset(dataset_id).iterate_items():
-                        # Check if post content matches buying intent keywords
-                        title = item.get("title", "")
-                        text = item.get("text", "") or item.get("body", "") or ""
-                        content = f"{title} {text}".lower()
-                        
-                        # Expanded intent keywords - more signals to catch
-                        intent_keywords = [
-                            "need", "looking for", "hiring", "seeking", "want", "searching", 
-                            "recommend", "suggest", "best", "alternatives", "replace", "switching",
-                            "evaluate", "comparing", "deciding", "choose", "select", "purchase",
-                            "buy", "implement", "integrate", "migrate", "upgrade", "frustrated",
-                            "problem", "issue", "struggling", "challenge", "pain", "solution",
-                            "help", "advice", "opinion", "experience", "review", "trial"
-                        ]
-                        if any(keyword in content for keyword in intent_keywords):
-                            lead = {
-                                "source": "reddit",
-                                "platform": "reddit",
-                                "title": title,
-                                "content": text or title,
-                                "author": item.get("author", ""),
-                                "subreddit": subreddit,
-                                "url": item.get("url", ""),
-                                "upvotes": item.get("upvotes", item.get("score", 0)),
-                                "comments": item.get("numComments", item.get("comments", 0)),
-                                "posted_at": item.get("createdAt", item.get("created", "")),
-                                "raw_data": item
-                            }
-                            all_leads.append(lead)
-                            
-                            if len(all_leads) >= max_posts:
-                                break
+                # Check if post content matches buying intent keywords
+                title = item.get("title", "")
+                text = item.get("text", "") or item.get("body", "") or ""
                 
-            except Exception as e:
-                print(f"  ⚠️  Error scraping r/{subreddit}: {e}")
-                continue
-        
-        print(f"  ✅ Found {len(all_leads)} Reddit leads with buying intent")
-        return all_leads[:max_posts]
+                if scraper_intent_matcher.search(f"{title} {text}"):
+                    yield Lead.from_reddit(item, subreddit, self.raw_fields.get("reddit", [])), item_id, posted_at
+                    
+                    count += 1
+                    if count >= max_posts:
+                        break
+                elif cursor is not None:
+                    yield None, item_id, posted_at
+            else:
+                # A full page of only new posts may hide more new posts behind it
+                complete = not newest_first or read < run_input["maxPosts"]
+            complete = complete or reached_old
+            
+        except Exception as e:
+            print(f"  ⚠️  Error scraping r/{subreddit}: {e}")
+        finally:
+            if cursor is not None:
+                cursor.complete = complete
     
     def scrape_linkedin(self,
                        keywords: List[str],
                        location: str = None,
-                       max_results: int = 50) -> List[Dict[str, Any]]:
+                       max_results: int = 50,
+                       concurrent: bool = True) -> List[Dict[str, Any]]:
         """
         Scrape LinkedIn for buying intent signals
         
@@ -122,65 +272,199 @@ class ApifyLeadScraper:
             keywords: List of keywords to search for
             location: Optional location filter
             max_results: Maximum number of results
+            concurrent: Query all date ranges at once and abort the remaining
+                runs as soon as max_results unique postings are collected
             
         Returns:
             List of lead dictionaries with buying intent signals
         """
+        all_leads = list(self.iter_linkedin(keywords, location, max_results, concurrent))
+        print(f"  ✅ Found {len(all_leads)} LinkedIn leads")
+        return all_leads
+    
+    def iter_linkedin(self,
+                      keywords: List[str],
+                      location: str = None,
+                      max_results: int = 50,
+                      concurrent: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Stream unique LinkedIn job postings as they are read from each run's dataset
+        
+        Same arguments as scrape_linkedin.
+        """
+        merged = None
+        cursor = None
+        started = []
+        runs = {}  # date range -> run whose dataset is not fully read yet
+        complete = False
         try:
             # Use more keywords (increased from 3 to 5)
             search_keywords = " ".join(keywords[:5])
+            if self.cursor_store is not None:
+                cursor = self.cursor_store.get("linkedin", LINKEDIN_GEO_CODE, search_keywords)
             
-            # Try multiple date ranges to get more results
-            all_leads = []
-            date_ranges = ["Past 24 hours", "Past week", "Past month"]  # Multiple timeframes
+            # Try multiple date ranges to get more results (only the newest one needed since the last run)
+            date_ranges = self._linkedin_date_ranges(cursor)
+            seen = set()
+            count = 0
             
-            for date_range in date_ranges:
-                if len(all_leads) >= max_results:
-                    break
-                    
-                run_input = {
-                    "keywords": search_keywords,
-                    "geo_code": 92000000,  # United States (default)
-                    "date_posted": date_range,
-                    "sort_by": "Most recent",
-                    "start": 0
-                }
+            if concurrent:
+                for date_range in date_ranges:
+                    run = self._start_linkedin_run(search_keywords, date_range)
+                    if run:
+                        runs[date_range] = run
+                        started.append(run)
                 
-                print(f"  Searching LinkedIn jobs ({date_range}) for: {search_keywords}")
-                try:
-                    run = self.client.actor("freshdata/linkedin-job-scraper").call(run_input=run_input)
+                merged = self._merge_streams({
+                    date_range: partial(self._iter_linkedin_run, date_range, run, location, cursor)
+                    for date_range, run in runs.items()
+                })
+                for date_range, entry in merged:
+                    if entry is None:
+                        runs.pop(date_range, None)
+                        continue
+                    lead, item_id, posted_at = entry
+                    # Only postings that reach the caller count as seen; buffered ones are read again next run
+                    if cursor is not None:
+                        cursor.observe(item_id, posted_at)
+                    if not self._first_sighting(lead, seen):
+                        continue
                     
-                    dataset_id = run.get("defaultDatasetId")
+                    yield lead
+                    count += 1
+                    if count >= max_results:
+                        break
+                else:
+                    complete = True
+            else:
+                for date_range in date_ranges:
+                    run = self._start_linkedin_run(search_keywords, date_range)
+                    if not run:
+                        continue
+                    runs[date_range] = run
+                    started.append(run)
                     
-                    if dataset_id:
-                        for item in self.client.dataset(dataset_id).iterate_items():
-                            # Job postings indicate hiring/tech stack changes (buying intent)
-                            lead = {
-                                "source": "linkedin",
-                                "platform": "linkedin",
-                                "title": item.get("title", item.get("jobTitle", "")),
-                                "content": item.get("description", item.get("jobDescription", "")),
-                                "company": item.get("companyName", item.get("company", "")),
-                                "location": item.get("location", location or ""),
-                                "url": item.get("jobUrl", item.get("url", "")),
-                                "posted_at": item.get("postedDate", item.get("datePosted", "")),
-                                "raw_data": item
-                            }
-                            all_leads.append(lead)
-                            
-                            if len(all_leads) >= max_results:
-                                break
-                except Exception as e:
-                    print(f"  ⚠️  Error searching {date_range}: {e}")
-                    continue
-            
-            print(f"  ✅ Found {len(all_leads)} LinkedIn leads")
-            return all_leads[:max_results]
+                    for lead, item_id, posted_at in self._iter_linkedin_run(date_range, run, location, cursor):
+                        if cursor is not None:
+                            cursor.observe(item_id, posted_at)
+                        if not self._first_sighting(lead, seen):
+                            continue
+                        
+                        yield lead
+                        count += 1
+                        if count >= max_results:
+                            return
+                    runs.pop(date_range, None)
+                complete = True
             
         except Exception as e:
             print(f"  ⚠️  LinkedIn scraping error: {e}")
-            # Fallback: return empty list
-            return []
+        finally:
+            if not complete:
+                # Stopped early (max_results, or the caller went away) - stop paying for runs still going
+                self._abort_runs(runs)
+            if merged is not None:
+                merged.close()
+            if cursor is not None:
+                # Only a run where every date range finished and was read moves the mark
+                complete = complete and len(started) == len(date_ranges) and all(
+                    run.get("status") == "SUCCEEDED" for run in started
+                )
+                self._save_cursor(cursor, complete, "LinkedIn")
+    
+    @staticmethod
+    def _linkedin_date_ranges(cursor: Optional[ScrapeCursor]) -> List[str]:
+        """Every date range on a first run; afterwards the narrowest one reaching back to the mark"""
+        if cursor is None or cursor.high_water is None:
+            return [label for label, _ in LINKEDIN_DATE_RANGES]
+        age = datetime.now(timezone.utc) - cursor.high_water
+        for label, window in LINKEDIN_DATE_RANGES:
+            if age <= window:
+                return [label]
+        return [label for label, _ in LINKEDIN_DATE_RANGES]
+    
+    def _save_cursor(self, cursor: ScrapeCursor, complete: bool, label: str) -> None:
+        """Persist a search's cursor; the mark only moves after a complete read"""
+        try:
+            self.cursor_store.save(cursor, advance=complete)
+            if cursor.skipped_items:
+                print(f"  ⏩ {label}: skipped {cursor.skipped_items} posts already seen")
+        except Exception as e:
+            print(f"  ⚠️  Could not save {label} scrape cursor: {e}")
+    
+    def _start_linkedin_run(self, search_keywords: str, date_range: str) -> Optional[Dict[str, Any]]:
+        """Start (without waiting for) a LinkedIn job search run for one date range"""
+        run_input = {
+            "keywords": search_keywords,
+            "geo_code": LINKEDIN_GEO_CODE,
+            "date_posted": date_range,
+            "sort_by": "Most recent",
+            "start": 0
+        }
+        
+        print(f"  Searching LinkedIn jobs ({date_range}) for: {search_keywords}")
+        try:
+            return api_record(self.client.actor("freshdata/linkedin-job-scraper").start(run_input=run_input))
+        except Exception as e:
+            print(f"  ⚠️  Error searching {date_range}: {e}")
+            return None
+    
+    def _iter_linkedin_run(self,
+                           date_range: str,
+                           run: Dict[str, Any],
+                           location: Optional[str],
+                           cursor: ScrapeCursor = None) -> Iterator[Tuple[Lead, Optional[str], Any]]:
+        """
+        Wait for a LinkedIn run to finish and yield its job postings as (lead, item_id, posted_at)
+        
+        Given a cursor, only postings it has not seen are yielded; recording them
+        as seen is left to the consumer.
+        """
+        try:
+            finished = api_record(self.client.run(run["id"]).wait_for_finish())
+            if not finished:
+                return
+            # Record the final status so _abort_runs skips runs that are already done
+            run.update(finished)
+            if finished.get("status") != "SUCCEEDED":
+                return
+            
+            dataset_id = finished.get("defaultDatasetId")
+            if not dataset_id:
+                return
+            
+            for item in self._iterate_items(dataset_id, "linkedin"):
+                posted_at = item.get("postedDate", item.get("datePosted", ""))
+                item_id = item.get("jobUrl") or item.get("url") or item.get("id")
+                if cursor is not None and not cursor.check(item_id, posted_at):
+                    continue
+                
+                # Job postings indicate hiring/tech stack changes (buying intent)
+                yield Lead.from_linkedin(item, location, self.raw_fields.get("linkedin", [])), item_id, posted_at
+        except Exception as e:
+            print(f"  ⚠️  Error searching {date_range}: {e}")
+    
+    @staticmethod
+    def _first_sighting(lead: Lead, seen: set) -> bool:
+        """Record a job posting and return False if it was already seen"""
+        # The same posting shows up in every wider date range
+        key = lead.url or (lead.title, lead.company)
+        if key in seen:
+            return False
+        seen.add(key)
+        return True
+    
+    def _abort_runs(self, runs: Dict[str, Dict[str, Any]]) -> None:
+        """Abort actor runs that are still in progress"""
+        for label, run in runs.items():
+            if run.get("status") not in ("READY", "RUNNING"):
+                continue
+            try:
+                aborted = api_record(self.client.run(run["id"]).abort())
+                if aborted and aborted.get("status") in ("ABORTING", "ABORTED"):
+                    print(f"  ⏹️  Aborted {label} run (no longer needed)")
+            except Exception as e:
+                print(f"  ⚠️  Could not abort {label} run: {e}")
     
     def scrape_all(self, 
                   keywords: List[str],
@@ -190,26 +474,135 @@ class ApifyLeadScraper:
         """
         Scrape both Reddit and LinkedIn
         
+        Each source runs as its own parallel branch, so total latency is roughly
+        that of the slowest source. To add a source, add another entry to
+        ``branches`` below.
+        
         Returns:
             Dictionary with 'reddit' and 'linkedin' keys containing lists of leads
         """
-        reddit_leads = self.scrape_reddit(
-            keywords=keywords,
-            subreddits=reddit_subreddits,
-            max_posts=max_per_source
-        )
-        
-        linkedin_leads = self.scrape_linkedin(
-            keywords=keywords,
-            location=linkedin_location,
-            max_results=max_per_source
-        )
-        
-        return {
-            "reddit": reddit_leads,
-            "linkedin": linkedin_leads,
-            "total": len(reddit_leads) + len(linkedin_leads)
+        branches = {
+            "reddit": lambda: self.scrape_reddit(
+                keywords=keywords,
+                subreddits=reddit_subreddits,
+                max_posts=max_per_source
+            ),
+            "linkedin": lambda: self.scrape_linkedin(
+                keywords=keywords,
+                location=linkedin_location,
+                max_results=max_per_source
+            ),
         }
+        
+        results = self._run_branches(branches)
+        results["total"] = sum(len(leads) for leads in results.values())
+        return results
+    
+    def _run_branches(self, branches: Dict[str, Callable[[], List[Dict[str, Any]]]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Run independent scrape branches in parallel
+        
+        Args:
+            branches: Mapping of source name to a zero-argument callable returning leads
+            
+        Returns:
+            Mapping of source name to its leads (an empty list if the branch failed)
+        """
+        results = {}
+        with ThreadPoolExecutor(max_workers=len(branches) or 1) as executor:
+            futures = {executor.submit(branch): name for name, branch in branches.items()}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    print(f"  ⚠️  {name} scraping error: {e}")
+                    results[name] = []
+        
+        # Keep the caller's branch order regardless of completion order
+        return {name: results[name] for name in branches}
+    
+    def iter_all(self,
+                 keywords: List[str],
+                 reddit_subreddits: List[str] = None,
+                 linkedin_location: str = None,
+                 max_per_source: int = 50) -> Iterator[Dict[str, Any]]:
+        """
+        Stream leads from Reddit and LinkedIn as soon as either source produces one
+        
+        Streaming counterpart of scrape_all; leads from the two sources are interleaved.
+        """
+        streams = {
+            "reddit": partial(self.iter_reddit, keywords, reddit_subreddits, max_per_source),
+            "linkedin": partial(self.iter_linkedin, keywords, linkedin_location, max_per_source),
+        }
+        
+        merged = self._merge_streams(streams)
+        try:
+            for _, lead in merged:
+                if lead is not None:
+                    yield lead
+        finally:
+            merged.close()
+    
+    @staticmethod
+    def _chain_streams(streams: Dict[str, Callable[[], Iterator[Any]]]) -> Iterator[Tuple[str, Any]]:
+        """Sequential counterpart of _merge_streams: each stream in turn, in the same (name, item) shape"""
+        for name, stream in streams.items():
+            for item in stream():
+                yield name, item
+            yield name, None
+    
+    def _merge_streams(self,
+                       streams: Dict[str, Callable[[], Iterator[Dict[str, Any]]]]) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Interleave several lead streams, each consumed on its own worker thread
+        
+        Items pass through a bounded queue, so memory stays flat however large the
+        datasets are. Closing the returned generator signals the producers to stop.
+        
+        Args:
+            streams: Mapping of stream name to a zero-argument callable returning an iterator
+            
+        Yields:
+            (name, lead) tuples in arrival order, and (name, None) once a stream is exhausted
+        """
+        results = queue.Queue(maxsize=self.stream_buffer)
+        stop = threading.Event()
+        
+        def put(entry) -> bool:
+            while not stop.is_set():
+                try:
+                    results.put(entry, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def produce(name, stream):
+            try:
+                for item in stream():
+                    if not put((name, item)):
+                        return
+            except Exception as e:
+                print(f"  ⚠️  {name} stream error: {e}")
+            finally:
+                put((name, None))
+        
+        executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(streams)) or 1)
+        for name, stream in streams.items():
+            executor.submit(produce, name, stream)
+        
+        remaining = len(streams)
+        try:
+            while remaining:
+                name, item = results.get()
+                if item is None:
+                    remaining -= 1
+                yield name, item
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,68 @@
+"""
+Buying Intent Keyword Matcher
+Precompiled multi-keyword matcher shared by the scraper and the lead validator
+"""
+
+import re
+from typing import Iterable, List, Tuple
+
+
+class IntentMatcher:
+    """
+    Finds buying intent keywords in text with a single compiled regex
+
+    All keywords are folded into one alternation (longest first), so a text is
+    scanned once no matter how many keywords there are. Matches are anchored at
+    the start of a word: "needs" and "recommendations" still count as "need"
+    and "recommend", but "tissue" no longer matches "issue".
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        # Deduplicate while keeping order, then sort longest first so
+        # "looking for" wins over "looking" at the same position
+        self.keywords = list(dict.fromkeys(kw.lower() for kw in keywords))
+        alternation = "|".join(
+            re.escape(kw) for kw in sorted(self.keywords, key=len, reverse=True)
+        )
+        self._pattern = re.compile(rf"\b(?:{alternation})", re.IGNORECASE)
+
+    def search(self, text: str) -> bool:
+        """Return True as soon as any keyword is found"""
+        return bool(text) and self._pattern.search(text) is not None
+
+    def find_all(self, text: str) -> List[Tuple[str, int]]:
+        """
+        Find every keyword occurrence in one pass
+
+        Returns:
+            List of (keyword, offset) tuples in order of appearance
+        """
+        if not text:
+            return []
+        return [(m.group(0).lower(), m.start()) for m in self._pattern.finditer(text)]
+
+    def matched_keywords(self, text: str) -> List[str]:
+        """Return the distinct keywords found in text, in order of first appearance"""
+        return list(dict.fromkeys(kw for kw, _ in self.find_all(text)))
+
+
+# Signals used to filter scraped Reddit posts
+SCRAPER_INTENT_KEYWORDS = [
+    "need", "looking for", "hiring", "seeking", "want", "searching",
+    "recommend", "suggest", "best", "alternatives", "replace", "switching",
+    "evaluate", "comparing", "deciding", "choose", "select", "purchase",
+    "buy", "implement", "integrate", "migrate", "upgrade", "frustrated",
+    "problem", "issue", "struggling", "challenge", "pain", "solution",
+    "help", "advice", "opinion", "experience", "review", "trial"
+]
+
+# Signals the validation tool scores as buying intent
+VALIDATION_INTENT_KEYWORDS = [
+    "hiring", "looking", "need", "seeking", "want", "searching",
+    "looking for", "in search of", "require", "seeking to",
+    "interested in", "considering", "evaluating", "comparing"
+]
+
+# Built once at import time and shared by every caller
+scraper_intent_matcher = IntentMatcher(SCRAPER_INTENT_KEYWORDS)
+validation_intent_matcher = IntentMatcher(VALIDATION_INTENT_KEYWORDS)
@@ -0,0 +1,230 @@
+"""
+Lead Deduplication Index
+Drops repeated and near-duplicate leads across sources and runs before any LLM spend
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that never change what a URL points to
+TRACKING_PARAMS = {"ref", "refid", "trackingid", "trk", "src", "source", "share_id", "context"}
+
+# Hosts where the path alone identifies the post or job
+PATH_ONLY_HOSTS = {"reddit.com", "linkedin.com"}
+
+# Texts shorter than this are too generic to match on ("Software Engineer") - URL only
+MIN_NEAR_DUP_TOKENS = 8
+
+_URL_RE = re.compile(r"https?://\S+")
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+DEFAULT_DB_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "lead_dedup.db"
+)
+
+
+def canonical_url(url: Optional[str]) -> str:
+    """
+    Normalize a lead URL so the same post or job maps to one key
+
+    Lowercases scheme and host, drops "www."/"old." prefixes, fragments,
+    trailing slashes and tracking parameters.
+    """
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    for prefix in ("www.", "old.", "m."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    path = parts.path.rstrip("/")
+
+    if host in PATH_ONLY_HOSTS:
+        query = ""
+    else:
+        query = urlencode(sorted(
+            (k, v) for k, v in parse_qsl(parts.query)
+            if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS
+        ))
+    return urlunsplit(("https", host, path, query, ""))
+
+
+def text_tokens(lead: Dict[str, Any]) -> List[str]:
+    """Normalized word tokens of a lead's title and content"""
+    text = f"{lead.get('title') or ''} {lead.get('content') or ''}".lower()
+    return _TOKEN_RE.findall(_URL_RE.sub(" ", text))
+
+
+def lead_owner(lead: Dict[str, Any]) -> str:
+    """Normalized company and author of a lead; text only matches between leads of the same owner"""
+    return "|".join(
+        " ".join(_TOKEN_RE.findall(str(lead.get(key) or "").lower())) for key in ("company", "author")
+    )
+
+
+def simhash(tokens: List[str]) -> int:
+    """64-bit SimHash over word 3-shingles (single words for very short texts)"""
+    if len(tokens) >= 3:
+        features = [" ".join(tokens[i:i + 3]) for i in range(len(tokens) - 2)]
+    else:
+        features = tokens
+
+    weights = [0] * 64
+    for feature in features:
+        h = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+        for bit in range(64):
+            weights[bit] += 1 if (h >> bit) & 1 else -1
+
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
+
+
+def _bands(fingerprint: int) -> Tuple[int, int, int, int]:
+    """Split a fingerprint into four 16-bit bands"""
+    return tuple((fingerprint >> shift) & 0xFFFF for shift in (0, 16, 32, 48))
+
+
+def _to_signed(value: int) -> int:
+    """SQLite integers are signed 64-bit"""
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+class LeadDedupIndex:
+    """
+    Persistent index of leads already sent to the agents
+
+    A lead is a duplicate when its canonical URL has been seen, or when its
+    text SimHash is within max_distance bits of one already indexed from the
+    same company/author. Two leads that both have a URL are only ever matched
+    on the URL, and texts under MIN_NEAR_DUP_TOKENS tokens are never matched.
+    Fingerprints are split into four 16-bit bands; by the pigeonhole principle
+    any fingerprint within 3 bits shares at least one band, so lookups only
+    compare the few rows that share a band (all band columns are indexed).
+    """
+
+    def __init__(self, db_path: str = None, max_distance: int = 3):
+        """
+        Initialize the index
+
+        Args:
+            db_path: SQLite file (defaults to LEAD_DEDUP_DB or data/lead_dedup.db);
+                use ":memory:" for a throwaway index
+            max_distance: Maximum Hamming distance between near-duplicate fingerprints (<= 3)
+        """
+        self.db_path = db_path or os.getenv("LEAD_DEDUP_DB", DEFAULT_DB_PATH)
+        self.max_distance = min(max_distance, 3)
+        if self.db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS seen_leads (
+                id INTEGER PRIMARY KEY,
+                url TEXT,
+                owner TEXT NOT NULL DEFAULT '',
+                simhash INTEGER NOT NULL,
+                near_dup INTEGER NOT NULL,
+                band0 INTEGER NOT NULL,
+                band1 INTEGER NOT NULL,
+                band2 INTEGER NOT NULL,
+                band3 INTEGER NOT NULL,
+                source TEXT,
+                title TEXT,
+                first_seen TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_seen_url ON seen_leads(url);
+            CREATE INDEX IF NOT EXISTS idx_seen_band0 ON seen_leads(band0);
+            CREATE INDEX IF NOT EXISTS idx_seen_band1 ON seen_leads(band1);
+            CREATE INDEX IF NOT EXISTS idx_seen_band2 ON seen_leads(band2);
+            CREATE INDEX IF NOT EXISTS idx_seen_band3 ON seen_leads(band3);
+        """)
+        # Indexes created before leads were matched per owner
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(seen_leads)")}
+        if "owner" not in columns:
+            self._conn.execute("ALTER TABLE seen_leads ADD COLUMN owner TEXT NOT NULL DEFAULT ''")
+        self._conn.commit()
+
+    def _fingerprint(self, lead: Dict[str, Any]) -> Tuple[str, str, int, bool]:
+        """(canonical URL, owner, text SimHash, whether the text is long enough to match on)"""
+        tokens = text_tokens(lead)
+        return canonical_url(lead.get("url")), lead_owner(lead), simhash(tokens), len(tokens) >= MIN_NEAR_DUP_TOKENS
+
+    def _matches(self, a: Tuple[str, str, int, bool], b: Tuple[str, str, int, bool]) -> bool:
+        url, owner, fingerprint, near_dup = a
+        other_url, other_owner, other, other_near = b
+        if url and other_url:
+            # Distinct posts or jobs can share a text (the same job title at two companies)
+            return url == other_url
+        if not (near_dup and other_near) or owner != other_owner:
+            return False
+        return bin(fingerprint ^ other).count("1") <= self.max_distance
+
+    def _seen(self, lead_key: Tuple[str, str, int, bool]) -> bool:
+        url, owner, fingerprint, near_dup = lead_key
+        if url and self._conn.execute(
+            "SELECT 1 FROM seen_leads WHERE url = ? LIMIT 1", (url,)
+        ).fetchone():
+            return True
+        if not near_dup:
+            return False
+
+        b0, b1, b2, b3 = _bands(fingerprint)
+        rows = self._conn.execute(
+            "SELECT url, owner, simhash, near_dup FROM seen_leads "
+            "WHERE owner = ? AND near_dup = 1 AND (band0 = ? OR band1 = ? OR band2 = ? OR band3 = ?)",
+            (owner, b0, b1, b2, b3)
+        )
+        return any(
+            self._matches(lead_key, (stored_url or "", stored_owner, stored % (1 << 64), bool(stored_near_dup)))
+            for stored_url, stored_owner, stored, stored_near_dup in rows
+        )
+
+    def is_duplicate(self, lead: Dict[str, Any]) -> bool:
+        """Return True if the lead (or a near-duplicate) is already indexed"""
+        with self._lock:
+            return self._seen(self._fingerprint(lead))
+
+    def add(self, lead: Dict[str, Any]) -> None:
+        """Record a lead so later runs treat it as seen"""
+        url, owner, fingerprint, near_dup = self._fingerprint(lead)
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO seen_leads "
+                "(url, owner, simhash, near_dup, band0, band1, band2, band3, source, title, first_seen) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, owner, _to_signed(fingerprint), int(near_dup), *_bands(fingerprint),
+                 lead.get("source"), (lead.get("title") or "")[:200], datetime.now().isoformat())
+            )
+            self._conn.commit()
+
+    def filter_new(self, leads: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Drop leads already indexed and duplicates within the batch itself
+
+        The index is not modified; call add() for the leads that are actually processed.
+        """
+        new_leads = []
+        batch: List[Tuple[str, str, int, bool]] = []
+        with self._lock:
+            for lead in leads:
+                lead_key = self._fingerprint(lead)
+                if self._seen(lead_key) or any(self._matches(lead_key, other) for other in batch):
+                    continue
+                batch.append(lead_key)
+                new_leads.append(lead)
+        return new_leads
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM seen_leads").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
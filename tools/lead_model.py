@@ -0,0 +1,239 @@
+"""
+Compact Lead Record
+Scraped leads normalized once, with __slots__, interned enum-like fields and
+compressed out-of-line blobs
+"""
+
+import json
+import os
+import sys
+import zlib
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional
+
+# Text blobs (content, raw_data) longer than this many bytes are kept zlib-compressed
+BLOB_COMPRESS_BYTES = int(os.getenv("LEAD_BLOB_COMPRESS_BYTES", "512"))
+
+# Keys of a lead, in the order they are listed and serialized
+FIELDS = (
+    "source", "platform", "title", "content", "author", "company", "location", "subreddit",
+    "url", "upvotes", "comments", "posted_at", "raw_data", "prefilter_score"
+)
+
+# Few distinct values shared by many leads - one string object each
+_INTERNED = frozenset({"source", "platform", "company", "location", "subreddit"})
+
+# Older or other scrapers' names for the same fields
+_ALIASES = {
+    "title": ("name",),
+    "content": ("headline", "text"),
+    "posted_at": ("createdAt",),
+}
+
+
+def _pack_text(text: Optional[str]) -> Any:
+    """Long text as compressed UTF-8 bytes, short text as is"""
+    if text is None:
+        return None
+    data = text.encode("utf-8")
+    if len(data) <= BLOB_COMPRESS_BYTES:
+        return text
+    packed = zlib.compress(data, 1)
+    return packed if len(packed) < len(data) else text
+
+
+def _unpack_text(value: Any) -> Optional[str]:
+    return zlib.decompress(value).decode("utf-8") if isinstance(value, bytes) else value
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+class Lead(MutableMapping):
+    """
+    One scraped lead
+
+    Behaves like the lead dicts the pipeline used before (lead["title"],
+    lead.get("company", "N/A"), dict(lead), {**lead}), so dict-based code keeps
+    working, while normalized attributes (lead.title, lead.content) skip the
+    lookup fallbacks. Every key in FIELDS can be read (lead["company"] is None
+    when the source had none), but a field that is None is left out of
+    iteration, `in` and dict(lead), as if the key were absent. content and
+    raw_data are stored out of line as (compressed) bytes and decoded on access,
+    so edit raw_data by assigning a new dict. Keys outside FIELDS (from leads
+    posted to the API) are kept in `extra`.
+    """
+
+    __slots__ = (
+        "source", "platform", "title", "_content", "author", "company", "location", "subreddit",
+        "url", "upvotes", "comments", "posted_at", "_raw_data", "prefilter_score", "extra"
+    )
+
+    def __init__(self, source: str = None, platform: str = None, title: str = None, content: str = None,
+                 author: str = None, company: str = None, location: str = None, subreddit: str = None,
+                 url: str = None, upvotes: int = None, comments: int = None, posted_at: Any = None,
+                 raw_data: Dict[str, Any] = None, prefilter_score: float = None,
+                 extra: Dict[str, Any] = None):
+        self.source = _intern(source)
+        self.platform = _intern(platform)
+        self.title = title
+        self.content = content
+        self.author = author
+        self.company = _intern(company)
+        self.location = _intern(location)
+        self.subreddit = _intern(subreddit)
+        self.url = url
+        self.upvotes = upvotes
+        self.comments = comments
+        self.posted_at = posted_at
+        self.raw_data = raw_data
+        self.prefilter_score = prefilter_score
+        self.extra = extra or None
+
+    @property
+    def content(self) -> Optional[str]:
+        return _unpack_text(self._content)
+
+    @content.setter
+    def content(self, value: Optional[str]) -> None:
+        self._content = _pack_text(value)
+
+    @property
+    def raw_data(self) -> Optional[Dict[str, Any]]:
+        raw = self._raw_data
+        return None if raw is None else json.loads(_unpack_text(raw))
+
+    @raw_data.setter
+    def raw_data(self, value: Optional[Dict[str, Any]]) -> None:
+        self._raw_data = _pack_text(json.dumps(value, separators=(",", ":"), default=str)) if value else None
+
+    # ---- Construction ----
+
+    @classmethod
+    def from_reddit(cls, item: Dict[str, Any], subreddit: str, raw_fields: Iterable[str] = ()) -> "Lead":
+        """Lead of a reddit-scraper dataset item"""
+        title = item.get("title", "")
+        text = item.get("text", "") or item.get("body", "") or ""
+        return cls(
+            source="reddit",
+            platform="reddit",
+            title=title,
+            content=text or title,
+            author=item.get("author", ""),
+            subreddit=subreddit,
+            url=item.get("url", ""),
+            upvotes=item.get("upvotes", item.get("score", 0)),
+            comments=item.get("numComments", item.get("comments", 0)),
+            posted_at=item.get("createdAt", item.get("created", "")),
+            raw_data=cls._raw_fields(item, raw_fields)
+        )
+
+    @classmethod
+    def from_linkedin(cls, item: Dict[str, Any], location: str = None, raw_fields: Iterable[str] = ()) -> "Lead":
+        """Lead of a linkedin-job-scraper dataset item"""
+        return cls(
+            source="linkedin",
+            platform="linkedin",
+            title=item.get("title", item.get("jobTitle", "")),
+            content=item.get("description", item.get("jobDescription", "")),
+            company=item.get("companyName", item.get("company", "")),
+            location=item.get("location", location or ""),
+            url=item.get("jobUrl", item.get("url", "")),
+            posted_at=item.get("postedDate", item.get("datePosted", "")),
+            raw_data=cls._raw_fields(item, raw_fields)
+        )
+
+    @staticmethod
+    def _raw_fields(item: Dict[str, Any], raw_fields: Iterable[str]) -> Dict[str, Any]:
+        return {key: item[key] for key in raw_fields if item.get(key) is not None}
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Lead":
+        """Lead of a plain dict (API payloads, stored records), resolving aliased keys once"""
+        values = {}
+        extra = {}
+        for key, value in data.items():
+            if key in FIELDS:
+                values[key] = value
+            else:
+                extra[key] = value
+        for key, aliases in _ALIASES.items():
+            if values.get(key) is None:
+                for alias in aliases:
+                    if extra.get(alias) is not None:
+                        values[key] = extra[alias]
+                        break
+        return cls(**values, extra=extra)
+
+    @classmethod
+    def from_json(cls, text: str) -> "Lead":
+        return cls.from_dict(json.loads(text))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict of the set fields (JSON-serializable for scraped leads)"""
+        return dict(self.items())
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), default=str)
+
+    # ---- Mapping interface ----
+
+    def __getitem__(self, key: str) -> Any:
+        if key in FIELDS:
+            # Sources leave fields out or null them - reading one must not end a scrape
+            return getattr(self, key)
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        if key in FIELDS:
+            return getattr(self, key) is not None
+        return self.extra is not None and key in self.extra
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in FIELDS:
+            setattr(self, key, _intern(value) if key in _INTERNED else value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        if key in FIELDS:
+            setattr(self, key, None)
+        else:
+            del self.extra[key]
+
+    def __iter__(self) -> Iterator[str]:
+        for key in FIELDS:
+            if getattr(self, key) is not None:
+                yield key
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        # Mapping.get goes through __getitem__ and an exception per missing key
+        value = getattr(self, key, None) if key in FIELDS else (self.extra or {}).get(key)
+        return default if value is None else value
+
+    def __repr__(self) -> str:
+        return f"Lead(source={self.source!r}, title={(self.title or '')[:40]!r}, url={self.url!r})"
+
+    def __getstate__(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            object.__setattr__(self, slot, value)
+
+
+def as_lead(lead: Mapping[str, Any]) -> Lead:
+    """The lead itself if it already is a Lead, else Lead.from_dict"""
+    return lead if isinstance(lead, Lead) else Lead.from_dict(lead)
@@ -0,0 +1,180 @@
+"""
+Deterministic Lead Scoring
+Cheap local heuristics used by the validation tool and the pre-agent filter
+"""
+
+import math
+import os
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from tools.intent_matcher import validation_intent_matcher
+
+_RELATIVE_AGE_RE = re.compile(r"(\d+)\s*(minute|hour|day|week|month|year)s?\s+ago", re.IGNORECASE)
+_UNIT_DAYS = {"minute": 1 / 1440, "hour": 1 / 24, "day": 1, "week": 7, "month": 30, "year": 365}
+
+# Weights of the pre-filter score components (sum to 1)
+QUALITY_WEIGHT = 0.7
+ENGAGEMENT_WEIGHT = 0.15
+RECENCY_WEIGHT = 0.15
+
+# Upvotes + 2 * comments at which engagement saturates
+ENGAGEMENT_SATURATION = 200
+
+# Posts older than this many days get no recency credit
+RECENCY_WINDOW_DAYS = 30
+
+
+def validate_lead(lead_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Score lead completeness, detail, buying intent and contact information (0-100)
+
+    Returns:
+        Validation report with quality_score, is_valid, issues, strengths,
+        found_keywords and validation_details
+    """
+    validation_score = 0
+    max_score = 0
+    issues = []
+    strengths = []
+
+    # Check required fields (20 points)
+    max_score += 20
+    required_fields = ["source", "content"]
+    for field in required_fields:
+        if not lead_data.get(field):
+            issues.append(f"Missing required field: {field}")
+        else:
+            validation_score += 10
+            strengths.append(f"Has {field}")
+
+    # Check content quality - length and substance (30 points)
+    max_score += 30
+    content = lead_data.get("content", "") or lead_data.get("title", "") or lead_data.get("headline", "")
+    if len(content) < 50:
+        issues.append("Content too short (< 50 chars)")
+    elif len(content) < 100:
+        validation_score += 15
+        issues.append("Content could be more detailed")
+    else:
+        validation_score += 30
+        strengths.append("Content has sufficient detail")
+
+    # Check for buying intent keywords (30 points)
+    max_score += 30
+    found_keywords = validation_intent_matcher.matched_keywords(content)
+    if found_keywords:
+        validation_score += 30
+        strengths.append(f"Buying intent detected: {', '.join(found_keywords[:3])}")
+    else:
+        issues.append("No clear buying intent keywords detected")
+
+    # Check for contact/company information (20 points)
+    max_score += 20
+    has_contact = any([
+        lead_data.get("url"),
+        lead_data.get("email"),
+        lead_data.get("company"),
+        lead_data.get("author"),
+        lead_data.get("name")
+    ])
+    if has_contact:
+        validation_score += 20
+        strengths.append("Has contact/company information")
+    else:
+        issues.append("Missing contact or company information")
+
+    # Calculate quality score (0-100)
+    quality_score = (validation_score / max_score) * 100 if max_score > 0 else 0
+
+    return {
+        "quality_score": round(quality_score, 2),
+        "is_valid": quality_score >= 60,
+        "issues": issues,
+        "strengths": strengths,
+        "found_keywords": found_keywords,
+        "validation_details": {
+            "required_fields": validation_score >= 20,
+            "content_quality": len(content) >= 100,
+            "buying_intent": len(found_keywords) > 0,
+            "has_contact": has_contact
+        }
+    }
+
+
+def parse_posted_at(posted_at: Any, now: datetime = None) -> Optional[datetime]:
+    """UTC datetime of an ISO date, epoch timestamp or "3 days ago" string (None if unparseable)"""
+    if posted_at in (None, ""):
+        return None
+    try:
+        if isinstance(posted_at, (int, float)):
+            return datetime.fromtimestamp(posted_at, tz=timezone.utc)
+        match = _RELATIVE_AGE_RE.search(str(posted_at))
+        if match:
+            now = now or datetime.now(timezone.utc)
+            return now - timedelta(days=int(match.group(1)) * _UNIT_DAYS[match.group(2).lower()])
+        posted = datetime.fromisoformat(str(posted_at).strip().replace("Z", "+00:00"))
+        if posted.tzinfo is None:
+            posted = posted.replace(tzinfo=timezone.utc)
+        return posted.astimezone(timezone.utc)
+    except (ValueError, OverflowError, OSError):
+        return None
+
+
+def _age_days(posted_at: Any, now: datetime) -> Optional[float]:
+    """Age in days of an ISO date, epoch timestamp or "3 days ago" string"""
+    posted = parse_posted_at(posted_at, now)
+    if posted is None:
+        return None
+    return max(0.0, (now - posted).total_seconds() / 86400)
+
+
+def prefilter_score(lead: Dict[str, Any], now: datetime = None) -> float:
+    """
+    Rank a scraped lead without any LLM call (0-100)
+
+    Combines the validation heuristics with engagement (upvotes, comments) and
+    recency (posted_at). Missing engagement or recency counts as neutral (0.5).
+    """
+    now = now or datetime.now(timezone.utc)
+    quality = validate_lead(lead)["quality_score"] / 100
+
+    upvotes, comments = lead.get("upvotes"), lead.get("comments")
+    if upvotes is None and comments is None:
+        engagement = 0.5
+    else:
+        activity = max(0, (upvotes or 0)) + 2 * max(0, (comments or 0))
+        engagement = min(1.0, math.log1p(activity) / math.log1p(ENGAGEMENT_SATURATION))
+
+    age = _age_days(lead.get("posted_at"), now)
+    recency = 0.5 if age is None else max(0.0, 1 - age / RECENCY_WINDOW_DAYS)
+
+    score = QUALITY_WEIGHT * quality + ENGAGEMENT_WEIGHT * engagement + RECENCY_WEIGHT * recency
+    return round(score * 100, 2)
+
+
+def rank_leads(leads: List[Dict[str, Any]],
+               min_score: float = None,
+               top_k: int = None) -> List[Dict[str, Any]]:
+    """
+    Score, filter and sort leads best first
+
+    Each returned lead gets a "prefilter_score" field.
+
+    Args:
+        leads: Scraped leads
+        min_score: Drop leads scoring below this (defaults to PREFILTER_MIN_SCORE or 50)
+        top_k: Keep at most this many leads (all if None)
+    """
+    min_score = float(os.getenv("PREFILTER_MIN_SCORE", "50")) if min_score is None else min_score
+    now = datetime.now(timezone.utc)
+
+    for lead in leads:
+        lead["prefilter_score"] = prefilter_score(lead, now)
+    ranked = sorted(
+        (lead for lead in leads if lead["prefilter_score"] >= min_score),
+        key=lambda lead: lead["prefilter_score"],
+        reverse=True
+    )
+    return ranked[:top_k] if top_k is not None else ranked
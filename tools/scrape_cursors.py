@@ -0,0 +1,182 @@
+"""
+Scrape Cursor Store
+Per-query high-water marks so repeated scrapes only pay for content newer than the last run
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from tools.lead_scoring import parse_posted_at
+
+# Seen IDs kept per cursor (oldest dropped first)
+MAX_SEEN_IDS = 2000
+
+DEFAULT_DB_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "scrape_cursors.db"
+)
+
+
+@dataclass
+class ScrapeCursor:
+    """
+    High-water mark of one (source, scope, query) search
+
+    Items posted before high_water - grace are old news. Items inside the grace
+    window (sources often report dates only to the day, or as "2 hours ago") and
+    items without a usable date are decided by ID instead.
+    """
+    source: str
+    scope: str
+    query: str
+    high_water: Optional[datetime] = None
+    seen_ids: Dict[str, Optional[str]] = field(default_factory=dict)
+    grace: timedelta = timedelta(hours=24)
+    newest: Optional[datetime] = None
+    new_items: int = 0
+    skipped_items: int = 0
+    # Set by the reader once a run has read every item newer than the mark
+    complete: bool = False
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def is_older(self, posted_at: Any) -> bool:
+        """True if the item predates the grace window (newest-first results can stop here)"""
+        posted = parse_posted_at(posted_at)
+        return self.high_water is not None and posted is not None and posted < self.high_water - self.grace
+
+    def is_new(self, item_id: Optional[str], posted_at: Any) -> bool:
+        """True if the item was not already returned by an earlier run"""
+        if self.is_older(posted_at):
+            return False
+        return not item_id or item_id not in self.seen_ids
+
+    def check(self, item_id: Optional[str], posted_at: Any) -> bool:
+        """is_new() that counts new/skipped items without recording the item"""
+        with self._lock:
+            if not self.is_new(item_id, posted_at):
+                self.skipped_items += 1
+                return False
+            self.new_items += 1
+            return True
+
+    def filter(self, item_id: Optional[str], posted_at: Any) -> bool:
+        """check() that also records a new item as seen"""
+        if not self.check(item_id, posted_at):
+            return False
+        self.observe(item_id, posted_at)
+        return True
+
+    def observe(self, item_id: Optional[str], posted_at: Any) -> None:
+        """Record an item as delivered in this run"""
+        posted = parse_posted_at(posted_at)
+        with self._lock:
+            if item_id:
+                self.seen_ids.pop(item_id, None)
+                self.seen_ids[item_id] = posted.isoformat() if posted else None
+            if posted is not None and (self.newest is None or posted > self.newest):
+                self.newest = posted
+
+
+class ScrapeCursorStore:
+    """SQLite store of scrape cursors keyed by (source, scope, query)"""
+
+    def __init__(self, db_path: str = None, grace_hours: float = None):
+        """
+        Initialize the store
+
+        Args:
+            db_path: SQLite file (defaults to SCRAPE_CURSOR_DB or data/scrape_cursors.db);
+                use ":memory:" for a throwaway store
+            grace_hours: Window below the high-water mark checked by ID instead of
+                dropped by date (defaults to SCRAPE_CURSOR_GRACE_HOURS or 24)
+        """
+        self.db_path = db_path or os.getenv("SCRAPE_CURSOR_DB", DEFAULT_DB_PATH)
+        self.grace = timedelta(hours=grace_hours if grace_hours is not None
+                               else float(os.getenv("SCRAPE_CURSOR_GRACE_HOURS", "24")))
+        if self.db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS scrape_cursors (
+                source TEXT NOT NULL,
+                scope TEXT NOT NULL,
+                query TEXT NOT NULL,
+                high_water TEXT,
+                seen_ids TEXT NOT NULL,
+                updated_at TEXT,
+                PRIMARY KEY (source, scope, query)
+            );
+        """)
+        self._conn.commit()
+
+    def get(self, source: str, scope: str, query: str) -> ScrapeCursor:
+        """Cursor of a search (empty if it never ran)"""
+        scope = str(scope or "")
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT high_water, seen_ids FROM scrape_cursors WHERE source = ? AND scope = ? AND query = ?",
+                (source, scope, query)
+            ).fetchone()
+        cursor = ScrapeCursor(source=source, scope=scope, query=query, grace=self.grace)
+        if row:
+            cursor.high_water = datetime.fromisoformat(row[0]) if row[0] else None
+            cursor.seen_ids = json.loads(row[1])
+        return cursor
+
+    def save(self, cursor: ScrapeCursor, advance: bool = True) -> None:
+        """
+        Persist a cursor after a run
+
+        Args:
+            cursor: Cursor whose items were observed during the run
+            advance: Move the high-water mark to the newest item seen. Pass False when
+                the run stopped early - older unread items may still be above the new mark
+        """
+        high_water = cursor.high_water
+        if advance and cursor.newest is not None and (high_water is None or cursor.newest > high_water):
+            high_water = cursor.newest
+
+        # IDs below the grace window are already excluded by date
+        floor = high_water - cursor.grace if high_water else None
+        seen_ids = {
+            item_id: posted for item_id, posted in cursor.seen_ids.items()
+            if posted is None or floor is None or datetime.fromisoformat(posted) >= floor
+        }
+        if len(seen_ids) > MAX_SEEN_IDS:
+            seen_ids = dict(list(seen_ids.items())[-MAX_SEEN_IDS:])
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO scrape_cursors "
+                "(source, scope, query, high_water, seen_ids, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (cursor.source, cursor.scope, cursor.query,
+                 high_water.isoformat() if high_water else None,
+                 json.dumps(seen_ids), datetime.now(timezone.utc).isoformat())
+            )
+            self._conn.commit()
+        cursor.high_water = high_water
+        cursor.seen_ids = seen_ids
+
+    def reset(self, source: str = None) -> None:
+        """Forget cursors (of one source, or all) so the next run scrapes from scratch"""
+        with self._lock:
+            if source:
+                self._conn.execute("DELETE FROM scrape_cursors WHERE source = ?", (source,))
+            else:
+                self._conn.execute("DELETE FROM scrape_cursors")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM scrape_cursors").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()